@@ -17,9 +17,13 @@ from app.api.images import images_bp
 from app.api.account import account_bp
 from app.api.projects import projects_bp
 from app.api.favorites import favorites_bp
+from app.api.search import search_bp
 from app.config import config
 from app.extensions import cors, db, init_app, jwt, ma, migrate
 from app.services.image_service import ImageService
+from app.services import view_counter
+from app.utils import compression, slug_registry
+from app.utils.json_provider import FastJSONProvider
 import os
 import json
 import logging
@@ -37,6 +41,9 @@ def create_app():
 
     app = Flask(__name__)
 
+    # JSON rápido (orjson si está instalado) para jsonify y request.get_json()
+    app.json = FastJSONProvider(app)
+
     # DEBUG: Verificar variables de entorno
     print(f"[DEBUG] Variables de entorno disponibles: {list(os.environ.keys())}")
     print(f"[DEBUG] FLASK_ENV en os.environ: {os.environ.get('FLASK_ENV', 'NO ENCONTRADO')}")
@@ -63,6 +70,12 @@ def create_app():
     # Inicializar Cloudinary para imágenes
     ImageService.init_cloudinary(app)
 
+    # Contador de visitas de proyectos (escritura diferida por lotes)
+    view_counter.init_app(app)
+
+    # Compresión gzip/brotli de respuestas JSON
+    compression.init_app(app)
+
     # Registrar blueprints
     app.register_blueprint(auth_bp, url_prefix="/api/auth")
     app.register_blueprint(users_bp, url_prefix="/api/users")
@@ -72,6 +85,7 @@ def create_app():
     app.register_blueprint(account_bp, url_prefix="/api/account")
     app.register_blueprint(projects_bp, url_prefix="/api/projects")
     app.register_blueprint(favorites_bp)
+    app.register_blueprint(search_bp, url_prefix="/api/search")
 
     # ------------------------------------------------------------
     # INYECCIÓN AUTOMÁTICA DE DATOS EN PRODUCCIÓN (segura e idempotente)
@@ -120,6 +134,7 @@ def create_app():
                         importar_articulos_desde_json(articles_data)
                         articulos_cargados = len(articles_data)
                         app.logger.info("Artículos importados automáticamente.")
+                        app.logger.info("Ejecuta 'flask data build-similarities' para calcular los artículos similares.")
                     else:
                         app.logger.warning("Archivo de artículos no encontrado.")
                 else:
@@ -153,6 +168,9 @@ def create_app():
             app.logger.info(f"📊 Artículos cargados: {articulos_cargados}")
             app.logger.info(f"📊 Proyectos cargados: {proyectos_cargados}")
 
+            # Registro de slugs para responder 404 sin consultar la BD
+            slug_registry.warm_up()
+
         except Exception as e:
             app.logger.warning(f"Error en la inicialización automática: {e}")
 
@@ -4,28 +4,131 @@ Rutas API para gestión de artículos del blog.
 Este módulo define los endpoints para crear, leer, actualizar y eliminar artículos.
 Las rutas gestionan las peticiones HTTP mientras delegan la lógica de negocio
 al servicio de artículos.
+
+Las lecturas públicas devuelven ETag (el detalle también Last-Modified) y
+responden 304 a peticiones condicionales sin volver a serializar.
+El listado admite paginación numerada (?page=) o por cursor (?cursor=) para scroll infinito,
+y devuelve por defecto la vista resumida (sin content); ?fields= pide otros campos.
+/feed.xml publica los últimos artículos en RSS.
 """
 
-from flask import Blueprint, jsonify, request
-from app.schemas.article_schema import article_schema, articles_schema
-from app.services.article_service import ArticleService
+from flask import Blueprint, current_app, jsonify, request, stream_with_context
+from sqlalchemy.exc import IntegrityError
+from app.extensions import db
+from app.models.article import Article
+from app.schemas.article_schema import (
+    ArticleSchema,
+    article_schema,
+    article_summaries_schema,
+)
+from app.services.article_service import BY_SLUGS_VIEWS, MAX_SLUGS_PER_REQUEST, ArticleService
+from app.services.feed_service import FeedService
+from app.utils.pagination import InvalidCursorError
+from app.utils.slug_allocation import is_slug_conflict
+from app.utils.http_cache import (
+    entity_validators,
+    entity_version,
+    is_not_modified,
+    listing_validators,
+    make_etag,
+    not_modified,
+    with_validators,
+)
 
 articles_bp = Blueprint("articles", __name__)
 
+SLUG_CONFLICT_MESSAGE = "No se pudo asignar un slug único al artículo. Inténtalo de nuevo"
+
+def _parse_fields():
+    """
+    Lee ?fields= del listado: "all" (artículo completo) o campos separados por comas.
+
+    Returns:
+        tuple: (fields o None para la vista resumida, schema de salida, error o None)
+    """
+    raw = request.args.get('fields')
+    if not raw:
+        return None, article_summaries_schema, None
+
+    if raw == 'all':
+        fields = tuple(ArticleSchema().fields)
+    else:
+        fields = tuple(dict.fromkeys(name.strip() for name in raw.split(',') if name.strip()))
+        unknown = [name for name in fields if name not in ArticleSchema().fields]
+        if unknown or not fields:
+            return None, None, f"Campos no válidos: {', '.join(unknown) or raw}"
+
+    return fields, ArticleSchema(only=fields, many=True), None
+
+
 @articles_bp.route("/", methods=["GET"])
 def get_articles():
-    """Obtiene artículos paginados."""
+    """
+    Obtiene artículos paginados.
+
+    ?page=&limit= devuelve páginas numeradas (comportamiento por defecto).
+    ?cursor= (vacío para la primera página) devuelve una página por cursor:
+    { "articles": [...], "next_cursor": "..." | null, "limit": n, "total": n }
+
+    ?exact=false permite un total estimado (más barato en tablas grandes).
+    ?fields=all (o ?fields=title,content,...) sustituye la vista resumida, que no incluye content.
+    """
     page = request.args.get('page', 1, type=int)
     limit = request.args.get('limit', 10, type=int)
+    cursor = request.args.get('cursor')
+    exact_total = request.args.get('exact', 'true').lower() != 'false'
+
+    fields, schema, error = _parse_fields()
+    if error:
+        return jsonify({"message": error}), 400
+
+    # Validadores del listado calculados sin cargar filas
+    etag = listing_validators("articles", *ArticleService.get_listing_version())
+    if is_not_modified(etag):
+        return not_modified(etag)
+
+    if cursor is not None:
+        try:
+            page_data = ArticleService.get_articles_page(
+                limit, cursor, exact_total=exact_total, fields=fields
+            )
+        except InvalidCursorError:
+            return jsonify({"message": "Cursor inválido"}), 400
+
+        response = jsonify({
+            'articles': schema.dump(page_data['articles']),
+            'next_cursor': page_data['next_cursor'],
+            'limit': page_data['limit'],
+            'total': page_data['total']
+        })
+        return with_validators(response, etag), 200
+
+    articles_data = ArticleService.get_all_articles(
+        page, limit, exact_total=exact_total, fields=fields
+    )
     
-    articles_data = ArticleService.get_all_articles(page, limit)
-    
-    return jsonify({
-        'articles': articles_schema.dump(articles_data['articles']),
+    response = jsonify({
+        'articles': schema.dump(articles_data['articles']),
         'total': articles_data['total'],
         'current_page': articles_data['current_page'],
         'total_pages': articles_data['total_pages']
-    }), 200
+    })
+    return with_validators(response, etag), 200
+
+@articles_bp.route("/feed.xml", methods=["GET"])
+def get_articles_feed():
+    """Feed RSS 2.0 de los últimos artículos (en caché hasta que cambie max(updated_at))."""
+    version = FeedService.get_feed_version()
+    # Solo ETag: un borrado cambia el recuento pero no max(updated_at)
+    etag = make_etag("articles_feed", *version)
+    if is_not_modified(etag):
+        return not_modified(etag)
+
+    response = current_app.response_class(
+        stream_with_context(FeedService.stream_feed(version)), mimetype="application/rss+xml"
+    )
+    return with_validators(response, etag)
+
 
 @articles_bp.route("/<int:article_id>", methods=["GET"])
 def get_article(article_id):
@@ -35,9 +138,32 @@ def get_article(article_id):
 
 @articles_bp.route("/slug/<string:slug>", methods=["GET"])
 def get_article_by_slug(slug):
-    """Obtiene un artículo por su slug."""
+    """
+    Obtiene un artículo por su slug.
+
+    ?include=related añade "related_articles": resúmenes de Article.related o, si
+    está vacío, de los artículos más parecidos por contenido.
+    """
     article = ArticleService.get_article_by_slug(slug)
-    return jsonify(article_schema.dump(article)), 200
+    include = {part.strip() for part in request.args.get('include', '').split(',') if part.strip()}
+
+    if include - {'related'}:
+        return jsonify({"message": "Valor de include no válido. Usa 'related'"}), 400
+
+    related = ArticleService.get_related_articles(article) if 'related' in include else None
+    related_versions = [(item.id, entity_version(item)) for item in related or ()]
+
+    etag, last_modified = entity_validators(article, sorted(include), related_versions)
+    if related is not None:
+        # La respuesta depende de otros artículos: solo se valida por ETag
+        last_modified = None
+    if is_not_modified(etag, last_modified):
+        return not_modified(etag, last_modified)
+
+    data = article_schema.dump(article)
+    if related is not None:
+        data['related_articles'] = article_summaries_schema.dump(related)
+    return with_validators(jsonify(data), etag, last_modified), 200
 
 @articles_bp.route("/", methods=["POST"])
 def create_article():
@@ -55,6 +181,11 @@ def create_article():
         new_article = ArticleService.create_article(article_data)
         
         return jsonify(article_schema.dump(new_article)), 201
+    except IntegrityError as e:
+        db.session.rollback()
+        if not is_slug_conflict(e, Article.slug):
+            raise
+        return jsonify({"message": SLUG_CONFLICT_MESSAGE}), 409
     except Exception as e:
         return jsonify({"message": str(e)}), 400
 
@@ -74,6 +205,11 @@ def update_article(article_id):
         updated_article = ArticleService.update_article(article_id, article_data)
         
         return jsonify(article_schema.dump(updated_article)), 200
+    except IntegrityError as e:
+        db.session.rollback()
+        if not is_slug_conflict(e, Article.slug):
+            raise
+        return jsonify({"message": SLUG_CONFLICT_MESSAGE}), 409
     except Exception as e:
         return jsonify({"message": str(e)}), 400
 
@@ -111,6 +247,11 @@ def update_article_by_slug(slug):
         updated_article = ArticleService.update_article_by_slug(slug, article_data)
 
         return jsonify(article_schema.dump(updated_article)), 200
+    except IntegrityError as e:
+        db.session.rollback()
+        if not is_slug_conflict(e, Article.slug):
+            raise
+        return jsonify({"message": SLUG_CONFLICT_MESSAGE}), 409
     except Exception as e:
         return jsonify({"message": str(e)}), 400
 
@@ -124,16 +265,22 @@ def get_articles_by_slugs():
         "slugs": ["slug1", "slug2", "slug3"]
     }
     
-    Devuelve una lista de artículos correspondientes.
+    Devuelve los artículos correspondientes en el orden recibido, sin duplicados
+    (como máximo MAX_SLUGS_PER_REQUEST). ?view=summary devuelve solo los campos de tarjeta.
     """
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     slugs = data.get("slugs", [])
+    view = request.args.get("view", "full")
 
-    if not isinstance(slugs, list):
+    if not isinstance(slugs, list) or not all(isinstance(slug, str) for slug in slugs):
         return jsonify({"message": "El campo 'slugs' debe ser una lista"}), 400
+    if len(set(slugs)) > MAX_SLUGS_PER_REQUEST:
+        return jsonify({"message": f"Máximo {MAX_SLUGS_PER_REQUEST} slugs por petición"}), 400
+    if view not in BY_SLUGS_VIEWS:
+        return jsonify({"message": "Vista no válida. Usa 'full' o 'summary'"}), 400
 
     try:
-        articles = ArticleService.get_articles_by_slugs(slugs)
-        return jsonify(articles_schema.dump(articles)), 200
+        body = ArticleService.get_articles_by_slugs_body(slugs, view)
+        return current_app.response_class(body, mimetype="application/json"), 200
     except Exception as e:
         return jsonify({"message": str(e)}), 400
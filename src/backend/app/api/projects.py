@@ -11,6 +11,34 @@ necesidad de alterar el modelo o el schema.
 Notas de mantenimiento:
 - Incluye validaciones básicas con Marshmallow.
 - Admite expansión futura con autenticación admin y filtrado avanzado.
+- El listado admite paginación por cursor (?limit=&cursor=) vía ProjectService.
+- El listado usa por defecto la vista ligera (?view=summary); ?view=full devuelve
+  el modelo completo con content_sections y gallery.
+- Filtros del listado: ?category=, ?status= (lista separada por comas o repetida),
+  ?featured=true|false, ?currency=EUR, ?section_type=location, rangos
+  ?min_investment_min|max=, ?total_investment_min|max= (euros),
+  ?expected_return_min|max= (%) y ?sort=priority|created_at|views.
+- Las lecturas públicas devuelven ETag y responden 304 a peticiones condicionales
+  sin serializar. El detalle añade Last-Modified (If-Modified-Since); el listado
+  se valida solo por ETag, porque un borrado no cambia max(updated_at).
+- FREEMIUM: el detalle comprueba el JWT opcional; los anónimos reciben solo las
+  primeras free_sections_count secciones y el número de secciones bloqueadas.
+  El editor del panel carga GET /<slug>/full (sesión de administrador). Un PUT
+  que reenvía locked_sections > 0 trae solo las secciones gratuitas: las
+  bloqueadas se conservan en lugar de borrarse.
+- GET /facets devuelve los contadores por category/status/featured (cacheados);
+  cualquier escritura con éxito en projects_bp invalida esa caché.
+- POST /bulk crea o actualiza por slug una lista de proyectos en una transacción
+  y devuelve un resultado por elemento (207 si alguno falla).
+- GET /<slug>/sections?offset=&limit=&types= devuelve un tramo de secciones
+  (carga progresiva de la página), con la misma restricción FREEMIUM que el detalle.
+- PATCH /<slug> acepta JSON Patch (application/json-patch+json) y
+  PUT /<slug>/sections/<index> reemplaza una sola sección; los cambios dentro de
+  content_sections/gallery se aplican en el servidor (jsonb_set).
+- El detalle se sirve desde una caché de JSON ya codificado (bytes); update y
+  delete descartan las entradas del proyecto.
+- Cada visita al detalle se cuenta mediante el buffer de view_counter (sin
+  escribir en la base de datos durante la petición).
 - Compatible con el frontend Next.js mediante projectService.ts.
 - Devuelve errores HTTP claros y consistentes (400, 404, 500).
 
@@ -18,33 +46,265 @@ Notas de mantenimiento:
 @since v2.0.0
 """
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, jsonify, request
+from flask_jwt_extended import get_jwt, get_jwt_identity, verify_jwt_in_request
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
 from app.extensions import db
 from app.models.project import Project
-from app.schemas.project_schema import ProjectSchema, ProjectInputSchema
+from app.schemas.project_schema import ProjectSchema, ProjectInputSchema, ProjectSummarySchema
+from app.services.view_counter import record_view
+from app.services.project_service import (
+    DEFAULT_SECTIONS_LIMIT,
+    DEFAULT_SORT,
+    FREE_VARIANT,
+    MAX_BULK_ITEMS,
+    RANGE_COLUMNS,
+    FULL_VARIANT,
+    SORTS,
+    VIEWS,
+    ProjectService,
+)
+from app.utils.http_cache import (
+    is_not_modified,
+    listing_validators,
+    make_etag,
+    not_modified,
+    with_validators,
+)
+from app.utils.investment import to_cents
+from app.utils.json_patch import JsonPatchConflict, JsonPatchError
+from marshmallow import ValidationError
+from app.utils.pagination import InvalidCursorError
 
 projects_bp = Blueprint("projects_bp", __name__, url_prefix="/api/projects")
 
 # Schemas
 project_schema = ProjectSchema()
 projects_schema = ProjectSchema(many=True)
+projects_summary_schema = ProjectSummarySchema(many=True)
 input_schema = ProjectInputSchema()
 
+PROJECT_STATUSES = ("open", "active", "funded", "closed")
+BOOLEAN_VALUES = {"true": True, "1": True, "false": False, "0": False}
+
+
+def _get_list_arg(name):
+    """Lee un parámetro multivalor (?x=a,b o ?x=a&x=b) como lista sin vacíos."""
+    values = []
+    for raw in request.args.getlist(name):
+        values.extend(v.strip() for v in raw.split(",") if v.strip())
+    return values
+
+
+def _parse_listing_filters():
+    """
+    Valida los filtros del listado.
+
+    Returns:
+        tuple: (filters, error). error es un mensaje si algún valor no es válido.
+    """
+    statuses = _get_list_arg("status")
+    invalid = [s for s in statuses if s not in PROJECT_STATUSES]
+    if invalid:
+        return None, f"Estado no válido: {', '.join(invalid)}"
+
+    featured = request.args.get("featured")
+    if featured is not None:
+        featured = BOOLEAN_VALUES.get(featured.lower())
+        if featured is None:
+            return None, "El parámetro 'featured' debe ser true o false"
+
+    # Rangos: importes en euros y rentabilidad en %; ambos se comparan x100
+    # (céntimos / puntos básicos) contra las columnas tipadas.
+    ranges = {}
+    for name in RANGE_COLUMNS:
+        bounds = []
+        for suffix in ("min", "max"):
+            raw = request.args.get(f"{name}_{suffix}")
+            value = to_cents(raw) if raw else None
+            if raw and value is None:
+                return None, f"El parámetro '{name}_{suffix}' debe ser numérico"
+            bounds.append(value)
+        if bounds != [None, None]:
+            ranges[name] = tuple(bounds)
+
+    return {
+        "category": _get_list_arg("category"),
+        "status": statuses,
+        "featured": featured,
+        "currency": [c.upper() for c in _get_list_arg("currency")],
+        "section_type": _get_list_arg("section_type"),
+        "ranges": ranges,
+    }, None
+
+
+def _has_valid_session():
+    """Indica si la petición trae un JWT válido (cookie). Un token caducado o
+    inválido se trata como visitante anónimo en las lecturas públicas."""
+    try:
+        verify_jwt_in_request(optional=True, locations=["cookies"])
+    except (JWTExtendedException, PyJWTError):
+        return False
+    return get_jwt_identity() is not None
+
+
+@projects_bp.after_request
+def _invalidate_catalogue_caches(response):
+    """Las escrituras con éxito cambian los contadores del catálogo."""
+    if request.method in ("POST", "PUT", "PATCH", "DELETE") and response.status_code < 400:
+        ProjectService.invalidate_facets()
+    return response
+
 
 @projects_bp.route("/", methods=["GET"])
 def get_projects():
-    """Devuelve la lista completa de proyectos."""
-    projects = Project.query.all()
-    return jsonify(projects_schema.dump(projects)), 200
+    """
+    Devuelve la lista de proyectos.
+
+    Sin parámetros de paginación devuelve la lista completa (compatibilidad con el frontend).
+    Con ?limit= y/o ?cursor= devuelve una página:
+    { "projects": [...], "next_cursor": "..." | null, "limit": n }
+
+    ?view=summary (por defecto) devuelve solo los campos de tarjeta;
+    ?view=full devuelve el proyecto completo.
+
+    Filtros: ?category=, ?status=open,active, ?featured=true, ?currency=EUR,
+    ?section_type=location, ?min_investment_max=500, ?expected_return_min=10
+    Orden: ?sort=priority (por defecto) | created_at | views
+    """
+    limit = request.args.get("limit", type=int)
+    cursor = request.args.get("cursor")
+    view = request.args.get("view", "summary")
+    sort = request.args.get("sort", DEFAULT_SORT)
+
+    if view not in VIEWS:
+        return jsonify({"error": "Vista no válida. Usa 'summary' o 'full'"}), 400
+    if sort not in SORTS:
+        return jsonify({"error": f"Orden no válido. Usa {', '.join(SORTS)}"}), 400
+
+    filters, error = _parse_listing_filters()
+    if error:
+        return jsonify({"error": error}), 400
+
+    schema = projects_schema if view == "full" else projects_summary_schema
+
+    # Validador del listado calculado sin cargar filas
+    # Las visitas no cambian updated_at: si ordenan o se muestran, cuentan en el ETag
+    include_views = sort == "views" or view == "full"
+    version = ProjectService.get_listing_version(include_views=include_views)
+    etag = listing_validators("projects", *version)
+    if is_not_modified(etag):
+        return not_modified(etag)
+
+    if limit is None and not cursor:
+        projects = ProjectService.get_all_projects(view=view, filters=filters, sort=sort)
+        return with_validators(jsonify(schema.dump(projects)), etag), 200
+
+    try:
+        page = ProjectService.get_projects_page(
+            limit=limit, cursor=cursor, view=view, filters=filters, sort=sort
+        )
+    except InvalidCursorError:
+        return jsonify({"error": "Cursor inválido"}), 400
+
+    response = jsonify({
+        "projects": schema.dump(page["projects"]),
+        "next_cursor": page["next_cursor"],
+        "limit": page["limit"],
+    })
+    return with_validators(response, etag), 200
+
+
+@projects_bp.route("/facets", methods=["GET"])
+def get_project_facets():
+    """
+    Devuelve el número de proyectos por categoría, estado y destacado:
+    { "category": [{"value": "inmobiliario", "count": 3}, ...],
+      "status": [...], "featured": [...], "total": n }
+    """
+    return jsonify(ProjectService.get_facets()), 200
 
 
 @projects_bp.route("/<slug>", methods=["GET"])
 def get_project(slug):
-    """Devuelve el detalle de un proyecto por su slug."""
-    project = Project.query.filter_by(slug=slug).first()
-    if not project:
+    """
+    Devuelve el detalle de un proyecto por su slug.
+
+    Usuarios autenticados: todas las secciones (locked_sections = 0).
+    Anónimos: las primeras free_sections_count secciones y locked_sections
+    con el número de secciones restantes.
+    """
+    ref = ProjectService.get_project_ref(slug)
+    if not ref:
         return jsonify({"error": "Proyecto no encontrado"}), 404
-    return jsonify(project_schema.dump(project)), 200
+
+    record_view(ref.id)
+
+    variant = FULL_VARIANT if _has_valid_session() else FREE_VARIANT
+    etag = make_etag("Project", ref.id, ref.version, variant)
+    if is_not_modified(etag, ref.version):
+        response = not_modified(etag, ref.version)
+    else:
+        body = ProjectService.get_detail_body(slug, ref, variant)
+        response = current_app.response_class(body, mimetype="application/json")
+        response = with_validators(response, etag, ref.version)
+
+    # La respuesta depende de la cookie de sesión
+    response.vary.add("Cookie")
+    return response
+
+
+@projects_bp.route("/<slug>/full", methods=["GET"])
+def get_project_full(slug):
+    """Detalle completo (todas las secciones) para el editor del panel de administración."""
+    if not _has_valid_session():
+        return jsonify({"error": "Se requiere autenticación"}), 401
+    if get_jwt().get("role") != "admin":
+        return jsonify({"error": "Se requieren permisos de administrador"}), 403
+
+    ref = ProjectService.get_project_ref(slug)
+    if not ref:
+        return jsonify({"error": "Proyecto no encontrado"}), 404
+
+    body = ProjectService.get_detail_body(slug, ref, FULL_VARIANT)
+    response = current_app.response_class(body, mimetype="application/json")
+    response.headers["Cache-Control"] = "private, no-store"
+    return response
+
+
+@projects_bp.route("/<slug>/sections", methods=["GET"])
+def get_project_sections(slug):
+    """
+    Devuelve un tramo de content_sections para cargar la página progresivamente.
+
+    Query params:
+        offset: Secciones a saltar (por defecto 0).
+        limit: Secciones a devolver (por defecto 5, máximo 50).
+        types: Tipos de sección (lista separada por comas), p. ej. hero,location.
+    """
+    offset = request.args.get("offset", type=int, default=0)
+    limit = request.args.get("limit", type=int, default=DEFAULT_SECTIONS_LIMIT)
+    if offset < 0 or limit < 1:
+        return jsonify({"error": "offset y limit deben ser enteros positivos"}), 400
+
+    ref = ProjectService.get_project_ref(slug)
+    if not ref:
+        return jsonify({"error": "Proyecto no encontrado"}), 404
+
+    variant = FULL_VARIANT if _has_valid_session() else FREE_VARIANT
+    args = sorted(request.args.items(multi=True))
+    etag = make_etag("ProjectSections", ref.id, ref.version, variant, args)
+    if is_not_modified(etag, ref.version):
+        response = not_modified(etag, ref.version)
+    else:
+        page = ProjectService.get_sections(
+            ref, variant, offset=offset, limit=limit, types=_get_list_arg("types")
+        )
+        response = with_validators(jsonify(page), etag, ref.version)
+
+    response.vary.add("Cookie")
+    return response
 
 
 @projects_bp.route("/", methods=["POST"])
@@ -68,6 +328,26 @@ def create_project():
     return jsonify(project_schema.dump(project)), 201
 
 
+@projects_bp.route("/bulk", methods=["POST"])
+def bulk_upsert_projects():
+    """
+    Crea o actualiza proyectos en bloque (por slug).
+
+    Body: lista de proyectos con el formato de ProjectInputSchema.
+    Respuesta: { "results": [{"index", "slug", "status", "id" | "errors"}, ...] }
+    con 200 si todos se aplican o 207 si alguno no es válido.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, list) or not data:
+        return jsonify({"error": "Se esperaba una lista de proyectos"}), 400
+    if len(data) > MAX_BULK_ITEMS:
+        return jsonify({"error": f"Máximo {MAX_BULK_ITEMS} proyectos por petición"}), 400
+
+    results = ProjectService.bulk_upsert(data)
+    status = 207 if any(r["status"] == "error" for r in results) else 200
+    return jsonify({"results": results}), status
+
+
 @projects_bp.route("/<slug>", methods=["PUT"])
 def update_project(slug):
     """Actualiza un proyecto existente."""
@@ -79,17 +359,76 @@ def update_project(slug):
     if not data:
         return jsonify({"error": "Datos no proporcionados"}), 400
 
+    # locked_sections viene del detalle FREEMIUM: content_sections es parcial
+    locked = data.pop("locked_sections", 0)
+    if not isinstance(locked, int) or locked < 0:
+        return jsonify({"error": "locked_sections debe ser un entero no negativo"}), 400
+
     errors = input_schema.validate(data, partial=True)
     if errors:
         return jsonify(errors), 400
 
+    if locked and "content_sections" in data:
+        stored = project.content_sections or []
+        if locked > len(stored):
+            return jsonify({"error": "Las secciones bloqueadas no coinciden con el proyecto"}), 409
+        # Las secciones bloqueadas que el cliente no vio se mantienen al final
+        data["content_sections"] = list(data["content_sections"] or []) + stored[len(stored) - locked:]
+
     for key, value in data.items():
         setattr(project, key, value)
 
     db.session.commit()
+    ProjectService.invalidate_project(project.id)
     return jsonify(project_schema.dump(project)), 200
 
 
+def _apply_patch(slug, operations, conflict_status=409):
+    """Aplica un parche al proyecto y devuelve la respuesta HTTP correspondiente."""
+    ref = ProjectService.get_project_ref(slug)
+    if not ref:
+        return jsonify({"error": "Proyecto no encontrado"}), 404
+
+    try:
+        ProjectService.patch_project(ref.id, operations)
+    except JsonPatchConflict as e:
+        return jsonify({"error": str(e)}), conflict_status
+    except JsonPatchError as e:
+        return jsonify({"error": str(e)}), 400
+    except ValidationError as e:
+        return jsonify(e.messages), 400
+
+    return jsonify(project_schema.dump(ProjectService.get_project_by_slug(slug))), 200
+
+
+@projects_bp.route("/<slug>", methods=["PATCH"])
+def patch_project(slug):
+    """
+    Modifica un proyecto con JSON Patch (RFC 6902).
+    Content-Type: application/json-patch+json
+    Body: [{"op": "replace", "path": "/content_sections/3/content", "value": "..."}]
+    """
+    if request.mimetype != "application/json-patch+json":
+        return jsonify({"error": "Content-Type debe ser application/json-patch+json"}), 415
+
+    operations = request.get_json(silent=True)
+    if not isinstance(operations, list) or not operations:
+        return jsonify({"error": "El parche debe ser una lista de operaciones"}), 400
+
+    return _apply_patch(slug, operations)
+
+
+@projects_bp.route("/<slug>/sections/<int:index>", methods=["PUT"])
+def update_project_section(slug, index):
+    """Reemplaza la sección `index` de content_sections."""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or not data:
+        return jsonify({"error": "La sección debe ser un objeto JSON"}), 400
+
+    operations = [{"op": "replace", "path": f"/content_sections/{index}", "value": data}]
+    return _apply_patch(slug, operations, conflict_status=404)
+
+
 @projects_bp.route("/<slug>", methods=["DELETE"])
 def delete_project(slug):
     """Elimina un proyecto por slug."""
@@ -97,6 +436,8 @@ def delete_project(slug):
     if not project:
         return jsonify({"error": "Proyecto no encontrado"}), 404
 
+    project_id = project.id
     db.session.delete(project)
     db.session.commit()
+    ProjectService.invalidate_project(project_id)
     return jsonify({"message": "Proyecto eliminado correctamente"}), 200
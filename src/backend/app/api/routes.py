@@ -2,7 +2,10 @@
 # Define endpoints para verificación de salud y metadatos de la aplicación
 # Sirve como punto de entrada para información general sobre la API
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app, jsonify, stream_with_context
+
+from app.services.feed_service import FeedService
+from app.utils.http_cache import is_not_modified, make_etag, not_modified, with_validators
 
 # Crear el blueprint para rutas generales
 routes = Blueprint("routes", __name__)
@@ -29,4 +32,19 @@ def api_info():
             "users": ["/api/users/list"],
             "general": ["/api/health", "/api/info"]
         }
-    }), 200
\ No newline at end of file
+    }), 200
+
+
+@routes.route("/sitemap.xml", methods=["GET"])
+def sitemap():
+    """Sitemap XML de proyectos y artículos (en caché hasta que cambie max(updated_at))."""
+    version = FeedService.get_sitemap_version()
+    # Solo ETag: un borrado cambia el recuento pero no max(updated_at)
+    etag = make_etag("sitemap", *version)
+    if is_not_modified(etag):
+        return not_modified(etag)
+
+    response = current_app.response_class(
+        stream_with_context(FeedService.stream_sitemap(version)), mimetype="application/xml"
+    )
+    return with_validators(response, etag)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+search.py — API de búsqueda de texto completo.
+
+Contexto:
+Permite buscar artículos por tema y proyectos por ciudad, tipo de activo, etc.
+sobre los índices de texto completo mantenidos en la base de datos
+(tsvector + GIN en PostgreSQL, FTS5 en SQLite).
+
+Notas de mantenimiento:
+- GET /api/search?q=...&type=project|article&limit=N
+- Endpoint público: solo devuelve datos de listado (título, slug, extracto).
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+from flask import Blueprint, jsonify, request
+from app.services.search_service import DEFAULT_LIMIT, KINDS, SearchService
+
+search_bp = Blueprint("search_bp", __name__, url_prefix="/api/search")
+
+MAX_QUERY_LENGTH = 200
+
+
+# strict_slashes=False: /api/search (la URL documentada) responde sin redirigir a /api/search/
+@search_bp.route("/", methods=["GET"], strict_slashes=False)
+def search():
+    """
+    Busca en proyectos y artículos.
+
+    Query params:
+        q: Texto a buscar (obligatorio).
+        type: project | article (opcional, por defecto ambos).
+        limit: Número máximo de resultados (por defecto 20, máximo 50).
+    """
+    q = request.args.get("q", "").strip()
+    if not q:
+        return jsonify({"error": "El parámetro q es obligatorio"}), 400
+    if len(q) > MAX_QUERY_LENGTH:
+        return jsonify({"error": f"La búsqueda no puede superar {MAX_QUERY_LENGTH} caracteres"}), 400
+
+    kind = request.args.get("type")
+    if kind and kind not in KINDS:
+        return jsonify({"error": f"type debe ser uno de: {', '.join(KINDS)}"}), 400
+
+    limit = request.args.get("limit", type=int, default=DEFAULT_LIMIT)
+    if limit < 1:
+        return jsonify({"error": "limit debe ser un entero positivo"}), 400
+
+    results = SearchService.search(q, kinds=(kind,) if kind else KINDS, limit=limit)
+    return jsonify({"query": q, "results": results}), 200
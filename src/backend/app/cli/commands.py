@@ -19,7 +19,16 @@ from flask.cli import with_appcontext
 import os
 import json
 import glob
+from sqlalchemy import func, update
+from app.extensions import db
+from app.models.article import Article
+from app.models.project import Project
 from app.scripts.import_service import importar_proyectos_desde_json, importar_articulos_desde_json
+from app.services.image_service import ImageService
+from app.services.recommendation_service import RecommendationService
+from app.utils.article_content import process_content
+from app.utils.investment import derive_investment_columns
+from app.utils.responsive_images import build_variants, enrich_gallery
 
 
 @click.group()
@@ -53,6 +62,9 @@ def import_articles():
         
         click.echo("-" * 60)
         click.echo("Importación de artículos completada")
+
+        total = RecommendationService.build_similarities()
+        click.echo(f"✓ Artículos similares recalculados para {total} artículo(s)")
         
     except Exception as e:
         click.echo(f"✗ Error: {e}")
@@ -114,6 +126,163 @@ def import_projects():
         click.echo("✗ No se encontraron datos válidos")
 
 
+@data.command('backfill-investment')
+@click.option('--batch-size', default=200, show_default=True, help='Proyectos por transacción')
+@with_appcontext
+def backfill_investment(batch_size):
+    """Recalcula las columnas numéricas de inversión desde investment_data."""
+
+    table = Project.__table__
+    last_id = 0
+    updated = 0
+
+    while True:
+        rows = db.session.execute(
+            db.select(table.c.id, table.c.investment_data)
+            .where(table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+
+        for project_id, investment_data in rows:
+            # updated_at se conserva: el contenido del proyecto no cambia
+            db.session.execute(
+                update(table)
+                .where(table.c.id == project_id)
+                .values(updated_at=table.c.updated_at, **derive_investment_columns(investment_data))
+            )
+        db.session.commit()
+
+        updated += len(rows)
+        last_id = rows[-1].id
+        click.echo(f"✓ {updated} proyecto(s) procesados")
+
+    click.echo("Backfill de columnas de inversión completado")
+
+
+@data.command('backfill-article-content')
+@click.option('--batch-size', default=50, show_default=True, help='Artículos por transacción')
+@with_appcontext
+def backfill_article_content(batch_size):
+    """Recalcula los campos derivados de content (texto plano, lectura, índice, HTML saneado)."""
+
+    table = Article.__table__
+    last_id = 0
+    updated = 0
+
+    while True:
+        rows = db.session.execute(
+            db.select(table.c.id, table.c.content)
+            .where(table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+
+        for article_id, content in rows:
+            # updated_at avanza: el JSON servido cambia y los ETag, el 304 y las
+            # cachés de detalle y de respuestas comprimidas dependen de él
+            db.session.execute(
+                update(table)
+                .where(table.c.id == article_id)
+                .values(updated_at=func.now(), **process_content(content))
+            )
+        db.session.commit()
+
+        updated += len(rows)
+        last_id = rows[-1].id
+        click.echo(f"✓ {updated} artículo(s) procesados")
+
+    click.echo("Backfill de campos derivados de artículos completado")
+
+
+def _image_dimensions(url, fetch):
+    """Dimensiones de Cloudinary (solo con --fetch-dimensions); None si no se obtienen."""
+    if not fetch or not url:
+        return None, None
+    try:
+        return ImageService.get_dimensions(url)
+    except Exception as e:
+        click.echo(f"✗ Sin dimensiones para {url}: {e}")
+        return None, None
+
+
+def _gallery_item_with_dimensions(item):
+    """Completa width/height de una imagen de galería que aún no los tiene."""
+    if not isinstance(item, dict) or item.get('width'):
+        return item
+    width, height = _image_dimensions(item.get('url') or item.get('src'), True)
+    return {**item, 'width': width, 'height': height}
+
+
+@data.command('backfill-image-variants')
+@click.option('--batch-size', default=100, show_default=True, help='Filas por transacción')
+@click.option('--fetch-dimensions', is_flag=True, help='Consulta a Cloudinary el ancho y alto de cada imagen')
+@with_appcontext
+def backfill_image_variants(batch_size, fetch_dimensions):
+    """Calcula las variantes responsive de las imágenes de artículos y galerías de proyectos."""
+
+    sources = (
+        (Article.__table__, 'image', 'artículo(s)'),
+        (Project.__table__, 'gallery', 'proyecto(s)'),
+    )
+    for table, column, label in sources:
+        last_id = 0
+        updated = 0
+
+        while True:
+            rows = db.session.execute(
+                db.select(table.c.id, table.c[column])
+                .where(table.c.id > last_id)
+                .order_by(table.c.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+
+            for row_id, value in rows:
+                if column == 'image':
+                    values = {'image_variants': build_variants(value, *_image_dimensions(value, fetch_dimensions))}
+                else:
+                    gallery = value
+                    if fetch_dimensions and isinstance(gallery, list):
+                        gallery = [_gallery_item_with_dimensions(item) for item in gallery]
+                    values = {'gallery': enrich_gallery(gallery)}
+                # updated_at avanza: las variantes forman parte del JSON servido
+                # (ETag, 304 y cachés de detalle y de respuestas comprimidas)
+                db.session.execute(
+                    update(table)
+                    .where(table.c.id == row_id)
+                    .values(updated_at=func.now(), **values)
+                )
+            db.session.commit()
+
+            updated += len(rows)
+            last_id = rows[-1].id
+            click.echo(f"✓ {updated} {label} procesados")
+
+    click.echo("Backfill de variantes de imagen completado")
+
+
+@data.command('build-similarities')
+@with_appcontext
+def build_similarities():
+    """Recalcula la tabla de artículos similares (TF-IDF) desde cero."""
+    total = RecommendationService.build_similarities()
+    click.echo(f"✓ Artículos similares recalculados para {total} artículo(s)")
+
+
+@data.command('refresh-similarities')
+@with_appcontext
+def refresh_similarities():
+    """Recalcula los vecinos de los artículos creados o modificados (similarity_pending)."""
+    total = RecommendationService.refresh_pending()
+    click.echo(f"✓ Artículos similares actualizados para {total} artículo(s) pendiente(s)")
+
+
 def init_app(app):
     """Registra los comandos CLI en la aplicación Flask."""
     app.cli.add_command(data)
@@ -36,6 +36,42 @@ class Config:
     MAIL_DEFAULT_SENDER = os.getenv("MAIL_DEFAULT_SENDER", MAIL_USERNAME)
     MAIL_MAX_EMAILS_PER_DAY = int(os.getenv("MAIL_MAX_EMAILS_PER_DAY", 100))
 
+    # Caché en memoria de detalles de proyecto serializados (entradas / bytes por worker)
+    PROJECT_CACHE_MAX_ENTRIES = int(os.getenv("PROJECT_CACHE_MAX_ENTRIES", 256))
+    PROJECT_CACHE_MAX_BYTES = int(os.getenv("PROJECT_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+
+    # Caducidad de las facetas del catálogo en otros workers (segundos)
+    PROJECT_FACETS_CACHE_TTL = int(os.getenv("PROJECT_FACETS_CACHE_TTL", 60))
+
+    # Caducidad del contador de artículos en otros workers (segundos)
+    ARTICLE_COUNT_CACHE_TTL = int(os.getenv("ARTICLE_COUNT_CACHE_TTL", 300))
+
+    # Registro de slugs existentes (404 sin consultar la BD) y caché de fallos (segundos)
+    SLUG_REGISTRY_ENABLED = os.getenv("SLUG_REGISTRY_ENABLED", "true").lower() == "true"
+    SLUG_REGISTRY_REFRESH_INTERVAL = int(os.getenv("SLUG_REGISTRY_REFRESH_INTERVAL", 30))
+    SLUG_REGISTRY_BLOOM_THRESHOLD = int(os.getenv("SLUG_REGISTRY_BLOOM_THRESHOLD", 50000))
+    SLUG_NEGATIVE_CACHE_TTL = int(os.getenv("SLUG_NEGATIVE_CACHE_TTL", 30))
+
+    # Caché de artículos serializados por slug para POST /api/articles/by-slugs
+    ARTICLE_SLUG_CACHE_TTL = int(os.getenv("ARTICLE_SLUG_CACHE_TTL", 300))
+    ARTICLE_SLUG_CACHE_MAX_BYTES = int(os.getenv("ARTICLE_SLUG_CACHE_MAX_BYTES", 16 * 1024 * 1024))
+
+    # URL pública del frontend para sitemap.xml y feed.xml
+    SITE_URL = os.getenv("SITE_URL", "https://boostaproject.com")
+    FEED_TITLE = os.getenv("FEED_TITLE", "Boost A Project - Blog")
+    FEED_DESCRIPTION = os.getenv("FEED_DESCRIPTION", "Artículos sobre inversión inmobiliaria de Boost A Project")
+
+    # Compresión gzip/brotli de respuestas JSON (bytes comprimidos cacheados por ETag)
+    COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+    COMPRESSION_GZIP_LEVEL = 6
+    COMPRESSION_BROTLI_QUALITY = 5
+    COMPRESSION_CACHE_MAX_BYTES = int(os.getenv("COMPRESSION_CACHE_MAX_BYTES", 16 * 1024 * 1024))
+
+    # Contador de visitas con escritura diferida (segundos / visitas pendientes)
+    VIEW_COUNTER_FLUSH_INTERVAL = int(os.getenv("VIEW_COUNTER_FLUSH_INTERVAL", 10))
+    VIEW_COUNTER_FLUSH_THRESHOLD = int(os.getenv("VIEW_COUNTER_FLUSH_THRESHOLD", 200))
+
 
 class DevelopmentConfig(Config):
     """Configuración para desarrollo."""
@@ -63,6 +99,9 @@ class TestingConfig(Config):
     SECRET_KEY = "test-secret-key"
     JWT_SECRET_KEY = "test-jwt-secret"
     MAIL_SUPPRESS_SEND = True
+
+    # Sin hilo de volcado: los tests vuelcan las visitas con flush_views()
+    VIEW_COUNTER_FLUSH_INTERVAL = 0
     
     # Configuración JWT con tokens en cookies HttpOnly (igual que desarrollo)
     JWT_TOKEN_LOCATION = ["cookies"]
@@ -8,12 +8,15 @@ from flask_marshmallow import Marshmallow
 from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 from flask_mail import Mail
+from app.utils.json_provider import json_dumps, json_loads
 
 # Inicializar las extensiones sin aplicación
 # Se añade reconexión automática al pool para evitar errores con Neon (SSL connection closed)
 db = SQLAlchemy(engine_options={
     "pool_pre_ping": True,   # Verifica la conexión antes de cada uso
-    "pool_recycle": 280      # Recicla conexiones cada 280 segundos para evitar expiración
+    "pool_recycle": 280,     # Recicla conexiones cada 280 segundos para evitar expiración
+    "json_serializer": json_dumps,      # Columnas JSON codificadas con orjson si está disponible
+    "json_deserializer": json_loads,
 })
 migrate = Migrate()
 jwt = JWTManager()
@@ -9,9 +9,23 @@ proporciona métodos para interactuar con los registros.
 Convierte el valor almacenado a lista Python al recuperarlo de la base de datos.
 Soporta casos donde el valor ya viene como lista (por ejemplo, artículos creados desde frontend o SQLite).
 Incluye protección contra valores corruptos o cadenas vacías para evitar errores de decodificación JSON.
+
+search_vector (tsvector) lo mantiene un trigger de PostgreSQL; ver search_index.py.
+ix_articles_date respalda el listado y la paginación por cursor sobre (date, id).
+plain_text, word_count, reading_time, toc y content_html se derivan de content al
+asignarlo (@validates, ver app/utils/article_content.py): las lecturas no procesan HTML.
+image_variants (srcset de Cloudinary y dimensiones) se deriva de image al asignarlo
+(ver app/utils/responsive_images.py).
+similarity_pending marca los artículos cuyos vecinos TF-IDF hay que recalcular
+fuera de la petición (ver app/services/recommendation_service.py).
 """
 
 from app.extensions import db
+from app.models.search_index import TSVector, html_to_text, register_searchable
+from app.utils.article_content import process_content
+from app.utils.responsive_images import build_variants
+from app.utils.slug_registry import track_slugs
+from sqlalchemy.orm import deferred, validates
 from sqlalchemy.sql import func
 from sqlalchemy.types import TypeDecorator, Text
 import json
@@ -63,9 +77,22 @@ class Article(db.Model):
     excerpt = db.Column(db.String(500), nullable=True)
     image = db.Column(db.String(255), nullable=False)
     image_alt = db.Column(db.String(255), nullable=True)  # NUEVO CAMPO: descripción alt de la imagen
+    image_variants = db.Column(db.JSON, nullable=True)  # {"width", "height", "aspect_ratio", "srcset"}
     content = db.Column(db.Text, nullable=False)
     related = db.Column(db.JSON, nullable=True)
 
+    # Campos derivados de content (se recalculan al asignar content)
+    plain_text = deferred(db.Column(db.Text, nullable=True))
+    word_count = db.Column(db.Integer, nullable=True)
+    reading_time = db.Column(db.Integer, nullable=True)  # minutos
+    toc = db.Column(db.JSON, nullable=True)  # [{"id": "...", "text": "...", "level": 2}]
+    content_html = db.Column(db.Text, nullable=True)  # HTML saneado, h2/h3 con id
+
+    # Vecinos TF-IDF pendientes de recalcular (flask data refresh-similarities)
+    similarity_pending = db.Column(
+        db.Boolean, nullable=False, default=True, server_default=db.false(), index=True
+    )
+
     # Campos para SEO
     meta_description = db.Column(db.String(160), nullable=True)
     meta_keywords = db.Column(db.String(255), nullable=True)
@@ -73,7 +100,43 @@ class Article(db.Model):
     # Campos para auditoría
     created_at = db.Column(db.DateTime(timezone=True), server_default=func.now())
     updated_at = db.Column(db.DateTime(timezone=True), onupdate=func.now())
+
+    # Búsqueda de texto completo (tsvector mantenido por trigger en PostgreSQL)
+    search_vector = deferred(db.Column(TSVector))
+
+    __table_args__ = (
+        db.Index("ix_articles_date", date.desc(), id.desc()),
+        db.Index("ix_articles_search", "search_vector", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+        # Búsqueda de sufijos libres (slug LIKE 'base-%'), ver slug_allocation
+        db.Index(
+            "ix_articles_slug_pattern", "slug", postgresql_ops={"slug": "varchar_pattern_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
     
+    @validates("content")
+    def validate_content(self, key, value):
+        """Mantiene los campos derivados en cada asignación de content."""
+        for column, derived in process_content(value).items():
+            setattr(self, column, derived)
+        return value
+
+    @validates("image")
+    def validate_image(self, key, value):
+        """
+        Recalcula las variantes responsive al cambiar la imagen. Las dimensiones
+        llegan aparte (set_image_dimensions); con la misma imagen se conservan.
+        """
+        if value != self.image or self.image_variants is None:
+            self.image_variants = build_variants(value)
+        return value
+
+    def set_image_dimensions(self, width=None, height=None):
+        """Recalcula image_variants con las dimensiones de la subida, si se conocen."""
+        if width and height:
+            self.image_variants = build_variants(self.image, width, height)
+
     def __repr__(self):
         return f"<Article {self.title}>"
     
@@ -87,10 +150,32 @@ class Article(db.Model):
             "excerpt": self.excerpt,
             "image": self.image,
             "image_alt": self.image_alt,
+            "image_variants": self.image_variants,
             "content": self.content,
             "related": self.related,
+            "word_count": self.word_count,
+            "reading_time": self.reading_time,
+            "toc": self.toc,
+            "content_html": self.content_html,
             "meta_description": self.meta_description,
             "meta_keywords": self.meta_keywords,
             "created_at": self.created_at,
             "updated_at": self.updated_at
         }
+
+
+def _search_document(row):
+    body = " ".join(
+        filter(None, (row["excerpt"], row["meta_keywords"], html_to_text(row["content"])))
+    )
+    return row["title"], body
+
+
+register_searchable(
+    Article,
+    "article",
+    ("title", "excerpt", "meta_keywords", "content"),
+    _search_document,
+)
+
+track_slugs(Article, "article")
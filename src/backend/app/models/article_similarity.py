@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+article_similarity.py — Vecinos más parecidos de cada artículo (TF-IDF).
+
+Contexto:
+Cuando un artículo no tiene related manual, el detalle propone los artículos más
+parecidos por contenido. La similitud coseno TF-IDF se precalcula
+(RecommendationService) y aquí se guardan solo los N mejores vecinos de cada
+artículo, de modo que la lectura es una consulta por índice.
+
+Notas de mantenimiento:
+- Clave primaria (article_id, related_id); las filas se borran en cascada con
+  cualquiera de los dos artículos.
+- Reconstrucción completa: flask data build-similarities.
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+from app.extensions import db
+
+
+class ArticleSimilarity(db.Model):
+    __tablename__ = "article_similarities"
+
+    article_id = db.Column(
+        db.Integer, db.ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True
+    )
+    related_id = db.Column(
+        db.Integer, db.ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True
+    )
+    score = db.Column(db.Float, nullable=False)
+
+    def __repr__(self):
+        return f"<ArticleSimilarity {self.article_id}->{self.related_id} {self.score:.3f}>"
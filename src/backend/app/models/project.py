@@ -13,13 +13,36 @@ Notas de mantenimiento:
 - Los campos "investment_data" y "content_sections" almacenan la estructura completa del proyecto.
 - La galería principal se gestiona como lista JSON de imágenes Cloudinary (src, alt).
 - Campos category, featured y priority permiten organización y destacado de proyectos.
+- gallery y content_sections son diferidos (grupo "content"): los listados no los
+  leen; el detalle los carga en la misma consulta con undefer_group("content").
+- ix_projects_listing respalda la paginación por cursor (ver ProjectService);
+  el resto de índices cubren las demás ordenaciones y filtros del listado.
+- Los JSON son JSONB en PostgreSQL (JSON genérico en SQLite): investment_data y
+  content_sections tienen índices GIN jsonb_path_ops para consultas de
+  contención (@>), p. ej. moneda o tipo de sección.
+- min_investment_cents, total_investment_cents, expected_return_bp y currency se
+  derivan de investment_data al asignarlo (API, importador). Para filas
+  antiguas: flask data backfill-investment.
+- search_vector lo mantiene un trigger de PostgreSQL (ver search_index.py).
+- Cada imagen de gallery guarda al asignarla sus variantes responsive de
+  Cloudinary (srcset, width, height, aspect_ratio; ver responsive_images.py).
+  Para filas antiguas: flask data backfill-image-variants.
 
 @author Boost A Project Team
 @since v2.0.0
 """
 
 from datetime import datetime, timezone
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred, validates
 from app.extensions import db
+from app.models.search_index import TSVector, json_strings, register_searchable
+from app.utils.investment import derive_investment_columns
+from app.utils.responsive_images import enrich_gallery
+from app.utils.slug_registry import track_slugs
+
+# JSONB en PostgreSQL (indexable, sin reparseo); JSON genérico en SQLite (tests)
+JSONDocument = db.JSON().with_variant(JSONB(), "postgresql")
 
 
 class Project(db.Model):
@@ -36,24 +59,106 @@ class Project(db.Model):
     
     # Organización y destacado
     category = db.Column(db.String(50))  # inmobiliario, hosteleria, deportivo, energia, etc.
-    featured = db.Column(db.Boolean, default=False)  # si se destaca en homepage
-    priority = db.Column(db.Integer, default=0)  # orden de visualización (mayor = más arriba)
+    featured = db.Column(db.Boolean, default=False, nullable=False)  # si se destaca en homepage
+    priority = db.Column(db.Integer, default=0, nullable=False)  # orden de visualización (mayor = más arriba)
     free_sections_count = db.Column(db.Integer, default=5, nullable=True)  # Número de secciones visibles sin registro (sistema FREEMIUM)
 
     # Imágenes
     main_image_url = db.Column(db.String(500))
-    gallery = db.Column(db.JSON)  # [{"src": "...", "alt": "..."}]
+    gallery = deferred(db.Column(JSONDocument), group="content")  # [{"url": "...", "alt": "...", "srcset": [...]}]
 
     # Datos financieros genéricos
-    investment_data = db.Column(db.JSON)  # total, min_investment, breakdown, escenarios, etc.
+    investment_data = db.Column(JSONDocument)  # total, min_investment, breakdown, escenarios, etc.
+
+    # Copias tipadas de investment_data para filtros por rango (ver validate_investment_data)
+    min_investment_cents = db.Column(db.BigInteger)
+    total_investment_cents = db.Column(db.BigInteger)
+    expected_return_bp = db.Column(db.Integer)  # puntos básicos: 12 % = 1200
+    currency = db.Column(db.String(3))
 
     # Contenido libre estructurado
-    content_sections = db.Column(db.JSON)  # lista ordenada de bloques flexibles
+    content_sections = deferred(db.Column(JSONDocument), group="content")  # lista ordenada de bloques flexibles
 
     # Métricas y timestamps
-    views = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    views = db.Column(db.Integer, default=0, nullable=False)
+    created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = db.Column(db.DateTime, onupdate=lambda: datetime.now(timezone.utc))
 
+    # Búsqueda de texto completo (tsvector mantenido por trigger en PostgreSQL)
+    search_vector = deferred(db.Column(TSVector))
+
+    # Índices compuestos para la paginación por cursor y los filtros del listado
+    __table_args__ = (
+        db.Index("ix_projects_listing", priority.desc(), created_at.desc(), id.desc()),
+        db.Index("ix_projects_created", created_at.desc(), id.desc()),
+        db.Index("ix_projects_views", views.desc(), id.desc()),
+        db.Index(
+            "ix_projects_category_listing",
+            category, priority.desc(), created_at.desc(), id.desc(),
+        ),
+        db.Index(
+            "ix_projects_status_listing",
+            status, priority.desc(), created_at.desc(), id.desc(),
+        ),
+        # Parcial: solo los destacados de la homepage (unas pocas filas)
+        db.Index(
+            "ix_projects_featured",
+            priority.desc(), created_at.desc(), id.desc(),
+            postgresql_where=db.text("featured"),
+            sqlite_where=db.text("featured = 1"),
+        ),
+        db.Index("ix_projects_min_investment", min_investment_cents),
+        db.Index("ix_projects_expected_return", expected_return_bp),
+        db.Index(
+            "ix_projects_investment_data",
+            "investment_data",
+            postgresql_using="gin",
+            postgresql_ops={"investment_data": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+        db.Index(
+            "ix_projects_content_sections",
+            "content_sections",
+            postgresql_using="gin",
+            postgresql_ops={"content_sections": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+        db.Index("ix_projects_search", "search_vector", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
+
+    @validates("investment_data")
+    def validate_investment_data(self, key, value):
+        """Mantiene las columnas tipadas en cada asignación de investment_data."""
+        for column, derived in derive_investment_columns(value).items():
+            setattr(self, column, derived)
+        return value
+
+    @validates("gallery")
+    def validate_gallery(self, key, value):
+        """Añade las variantes responsive a cada imagen en cada asignación de gallery."""
+        return enrich_gallery(value)
+
     def __repr__(self):
-        return f"<Project {self.slug}>"
\ No newline at end of file
+        return f"<Project {self.slug}>"
+
+def _search_document(row):
+    body = " ".join(
+        filter(None, (
+            row["subtitle"],
+            row["description"],
+            row["category"],
+            json_strings(row["investment_data"]),
+            json_strings(row["content_sections"]),
+        ))
+    )
+    return row["title"], body
+
+
+register_searchable(
+    Project,
+    "project",
+    ("title", "subtitle", "description", "category", "investment_data", "content_sections"),
+    _search_document,
+)
+
+track_slugs(Project, "project")
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+search_index.py — Soporte de búsqueda de texto completo para artículos y proyectos.
+
+Contexto:
+En PostgreSQL cada tabla buscable tiene una columna search_vector (tsvector) con
+índice GIN. La configuración "es_unaccent" es el stemmer español con los acentos
+eliminados. Los triggers creados en la migración mantienen la columna en cada
+INSERT/UPDATE de las columnas de texto. Las consultas nunca recalculan vectores.
+
+En SQLite (TestingConfig) no existe tsvector. Se usa una tabla virtual FTS5
+(search_index) que se crea con db.create_all() y se mantiene con eventos del ORM
+equivalentes a los triggers.
+
+Notas de mantenimiento:
+- Las columnas indexadas y sus pesos deben coincidir con los triggers de la
+  migración c5d1f7a2e894 (A = título, B = resumen, C/D = cuerpo).
+- search_vector es diferido: nunca se lee desde Python, solo se consulta.
+- Las escrituras masivas con query.update() o Core no disparan los eventos del
+  ORM: en SQLite hay que reindexar con reindex_sqlite() / reindex_sqlite_rows().
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+import html
+import re
+
+from sqlalchemy import DDL, delete, event, insert, inspect, select
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.types import Text, TypeDecorator
+
+from app.extensions import db
+
+SEARCH_CONFIG = "es_unaccent"
+SQLITE_TABLE = "search_index"
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+_SEARCHABLE = {}
+
+
+class TSVector(TypeDecorator):
+    """tsvector en PostgreSQL; texto (siempre NULL) en el resto de motores."""
+
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(TSVECTOR())
+        return dialect.type_descriptor(Text())
+
+
+def html_to_text(value):
+    """Texto plano aproximado de un fragmento HTML (para indexar)."""
+    if not value:
+        return ""
+    return html.unescape(_TAG_RE.sub(" ", value))
+
+
+def json_strings(value):
+    """Concatena todos los valores de texto de una estructura JSON."""
+    parts = []
+
+    def walk(node):
+        if isinstance(node, str):
+            parts.append(node)
+        elif isinstance(node, dict):
+            for item in node.values():
+                walk(item)
+        elif isinstance(node, (list, tuple)):
+            for item in node:
+                walk(item)
+
+    walk(value)
+    return " ".join(parts)
+
+
+def register_searchable(model, kind, columns, document):
+    """
+    Registra un modelo en el índice FTS5 de SQLite.
+
+    Args:
+        model: Clase del modelo.
+        kind: Tipo del resultado ("article", "project").
+        columns: Nombres de las columnas de las que depende el documento.
+        document: Función (fila) -> (título, cuerpo).
+    """
+    _SEARCHABLE[kind] = (model, tuple(columns), document)
+
+    event.listen(model, "after_insert", _make_listener(kind, always=True))
+    event.listen(model, "after_update", _make_listener(kind, always=False))
+    event.listen(model, "after_delete", _make_delete_listener(kind))
+
+
+# Vista Core de la tabla FTS5 (fuera de db.metadata: la crea el DDL de abajo)
+_fts = db.Table(
+    SQLITE_TABLE,
+    db.MetaData(),
+    db.Column("kind"),
+    db.Column("ref_id"),
+    db.Column("title"),
+    db.Column("body"),
+)
+
+
+def _index_row(connection, kind, ref_id):
+    model, columns, document = _SEARCHABLE[kind]
+    table = model.__table__
+    row = connection.execute(
+        select(*(table.c[name] for name in columns)).where(table.c.id == ref_id)
+    ).mappings().first()
+
+    connection.execute(delete(_fts).where(_fts.c.kind == kind, _fts.c.ref_id == ref_id))
+    if row is not None:
+        title, body = document(row)
+        connection.execute(insert(_fts).values(kind=kind, ref_id=ref_id, title=title, body=body))
+
+
+def _make_listener(kind, always):
+    def listener(mapper, connection, target):
+        if connection.dialect.name != "sqlite":
+            return
+        columns = _SEARCHABLE[kind][1]
+        if not always:
+            state = inspect(target)
+            if not any(state.attrs[name].history.has_changes() for name in columns):
+                return
+        _index_row(connection, kind, target.id)
+
+    return listener
+
+
+def _make_delete_listener(kind):
+    def listener(mapper, connection, target):
+        if connection.dialect.name != "sqlite":
+            return
+        connection.execute(delete(_fts).where(_fts.c.kind == kind, _fts.c.ref_id == target.id))
+
+    return listener
+
+
+def reindex_sqlite_rows(connection, kind, ref_ids):
+    """Reindexa filas concretas escritas con Core (no-op fuera de SQLite)."""
+    if connection.dialect.name != "sqlite":
+        return
+    for ref_id in ref_ids:
+        _index_row(connection, kind, ref_id)
+
+
+def reindex_sqlite(connection=None):
+    """Reconstruye el índice FTS5 completo (solo SQLite)."""
+    connection = connection or db.session.connection()
+    connection.execute(delete(_fts))
+    for kind, (model, _columns, _document) in _SEARCHABLE.items():
+        for ref_id in connection.execute(select(model.__table__.c.id)).scalars().all():
+            _index_row(connection, kind, ref_id)
+
+
+event.listen(
+    db.metadata,
+    "after_create",
+    DDL(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_TABLE} USING fts5("
+        "kind UNINDEXED, ref_id UNINDEXED, title, body, "
+        "tokenize = 'unicode61 remove_diacritics 2')"
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    db.metadata,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {SQLITE_TABLE}").execute_if(dialect="sqlite"),
+)
@@ -4,12 +4,17 @@ Esquema de validación para artículos del blog.
 Este módulo define la estructura y validación de datos para los artículos.
 Incluye validaciones para cada campo y generación automática de slugs
 para URLs amigables a partir del título del artículo.
+
+ArticleSummarySchema es la salida por defecto del listado: campos de tarjeta,
+sin content (el HTML completo del artículo).
 """
 
 from marshmallow import Schema, fields, validate, post_load
 import re
 import unicodedata
 
+WORDS_PER_MINUTE = 200
+
 def create_slug(text):
     """
     Convierte un texto en un slug válido para URL.
@@ -34,8 +39,16 @@ class ArticleSchema(Schema):
     excerpt = fields.Str(validate=validate.Length(max=500))
     image = fields.Str(required=True, validate=validate.Length(max=255))
     image_alt = fields.Str(validate=validate.Length(max=255))
+    image_variants = fields.Dict(dump_only=True, allow_none=True)  # Derivado de image al guardar
+    # Dimensiones intrínsecas que devuelve la subida: limitan las variantes y dan aspect_ratio
+    image_width = fields.Int(load_only=True, allow_none=True, validate=validate.Range(min=1))
+    image_height = fields.Int(load_only=True, allow_none=True, validate=validate.Range(min=1))
     content = fields.Str(required=True)
     related = fields.List(fields.Str(), required=False)  # Lista de slugs relacionados
+    word_count = fields.Int(dump_only=True)  # Derivados de content al guardar
+    reading_time = fields.Int(dump_only=True)
+    toc = fields.List(fields.Dict(), dump_only=True)
+    content_html = fields.Str(dump_only=True)
     meta_description = fields.Str(validate=validate.Length(max=160))
     meta_keywords = fields.Str(validate=validate.Length(max=255))
 
@@ -46,6 +59,21 @@ class ArticleSchema(Schema):
             data['slug'] = create_slug(data['title'])
         return data
 
+class ArticleSummarySchema(Schema):
+    """Schema ligero de salida para listados de artículos."""
+    id = fields.Int(dump_only=True)
+    title = fields.Str()
+    slug = fields.Str()
+    author = fields.Str()
+    date = fields.DateTime()
+    excerpt = fields.Str(allow_none=True)
+    image = fields.Str()
+    image_alt = fields.Str(allow_none=True)
+    image_variants = fields.Dict(allow_none=True)
+    reading_time = fields.Int(allow_none=True)
+
 # Instancias del esquema para uso en la API
 article_schema = ArticleSchema()
 articles_schema = ArticleSchema(many=True)
+article_summary_schema = ArticleSummarySchema()
+article_summaries_schema = ArticleSummarySchema(many=True)
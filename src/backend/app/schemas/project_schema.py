@@ -12,6 +12,9 @@ Notas de mantenimiento:
 - Compatible con cualquier frontend que interprete bloques dinámicos.
 - Se debe validar el contenido interno (bloques) desde el frontend o servicios dedicados.
 - Diseñado para escalar a un CMS modular (admin visual futuro).
+- ProjectSummarySchema es la proyección ligera de los listados (tarjetas):
+  no incluye content_sections ni gallery y recorta investment_data a las cifras
+  de cabecera que usan ProjectCard e InvestmentSimulator.
 
 @author Boost A Project Team
 @since v2.0.0
@@ -29,6 +32,11 @@ class ProjectInputSchema(Schema):
     status = fields.Str(validate=validate.OneOf(["open", "active", "funded", "closed"]))
     free_sections_count = fields.Int(allow_none=True)
 
+    # Organización y destacado (filtros del listado)
+    category = fields.Str(allow_none=True, validate=validate.Length(max=50))
+    featured = fields.Bool()
+    priority = fields.Int()
+
     # Campos multimedia y estructurados
     main_image_url = fields.Str(allow_none=True)
     gallery = fields.List(fields.Dict(), allow_none=True)
@@ -46,3 +54,48 @@ class ProjectInputSchema(Schema):
 class ProjectSchema(ProjectInputSchema):
     """Schema completo de salida (lectura) para el frontend."""
     id = fields.Int(dump_only=True)
+
+
+# Claves de investment_data que se muestran en tarjetas (públicas y de admin) y simulador
+SUMMARY_INVESTMENT_KEYS = (
+    "total_investment",
+    "investment_goal",
+    "currency",
+    "min_investment",
+    "expected_return",
+    "optimistic_return",
+    "conservative_return",
+    "execution_time",
+    "estimated_duration",
+    "investment_type",
+)
+SUMMARY_PROPERTY_KEYS = ("address", "neighborhood", "surface_m2", "rooms")
+
+
+class ProjectSummarySchema(Schema):
+    """Schema ligero de salida para listados de proyectos."""
+    id = fields.Int(dump_only=True)
+    slug = fields.Str()
+    title = fields.Str()
+    subtitle = fields.Str(allow_none=True)
+    description = fields.Str(allow_none=True)
+    status = fields.Str()
+    category = fields.Str(allow_none=True)
+    featured = fields.Bool()
+    priority = fields.Int()
+    main_image_url = fields.Str(allow_none=True)
+    investment_data = fields.Method("get_investment_headline")
+
+    def get_investment_headline(self, obj):
+        """Recorta investment_data a las cifras de cabecera."""
+        data = obj.investment_data
+        if not isinstance(data, dict):
+            return None
+
+        headline = {key: data[key] for key in SUMMARY_INVESTMENT_KEYS if key in data}
+        specs = data.get("property_specs")
+        if isinstance(specs, dict):
+            headline["property_specs"] = {
+                key: specs[key] for key in SUMMARY_PROPERTY_KEYS if key in specs
+            }
+        return headline
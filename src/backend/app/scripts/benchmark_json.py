@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+benchmark_json.py — Comparativa de codificación JSON del detalle de proyecto.
+
+Contexto:
+Mide el coste de codificar el payload de GET /api/projects/<slug> con el
+proveedor JSON estándar de Flask frente a FastJSONProvider (orjson).
+El payload se construye con ProjectSchema a partir de los proyectos de
+app/data/projects/, igual que en el endpoint.
+
+Ejecutar desde src/backend/:
+    python -m app.scripts.benchmark_json [--iterations 2000]
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+import argparse
+import glob
+import json
+import os
+import timeit
+from datetime import datetime, timezone
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from app.models.project import Project
+from app.schemas.project_schema import ProjectSchema
+from app.utils.json_provider import FastJSONProvider, orjson
+
+PROJECTS_DIR = os.path.join(os.path.dirname(__file__), "..", "data", "projects")
+
+
+def load_payload():
+    """Payload del detalle del primer proyecto de ejemplo, como lo serializa la API."""
+    path = sorted(glob.glob(os.path.join(PROJECTS_DIR, "*.json")))[0]
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    data = data[0] if isinstance(data, list) else data
+
+    fields = {k: v for k, v in data.items() if k in Project.__table__.columns}
+    project = Project(id=1, views=0, created_at=datetime.now(timezone.utc), **fields)
+    payload = ProjectSchema().dump(project)
+    payload["locked_sections"] = 0
+    return payload
+
+
+def run(iterations):
+    app = Flask(__name__)
+    payload = load_payload()
+    providers = {
+        "flask (json)": DefaultJSONProvider(app),
+        "fast (orjson)" if orjson else "fast (sin orjson)": FastJSONProvider(app),
+    }
+
+    size = len(DefaultJSONProvider(app).dumps(payload).encode("utf-8"))
+    print(f"Payload: {size / 1024:.1f} KB, {iterations} iteraciones")
+
+    results = {}
+    for name, provider in providers.items():
+        body = provider.dumps(payload)
+        results[name] = (
+            min(timeit.repeat(lambda: provider.dumps(payload), number=iterations, repeat=3)),
+            min(timeit.repeat(lambda: provider.loads(body), number=iterations, repeat=3)),
+        )
+
+    baseline = results["flask (json)"]
+    for name, (dumps_time, loads_time) in results.items():
+        print(
+            f"{name:<20} dumps {dumps_time / iterations * 1e6:8.1f} µs "
+            f"(x{baseline[0] / dumps_time:4.1f})   "
+            f"loads {loads_time / iterations * 1e6:8.1f} µs (x{baseline[1] / loads_time:4.1f})"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--iterations", type=int, default=2000)
+    run(parser.parse_args().iterations)
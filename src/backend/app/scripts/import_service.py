@@ -3,12 +3,17 @@
 # Servicio para importar artículos y proyectos desde archivos JSON a la base de datos.
 # Compatible con el modelo flexible de Project (investment_data, content_sections).
 # Maneja creación o actualización según si el slug ya existe.
+# Los proyectos actualizados se descartan de la caché de detalles del worker.
+# Los artículos sin slug reciben uno único a partir del título (allocate_slugs).
 # -----------------------------------------------------------------------------
 
 import sqlalchemy as sa
 from app.extensions import db
 from app.models.article import Article
 from app.models.project import Project
+from app.schemas.article_schema import create_slug
+from app.services.project_service import ProjectService
+from app.utils.slug_allocation import allocate_slugs
 
 
 def importar_articulos_desde_json(articles_data):
@@ -16,10 +21,22 @@ def importar_articulos_desde_json(articles_data):
     Importa artículos desde una lista de diccionarios (parsed JSON).
     - Actualiza los artículos existentes por slug.
     - Crea nuevos si no existen.
+    - Los artículos sin slug se crean con uno único generado desde el título
+      (todos los del lote con una consulta por bloque).
     Devuelve una lista con mensajes por cada acción.
     """
     resultados = []
 
+    sin_slug = [item for item in articles_data if not item.get('slug')]
+    if sin_slug:
+        slugs = allocate_slugs(
+            Article.slug,
+            [create_slug(item['title']) for item in sin_slug],
+            source=(Article.title, create_slug),
+        )
+        for item, slug in zip(sin_slug, slugs):
+            item['slug'] = slug
+
     for item in articles_data:
         existing = Article.query.filter_by(slug=item['slug']).first()
 
@@ -57,6 +74,7 @@ def importar_proyectos_desde_json(data: list) -> list[str]:
     Devuelve una lista con mensajes por cada acción realizada.
     """
     resultados = []
+    actualizados = []
     
     try:
         for item in data:
@@ -88,6 +106,7 @@ def importar_proyectos_desde_json(data: list) -> list[str]:
                     existing.content_sections = item.get('content_sections', existing.content_sections)
                     
                     existing.updated_at = sa.func.now()
+                    actualizados.append(existing.id)
                     
                     resultados.append(f"Proyecto actualizado: {slug}")
                     
@@ -121,6 +140,9 @@ def importar_proyectos_desde_json(data: list) -> list[str]:
         
         # Commit único al final si todo fue bien
         db.session.commit()
+
+        for project_id in actualizados:
+            ProjectService.invalidate_project(project_id)
         
     except Exception as e:
         db.session.rollback()
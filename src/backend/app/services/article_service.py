@@ -3,30 +3,184 @@ Servicios para la gestión de artículos.
 
 Este módulo contiene la lógica de negocio relacionada con los artículos del blog.
 Centraliza todas las operaciones de acceso, creación, actualización y eliminación.
+
+El listado carga por defecto solo las columnas de tarjeta (SUMMARY_FIELDS):
+content queda fuera de la consulta salvo que se pida con fields. Admite dos modos: páginas numeradas (OFFSET, compatible con el
+frontend actual) y cursor sobre (date, id) para scroll infinito, respaldado por
+el índice ix_articles_date. El total sale de un contador cacheado por worker
+(invalidado al crear y eliminar) o, si no se pide exacto, de la estimación
+reltuples de PostgreSQL.
+
+POST /by-slugs se sirve desde una caché por slug de artículos ya serializados:
+solo los slugs ausentes de la caché se consultan, en un único IN.
+
+Los slugs generados a partir del título se hacen únicos con sufijo -N
+(next_free_slug) y la escritura se reintenta si otra petición ocupa el mismo
+slug entre la consulta y el INSERT.
 """
 
 from app.models.article import Article
 from app.extensions import db
-from flask import abort
-from sqlalchemy import desc
-import re
+from app.schemas.article_schema import article_schema, article_summary_schema, create_slug
+from app.services.recommendation_service import RecommendationService
+from app.utils.article_content import make_excerpt
+from app.utils.cache import app_cache
+from app.utils.pagination import decode_cursor, encode_cursor, keyset_after
+from app.utils.slug_allocation import is_slug_conflict, next_free_slug
+from app.utils import slug_registry
+from flask import abort, current_app
+from sqlalchemy import desc, func, text
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import load_only
+import logging
 import math
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 50
+
+# Orden del listado (descendente) y columnas del cursor
+CURSOR_COLUMNS = (Article.date, Article.id)
+
+# Origen de los slugs: el mayor sufijo solo se toma de títulos con la misma base
+SLUG_SOURCE = (Article.title, create_slug)
+
+# Campos que alimentan la similitud TF-IDF: cambiarlos marca similarity_pending
+SIMILARITY_FIELDS = ("title", "meta_keywords", "content")
+RELATED_LIMIT = 5
+
+# POST /by-slugs: vistas disponibles y máximo de slugs por petición
+BY_SLUGS_VIEWS = ("full", "summary")
+MAX_SLUGS_PER_REQUEST = 50
+_NOT_FOUND = b""  # entrada de caché para slugs inexistentes
+
+# Campos de ArticleSummarySchema
+SUMMARY_FIELDS = (
+    "id", "title", "slug", "author", "date", "excerpt", "image", "image_alt", "image_variants",
+    "reading_time",
+)
+COUNT_CACHE_KEY = "total"
+
+# Intentos de escritura con slug único antes de propagar el IntegrityError
+SLUG_ALLOCATION_ATTEMPTS = 3
+
+
+def _count_cache():
+    return app_cache(
+        "article_counts",
+        maxsize=1,
+        ttl=current_app.config.get("ARTICLE_COUNT_CACHE_TTL", 300),
+    )
+
+
+def _estimated_count():
+    """Estimación de filas de PostgreSQL (pg_class.reltuples) o None si no hay."""
+    if db.engine.dialect.name != "postgresql":
+        return None
+    estimate = db.session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'articles'::regclass")
+    ).scalar()
+    # -1 (o 0 en versiones antiguas) si la tabla aún no se ha analizado
+    return estimate if estimate and estimate > 0 else None
+
+
+def _listing_query(fields=None):
+    """
+    Consulta base del listado. Sin fields carga las columnas de tarjeta; con
+    fields, solo esos campos (más los del cursor).
+    """
+    columns = set(SUMMARY_FIELDS if fields is None else fields)
+    columns.update(("id", "date"))
+    return Article.query.options(load_only(*(getattr(Article, name) for name in sorted(columns))))
+
+def _slug_cache():
+    """Artículos serializados (bytes JSON) por (vista, slug), acotada por bytes y TTL."""
+    return app_cache(
+        "article_by_slug",
+        maxsize=1024,
+        ttl=current_app.config.get("ARTICLE_SLUG_CACHE_TTL", 300),
+        maxbytes=current_app.config.get("ARTICLE_SLUG_CACHE_MAX_BYTES", 16 * 1024 * 1024),
+    )
+
+
+def _remove_similarities(article_id):
+    """
+    Borra los pares TF-IDF de un artículo eliminado dentro de un SAVEPOINT: si
+    falla, se descarta solo ese borrado y la escritura continúa. Altas y cambios
+    solo marcan similarity_pending (RecommendationService.refresh_pending).
+    """
+    try:
+        with db.session.begin_nested():
+            RecommendationService.remove_article(article_id)
+    except SQLAlchemyError:
+        logger.exception("No se pudieron borrar los artículos similares de %s", article_id)
+
+
+def _flush_with_unique_slug(article, base, exclude_id=None):
+    """
+    Asigna a `article` el primer slug libre a partir de `base` y hace flush en un
+    SAVEPOINT. Si otra escritura ocupa ese slug antes del INSERT/UPDATE, el
+    IntegrityError deshace solo el savepoint y se reintenta con el siguiente.
+    """
+    for attempt in range(SLUG_ALLOCATION_ATTEMPTS):
+        slug = next_free_slug(Article.slug, base, exclude_id=exclude_id, source=SLUG_SOURCE)
+        try:
+            # El slug se asigna dentro del savepoint: begin_nested() hace flush
+            # de lo pendiente antes de abrirlo
+            with db.session.begin_nested():
+                article.slug = slug
+                db.session.add(article)
+                db.session.flush()
+            return
+        except IntegrityError as error:
+            if not is_slug_conflict(error, Article.slug) or attempt == SLUG_ALLOCATION_ATTEMPTS - 1:
+                raise
+            logger.info("Slug %s ocupado al guardar, reintentando", slug)
+
+
+def _pop_image_dimensions(article_data):
+    """Extrae (image_width, image_height) de los datos validados: no son columnas."""
+    return article_data.pop("image_width", None), article_data.pop("image_height", None)
+
+
+def _apply_article_data(article, article_data):
+    """Aplica una actualización; un slug nuevo (título cambiado) se hace único."""
+    old_slug, old_title = article.slug, article.title
+    base = article_data.get("slug")
+    dimensions = _pop_image_dimensions(article_data)
+    for key, value in article_data.items():
+        if key != "slug":
+            setattr(article, key, value)
+    article.set_image_dimensions(*dimensions)
+
+    # Mismo slug, o el slug con sufijo que se asignó a este artículo para la
+    # misma base (su título anterior da esa base): se conserva
+    if not base or base == old_slug or create_slug(old_title or "") == base:
+        return
+    # El resto de cambios se escribe antes: un reintento solo deshace el slug
+    db.session.flush()
+    _flush_with_unique_slug(article, base, exclude_id=article.id)
+
+
 class ArticleService:
     @staticmethod
-    def get_all_articles(page=1, limit=10):
-        """Obtiene artículos paginados ordenados por fecha de creación."""
+    def get_all_articles(page=1, limit=10, exact_total=True, fields=None):
+        """
+        Obtiene artículos paginados ordenados por fecha de creación.
+        fields: columnas a cargar (None = las de ArticleSummarySchema).
+        """
         # Calcula el offset
         offset = (page - 1) * limit
         
-        # Obtiene los artículos paginados
-        articles = Article.query.order_by(desc(Article.date)) \
+        # Obtiene los artículos paginados (el id desempata fechas iguales)
+        articles = _listing_query(fields).order_by(desc(Article.date), desc(Article.id)) \
             .offset(offset) \
             .limit(limit) \
             .all()
         
-        # Cuenta total de artículos
-        total_articles = Article.query.count()
+        # Total de artículos (contador cacheado o estimación)
+        total_articles = ArticleService.count_articles(exact=exact_total)
         
         # Calcula total de páginas
         total_pages = math.ceil(total_articles / limit)
@@ -38,6 +192,72 @@ class ArticleService:
             'total_pages': total_pages
         }
 
+    @staticmethod
+    def get_articles_page(limit=DEFAULT_PAGE_SIZE, cursor=None, exact_total=True, fields=None):
+        """
+        Obtiene una página de artículos por cursor sobre (date, id), para scroll infinito.
+        El coste de cada página no depende de su profundidad.
+        fields: columnas a cargar (None = las de ArticleSummarySchema).
+
+        Raises:
+            InvalidCursorError: Si el cursor no es válido.
+        """
+        limit = min(max(limit or DEFAULT_PAGE_SIZE, 1), MAX_PAGE_SIZE)
+
+        query = _listing_query(fields)
+        if cursor:
+            query = query.filter(keyset_after(CURSOR_COLUMNS, decode_cursor(cursor, len(CURSOR_COLUMNS))))
+
+        # Se pide una fila extra para saber si existe página siguiente
+        rows = query.order_by(desc(Article.date), desc(Article.id)).limit(limit + 1).all()
+        articles = rows[:limit]
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = articles[-1]
+            next_cursor = encode_cursor([last.date, last.id])
+
+        return {
+            'articles': articles,
+            'next_cursor': next_cursor,
+            'limit': limit,
+            'total': ArticleService.count_articles(exact=exact_total),
+        }
+
+    @staticmethod
+    def count_articles(exact=True):
+        """
+        Total de artículos. Exacto: contador cacheado (se invalida al crear y
+        eliminar; el TTL acota el desfase en otros workers). No exacto: estimación
+        reltuples de PostgreSQL, con el contador exacto como respaldo.
+        """
+        if not exact:
+            estimate = _estimated_count()
+            if estimate is not None:
+                return estimate
+
+        cache = _count_cache()
+        total = cache.get(COUNT_CACHE_KEY)
+        if total is None:
+            total = Article.query.count()
+            cache.set(COUNT_CACHE_KEY, total)
+        return total
+
+    @staticmethod
+    def invalidate_count():
+        """Descarta el contador cacheado de este worker."""
+        _count_cache().clear()
+
+    @staticmethod
+    def get_listing_version():
+        """
+        Devuelve (count, última modificación) de los artículos sin cargar filas.
+        Permite responder 304 al listado antes de consultar la página.
+        """
+        version = func.coalesce(Article.updated_at, Article.created_at)
+        count, last_modified = db.session.query(func.count(Article.id), func.max(version)).one()
+        return count, last_modified
+
     @staticmethod
     def get_article_by_id(article_id):
         """Obtiene un artículo por su ID."""
@@ -46,45 +266,58 @@ class ArticleService:
 
     @staticmethod
     def get_article_by_slug(slug):
-        """Obtiene un artículo por su slug."""
-        article = Article.query.filter_by(slug=slug).first_or_404()
+        """Obtiene un artículo por su slug (404 con una comprobación mínima si el registro lo descarta)."""
+        if slug_registry.is_known_missing("article", slug):
+            abort(404)
+
+        article = Article.query.filter_by(slug=slug).first()
+        if article is None:
+            slug_registry.remember_missing("article", slug)
+            abort(404)
         return article
 
     @staticmethod
     def create_article(article_data):
-        """Crea un nuevo artículo."""
-        if 'excerpt' not in article_data or not article_data['excerpt']:
-            content = article_data['content']
-            clean_content = re.sub(r'<.*?>', '', content)
-            article_data['excerpt'] = clean_content[:150] + '...' if len(clean_content) > 150 else clean_content
-
-        
-
+        """Crea un nuevo artículo (los campos derivados de content los calcula el modelo)."""
+        dimensions = _pop_image_dimensions(article_data)
         new_article = Article(**article_data)
-        db.session.add(new_article)
+        new_article.set_image_dimensions(*dimensions)
+        if not new_article.excerpt:
+            new_article.excerpt = make_excerpt(new_article.plain_text)
+
+        if article_data.get("slug"):
+            _flush_with_unique_slug(new_article, article_data["slug"])
+        else:
+            db.session.add(new_article)
+            db.session.flush()
         db.session.commit()
+        ArticleService.invalidate_count()
+        ArticleService.invalidate_slugs(new_article.slug)
         return new_article
 
     @staticmethod
     def update_article(article_id, article_data):
         """Actualiza un artículo existente."""
         article = Article.query.get_or_404(article_id)
+        old_slug = article.slug
+        _apply_article_data(article, article_data)
 
-        for key, value in article_data.items():
-            setattr(article, key, value)
-
+        if any(field in article_data for field in SIMILARITY_FIELDS):
+            article.similarity_pending = True
         db.session.commit()
+        ArticleService.invalidate_slugs(old_slug, article.slug)
         return article
     
     @staticmethod
     def update_article_by_slug(slug, article_data):
         """Actualiza un artículo existente por su slug."""
         article = Article.query.filter_by(slug=slug).first_or_404()
+        _apply_article_data(article, article_data)
 
-        for key, value in article_data.items():
-            setattr(article, key, value)
-
+        if any(field in article_data for field in SIMILARITY_FIELDS):
+            article.similarity_pending = True
         db.session.commit()
+        ArticleService.invalidate_slugs(slug, article.slug)
         return article
 
 
@@ -92,16 +325,24 @@ class ArticleService:
     def delete_article(article_id):
         """Elimina un artículo."""
         article = Article.query.get_or_404(article_id)
+        article_id, slug = article.id, article.slug
         db.session.delete(article)
+        _remove_similarities(article_id)
         db.session.commit()
+        ArticleService.invalidate_count()
+        ArticleService.invalidate_slugs(slug)
         return True
     
     @staticmethod
     def delete_article_by_slug(slug):
         """Elimina un artículo por su slug."""
         article = Article.query.filter_by(slug=slug).first_or_404()
+        article_id = article.id
         db.session.delete(article)
+        _remove_similarities(article_id)
         db.session.commit()
+        ArticleService.invalidate_count()
+        ArticleService.invalidate_slugs(slug)
         return True
 
     @staticmethod
@@ -117,5 +358,74 @@ class ArticleService:
         """
         if not slugs:
             return []
-        
-        return Article.query.filter(Article.slug.in_(slugs)).all()
+
+        slugs = list(dict.fromkeys(slugs))
+        found = {a.slug: a for a in Article.query.filter(Article.slug.in_(slugs)).all()}
+        return [found[slug] for slug in slugs if slug in found]
+
+    @staticmethod
+    def get_articles_by_slugs_body(slugs, view="full"):
+        """
+        Devuelve los artículos de los slugs pedidos ya serializados como array JSON
+        (bytes), sin duplicados y en el orden recibido; los inexistentes se omiten.
+
+        Cada artículo se cachea serializado por (vista, slug): solo los slugs que
+        no están en caché se consultan, todos en una única consulta IN.
+
+        Args:
+            slugs: Lista de slugs (como máximo MAX_SLUGS_PER_REQUEST).
+            view: "full" (ArticleSchema) o "summary" (ArticleSummarySchema).
+        """
+        slugs = list(dict.fromkeys(slugs))
+        cache = _slug_cache()
+        bodies = {}
+        missing = []
+        for slug in slugs:
+            body = cache.get((view, slug))
+            if body is None:
+                missing.append(slug)
+            else:
+                bodies[slug] = body
+
+        if missing:
+            if view == "summary":
+                query, schema = _listing_query(), article_summary_schema
+            else:
+                query, schema = Article.query, article_schema
+            found = {a.slug: a for a in query.filter(Article.slug.in_(missing)).all()}
+            for slug in missing:
+                article = found.get(slug)
+                body = current_app.json.dumps_bytes(schema.dump(article)) if article else _NOT_FOUND
+                cache.set((view, slug), body)
+                bodies[slug] = body
+
+        return b"[" + b",".join(bodies[slug] for slug in slugs if bodies[slug]) + b"]"
+
+    @staticmethod
+    def invalidate_slugs(*slugs):
+        """Descarta de este worker las entradas de caché de esos slugs (todas las vistas)."""
+        slugs = set(slugs)
+        _slug_cache().discard_where(lambda key: key[1] in slugs)
+
+    @staticmethod
+    def get_related_articles(article, limit=RELATED_LIMIT):
+        """
+        Resúmenes de los artículos relacionados, con una sola consulta IN.
+
+        Usa Article.related (slugs, en su orden) si tiene valores; si no, los
+        artículos más parecidos precalculados en article_similarities.
+        """
+        if article.related:
+            keys = [slug for slug in article.related if slug != article.slug][:limit]
+            column = Article.slug
+        else:
+            keys = RecommendationService.get_similar_ids(article.id, limit)
+            column = Article.id
+        if not keys:
+            return []
+
+        # updated_at/created_at: el ETag del detalle incluye la versión de cada relacionado
+        fields = SUMMARY_FIELDS + ("updated_at", "created_at")
+        articles = _listing_query(fields).filter(column.in_(keys)).all()
+        position = {key: index for index, key in enumerate(keys)}
+        return sorted(articles, key=lambda item: position[getattr(item, column.key)])
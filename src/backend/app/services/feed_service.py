@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+feed_service.py — Sitemap XML y feed RSS del blog.
+
+Contexto:
+GET /api/sitemap.xml lista todas las URLs públicas de proyectos y artículos y
+GET /api/articles/feed.xml publica los últimos artículos en RSS 2.0. Las
+consultas solo leen slug y fechas (más título y extracto en el feed) y el XML se
+genera en streaming, fila a fila, sin cargar los listados completos.
+
+El XML generado se guarda en caché junto con la versión de sus fuentes
+(número de filas y max(updated_at), como en los ETag de los listados): mientras
+la versión no cambie, la respuesta sale de la caché sin regenerarse.
+
+Notas de mantenimiento:
+- La caché se rellena al terminar el primer stream completo de cada versión.
+- Las URLs se construyen con SITE_URL y las rutas del frontend
+  (/proyectos/<slug>, /blog/<slug>).
+- Fechas sin zona horaria (SQLite) se interpretan como UTC.
+- Las respuestas se validan solo por ETag (sin Last-Modified): borrar un
+  artículo cambia el recuento de la versión pero no max(updated_at).
+- RSS 2.0 exige un email en <author>: el nombre del autor va en <dc:creator>.
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+from datetime import timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
+
+from flask import current_app
+from sqlalchemy import desc, func, select
+
+from app.extensions import db
+from app.models.article import Article
+from app.models.project import Project
+from app.services.article_service import ArticleService
+from app.services.project_service import ProjectService
+from app.utils.cache import app_cache
+
+FEED_LIMIT = 20
+STREAM_BATCH_SIZE = 500
+
+# Ruta del frontend para cada modelo del sitemap
+SITEMAP_SOURCES = (
+    (Project, "/proyectos/"),
+    (Article, "/blog/"),
+)
+
+
+def _feeds_cache():
+    return app_cache("xml_feeds", maxsize=8)
+
+
+def _utc(value):
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _site_url():
+    return current_app.config.get("SITE_URL", "").rstrip("/")
+
+
+def _cached_stream(name, version, generate):
+    """
+    Devuelve los fragmentos XML de `name`: de la caché si la versión coincide o,
+    si no, del generador, guardando el resultado al terminar el stream.
+    """
+    cache = _feeds_cache()
+    cached = cache.get(name)
+    if cached is not None and cached[0] == version:
+        return iter((cached[1],))
+
+    def stream():
+        chunks = []
+        for chunk in generate():
+            chunk = chunk.encode("utf-8")
+            chunks.append(chunk)
+            yield chunk
+        cache.set(name, (version, b"".join(chunks)))
+
+    return stream()
+
+
+def _generate_sitemap():
+    base = _site_url()
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    for model, path in SITEMAP_SOURCES:
+        rows = db.session.execute(
+            select(model.slug, func.coalesce(model.updated_at, model.created_at))
+            .order_by(model.id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        for slug, modified in rows:
+            lastmod = f"<lastmod>{_utc(modified).isoformat()}</lastmod>" if modified else ""
+            yield f"  <url><loc>{escape(base + path + slug)}</loc>{lastmod}</url>\n"
+    yield "</urlset>\n"
+
+
+def _generate_feed():
+    base = _site_url()
+    rows = db.session.execute(
+        select(Article.title, Article.slug, Article.excerpt, Article.author, Article.date)
+        .order_by(desc(Article.date), desc(Article.id))
+        .limit(FEED_LIMIT)
+    )
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"><channel>\n'
+    yield f"<title>{escape(current_app.config.get('FEED_TITLE', 'Blog'))}</title>\n"
+    yield f"<link>{escape(base)}/blog</link>\n"
+    yield f"<description>{escape(current_app.config.get('FEED_DESCRIPTION', ''))}</description>\n"
+    yield "<language>es</language>\n"
+    for title, slug, excerpt, author, date in rows:
+        link = escape(f"{base}/blog/{slug}")
+        yield (
+            "<item>"
+            f"<title>{escape(title)}</title>"
+            f"<link>{link}</link>"
+            f'<guid isPermaLink="true">{link}</guid>'
+            f"<description>{escape(excerpt or '')}</description>"
+            + (f"<dc:creator>{escape(author)}</dc:creator>" if author else "")
+            + (f"<pubDate>{format_datetime(_utc(date))}</pubDate>" if date else "")
+            + "</item>\n"
+        )
+    yield "</channel></rss>\n"
+
+
+class FeedService:
+    @staticmethod
+    def get_sitemap_version():
+        """Versión del sitemap: (count, max(updated_at)) de proyectos y de artículos."""
+        return ProjectService.get_listing_version() + ArticleService.get_listing_version()
+
+    @staticmethod
+    def get_feed_version():
+        """Versión del feed: (count, max(updated_at)) de los artículos."""
+        return ArticleService.get_listing_version()
+
+    @staticmethod
+    def stream_sitemap(version):
+        """Fragmentos (bytes) del sitemap para la versión dada (de caché o generados)."""
+        return _cached_stream("sitemap", version, _generate_sitemap)
+
+    @staticmethod
+    def stream_feed(version):
+        """Fragmentos (bytes) del feed RSS para la versión dada (de caché o generados)."""
+        return _cached_stream("articles_feed", version, _generate_feed)
@@ -3,12 +3,17 @@ Servicio para gestión de imágenes.
 
 Este módulo proporciona funciones para subir, procesar y gestionar imágenes
 utilizando Cloudinary como servicio de almacenamiento en la nube.
+
+La subida devuelve también las variantes responsive (srcset por breakpoint) con
+las dimensiones reales de la imagen, para guardarlas junto a la URL.
 """
 
 import cloudinary
+import cloudinary.api
 import cloudinary.uploader
 import os
 from flask import current_app
+from app.utils.responsive_images import build_variants, parse_cloudinary_url
 
 class ImageService:
     @staticmethod
@@ -56,8 +61,25 @@ class ImageService:
             "public_id": result['public_id'],
             "width": result['width'],
             "height": result['height'],
-            "format": result['format']
+            "format": result['format'],
+            "variants": build_variants(result['secure_url'], result['width'], result['height'])
         }
+
+    @staticmethod
+    def get_dimensions(url):
+        """
+        Consulta a la API de Cloudinary las dimensiones de una imagen ya subida.
+        Solo para procesos de escritura (backfill): las lecturas usan las guardadas.
+
+        Returns:
+            tuple: (width, height), o (None, None) si la URL no es de Cloudinary.
+        """
+        parts = parse_cloudinary_url(url)
+        if parts is None:
+            return None, None
+
+        resource = cloudinary.api.resource(parts["public_id"])
+        return resource.get('width'), resource.get('height')
     
     @staticmethod
     def delete_image(public_id):
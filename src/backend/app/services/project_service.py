@@ -0,0 +1,694 @@
+# -*- coding: utf-8 -*-
+"""
+project_service.py — Lógica de consulta de proyectos.
+
+Contexto:
+Centraliza las consultas de lectura sobre el modelo Project para que los
+endpoints de projects_bp se limiten a validar la petición y serializar.
+El listado se pagina por cursor (keyset): cada ordenación de SORTS compara
+tuplas descendentes respaldadas por su índice compuesto, de modo que cada
+página es un rango acotado del índice y su coste no depende del número
+total de proyectos.
+
+Notas de mantenimiento:
+- Cualquier cambio en SORTS debe reflejarse en los índices de Project.
+- El cursor es opaco para el frontend; solo se debe reenviar tal cual.
+  Incluye el nombre de la ordenación: un cursor de otra ordenación es inválido.
+- La vista "summary" carga solo SUMMARY_COLUMNS (load_only), de modo que los
+  JSON pesados (content_sections, gallery) nunca se leen en los listados.
+  La vista "full" los carga en la misma consulta para evitar N+1.
+- Los filtros (category, status, featured, currency, section_type y rangos) se
+  combinan con AND. section_type consulta el JSON: en PostgreSQL como contención
+  JSONB (@>) sobre el índice GIN; en SQLite con json_each. currency y los rangos
+  usan las columnas tipadas derivadas de investment_data.
+- FREEMIUM: el detalle tiene dos variantes, "full" (usuario autenticado) y "free"
+  (anónimo, solo las primeras free_sections_count secciones + locked_sections).
+  Cada variante se cachea ya codificada en JSON (bytes) con clave
+  (id, versión, variante): una modificación produce claves nuevas, y las
+  escrituras de este worker descartan además las antiguas (invalidate_project).
+- bulk_upsert valida el lote con ProjectInputSchema(many=True), resuelve los
+  slugs existentes en un único IN y aplica altas y cambios en una transacción con
+  INSERT ... ON CONFLICT (slug) DO UPDATE. Al ser Core, las columnas derivadas de
+  investment_data, las variantes responsive de gallery y el índice FTS5 de
+  SQLite se calculan aquí explícitamente.
+- patch_project aplica JSON Patch (RFC 6902). Si todas las operaciones son
+  "replace" dentro de content_sections/gallery se ejecutan en el servidor
+  (jsonb_set en PostgreSQL, json_set en SQLite) sin leer ni reescribir el
+  documento desde Python; el resto se aplica sobre el modelo y se valida.
+  Un elemento completo de gallery se enriquece con sus variantes antes del
+  jsonb_set; los cambios dentro de un elemento de gallery van por Python.
+- get_sections extrae un tramo de content_sections en la propia base de datos
+  (jsonb_array_elements WITH ORDINALITY / json_each), respetando FREEMIUM: los
+  anónimos solo ven las posiciones < free_sections_count.
+- Facetas: un único GROUP BY (GROUPING SETS en PostgreSQL, UNION ALL en el resto)
+  cacheado por worker. projects_bp lo invalida en cada escritura y el TTL
+  (PROJECT_FACETS_CACHE_TTL) acota el desfase en los demás workers.
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+from collections import defaultdict
+from datetime import datetime, timezone
+
+from flask import current_app
+from marshmallow import ValidationError
+import json
+
+from sqlalchemy import (
+    JSON,
+    Integer,
+    Text,
+    column,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    true,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import load_only, undefer_group
+from app.extensions import db
+from app.models.project import Project
+from app.models.search_index import reindex_sqlite_rows
+from app.schemas.project_schema import ProjectInputSchema, ProjectSchema
+from app.utils.cache import app_cache
+from app.utils.investment import derive_investment_columns
+from app.utils.json_patch import JsonPatchConflict, JsonPatchError, apply_patch, parse_pointer
+from app.utils.pagination import InvalidCursorError, decode_cursor, encode_cursor, keyset_after
+from app.utils.responsive_images import enrich_gallery
+from app.utils import slug_registry
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+VIEWS = ("summary", "full")
+
+# Columnas necesarias para ProjectSummarySchema y para construir el cursor
+SUMMARY_COLUMNS = (
+    Project.id,
+    Project.slug,
+    Project.title,
+    Project.subtitle,
+    Project.description,
+    Project.status,
+    Project.category,
+    Project.featured,
+    Project.priority,
+    Project.main_image_url,
+    Project.investment_data,
+    Project.views,
+    Project.created_at,
+)
+
+# Ordenaciones del listado (todas descendentes, el id desempata)
+SORTS = {
+    "priority": (Project.priority, Project.created_at, Project.id),
+    "created_at": (Project.created_at, Project.id),
+    "views": (Project.views, Project.id),
+}
+DEFAULT_SORT = "priority"
+
+# Variantes del detalle (sistema FREEMIUM)
+FULL_VARIANT = "full"
+FREE_VARIANT = "free"
+DEFAULT_FREE_SECTIONS = 5
+
+# Filtros por rango: nombre del filtro -> columna tipada
+RANGE_COLUMNS = {
+    "min_investment": Project.min_investment_cents,
+    "total_investment": Project.total_investment_cents,
+    "expected_return": Project.expected_return_bp,
+}
+
+# Dimensiones de las facetas del catálogo
+FACETS = ("category", "status", "featured")
+FACETS_CACHE_KEY = "catalogue"
+
+# Alta/actualización masiva
+MAX_BULK_ITEMS = 500
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+project_schema = ProjectSchema()
+input_schema = ProjectInputSchema()
+bulk_input_schema = ProjectInputSchema(many=True)
+
+# Carga diferida de secciones (GET /<slug>/sections)
+DEFAULT_SECTIONS_LIMIT = 5
+MAX_SECTIONS_LIMIT = 50
+
+# JSON Patch: campos modificables y los que admiten jsonb_set/json_set en servidor
+PATCHABLE_FIELDS = tuple(
+    name for name, field in input_schema.fields.items() if not field.dump_only and name != "slug"
+)
+SERVER_SIDE_PATCH_FIELDS = ("content_sections", "gallery")
+
+
+def _listing_query(view):
+    """Consulta base del listado con la proyección de columnas de la vista."""
+    if view == "full":
+        return Project.query.options(undefer_group("content"))
+    return Project.query.options(load_only(*SUMMARY_COLUMNS))
+
+
+def _jsonb_contains(column, values):
+    """column @> value para cada valor (OR): resuelto con el índice GIN jsonb_path_ops."""
+    return or_(*(column.op("@>")(literal(value, JSONB)) for value in values))
+
+
+def _section_type_filter(section_types):
+    if db.engine.dialect.name == "postgresql":
+        return _jsonb_contains(Project.content_sections, [[{"type": t}] for t in section_types])
+    sections = func.json_each(Project.content_sections).table_valued("value").alias("sections")
+    return exists(
+        select(1)
+        .select_from(sections)
+        .where(func.json_extract(sections.c.value, "$.type").in_(section_types))
+    )
+
+
+def _apply_filters(query, filters):
+    """Aplica los filtros del listado (claves ausentes o None se ignoran)."""
+    filters = filters or {}
+
+    if filters.get("category"):
+        query = query.filter(Project.category.in_(filters["category"]))
+    if filters.get("status"):
+        query = query.filter(Project.status.in_(filters["status"]))
+    if filters.get("featured") is not None:
+        query = query.filter(Project.featured == filters["featured"])
+    if filters.get("currency"):
+        query = query.filter(Project.currency.in_(filters["currency"]))
+    if filters.get("section_type"):
+        query = query.filter(_section_type_filter(filters["section_type"]))
+    for name, (low, high) in (filters.get("ranges") or {}).items():
+        column = RANGE_COLUMNS[name]
+        if low is not None:
+            query = query.filter(column >= low)
+        if high is not None:
+            query = query.filter(column <= high)
+
+    return query
+
+
+def _order_by(sort):
+    return tuple(column.desc() for column in SORTS[sort])
+
+
+def _facet_rows():
+    """Filas (dimensión, valor, count) de todas las facetas en una sola consulta."""
+    columns = [getattr(Project, name) for name in FACETS]
+    count = func.count(Project.id)
+
+    if db.engine.dialect.name == "postgresql":
+        groupings = [func.grouping(column) for column in columns]
+        rows = (
+            db.session.query(*columns, *groupings, count)
+            .group_by(func.grouping_sets(*columns))
+            .all()
+        )
+        result = []
+        for row in rows:
+            values, flags, total = row[:len(FACETS)], row[len(FACETS):-1], row[-1]
+            # GROUPING(col) = 0 indica la columna agrupada en ese conjunto
+            index = flags.index(0)
+            result.append((FACETS[index], values[index], total))
+        return result
+
+    selects = [
+        db.select(literal(name).label("facet"), column.label("value"), count)
+        .group_by(column)
+        for name, column in zip(FACETS, columns)
+    ]
+    return db.session.execute(union_all(*selects)).all()
+
+
+def _facets_cache():
+    return app_cache(
+        "project_facets",
+        maxsize=1,
+        ttl=current_app.config.get("PROJECT_FACETS_CACHE_TTL", 60),
+    )
+
+
+def _upsert_rows(items):
+    """Filas de inserción para el lote, con los campos derivados de investment_data y gallery."""
+    rows = []
+    for item in items:
+        row = dict(item)
+        if "investment_data" in row:
+            row.update(derive_investment_columns(row["investment_data"]))
+        if "gallery" in row:
+            row["gallery"] = enrich_gallery(row["gallery"])
+        rows.append(row)
+    return rows
+
+
+def _server_side_operations(operations):
+    """
+    Devuelve [(campo, segmentos, valor)] si el parche puede ejecutarse en el
+    servidor (solo "replace" dentro de un elemento de SERVER_SIDE_PATCH_FIELDS),
+    o None si debe aplicarse en Python.
+    """
+    if not isinstance(operations, list) or not operations:
+        return None
+
+    result = []
+    for operation in operations:
+        if not isinstance(operation, dict) or operation.get("op") != "replace" or "value" not in operation:
+            return None
+        parts = parse_pointer(operation.get("path"))
+        if len(parts) < 2 or parts[0] not in SERVER_SIDE_PATCH_FIELDS or not parts[1].isdigit():
+            return None
+        # Un elemento completo de la lista debe seguir siendo un objeto
+        if len(parts) == 2 and not isinstance(operation["value"], dict):
+            return None
+        value = operation["value"]
+        if parts[0] == "gallery":
+            # Las variantes responsive dependen del elemento completo
+            if len(parts) > 2:
+                return None
+            value = enrich_gallery([value])[0]
+        result.append((parts[0], parts[1:], value))
+    return result
+
+
+def _sqlite_json_path(parts):
+    return "$" + "".join(f"[{p}]" if p.isdigit() else f'."{p}"' for p in parts)
+
+
+def _json_set(dialect, column, parts, value):
+    if dialect == "postgresql":
+        return func.jsonb_set(column, literal(parts, ARRAY(Text)), literal(value, JSONB), False)
+    return func.json_set(column, _sqlite_json_path(parts), func.json(json.dumps(value)))
+
+
+def _json_path_exists(dialect, column, parts):
+    if dialect == "postgresql":
+        return column.op("#>")(literal(parts, ARRAY(Text))).isnot(None)
+    return func.json_type(column, _sqlite_json_path(parts)).isnot(None)
+
+
+def _patch_server_side(project_id, operations):
+    """UPDATE con jsonb_set/json_set encadenados; falla si alguna ruta no existe."""
+    dialect = db.engine.dialect.name
+    table = Project.__table__
+
+    values = {}
+    conditions = [table.c.id == project_id]
+    for name, parts, value in operations:
+        column = table.c[name]
+        values[name] = _json_set(dialect, values.get(name, column), parts, value)
+        conditions.append(_json_path_exists(dialect, column, parts))
+    values["updated_at"] = datetime.now(timezone.utc)
+
+    result = db.session.execute(update(table).where(*conditions).values(**values))
+    if result.rowcount == 0:
+        db.session.rollback()
+        raise JsonPatchConflict("Ruta inexistente en el proyecto")
+    reindex_sqlite_rows(db.session.connection(), "project", [project_id])
+
+
+def _patch_in_python(project_id, operations):
+    """Aplica el parche sobre los campos del modelo y valida el resultado."""
+    project = Project.query.options(undefer_group("content")).filter_by(id=project_id).one()
+    document = {name: getattr(project, name) for name in PATCHABLE_FIELDS}
+
+    patched = apply_patch(document, operations)
+    if not isinstance(patched, dict) or set(patched) - set(PATCHABLE_FIELDS):
+        raise JsonPatchError("El parche solo puede modificar campos del proyecto")
+
+    changes = {name: patched.get(name) for name in PATCHABLE_FIELDS if patched.get(name) != document[name]}
+    errors = input_schema.validate(changes, partial=True)
+    if errors:
+        raise ValidationError(errors)
+
+    for name, value in changes.items():
+        setattr(project, name, value)
+
+
+def _section_elements():
+    """
+    Elementos de content_sections como tabla (posición, valor, tipo) según el motor.
+    PostgreSQL: jsonb_array_elements WITH ORDINALITY; SQLite: json_each.
+    """
+    if db.engine.dialect.name == "postgresql":
+        elements = func.jsonb_array_elements(Project.content_sections).table_valued(
+            column("value", JSONB), with_ordinality="ordinality"
+        ).alias("sections")
+        return elements, elements.c.ordinality - 1, elements.c.value.op("->>")("type")
+
+    elements = func.json_each(Project.content_sections).table_valued(
+        column("key", Integer), column("value", JSON)
+    ).alias("sections")
+    return elements, elements.c.key, func.json_extract(elements.c.value, "$.type")
+
+
+def _sections_length():
+    if db.engine.dialect.name == "postgresql":
+        return func.jsonb_array_length(Project.content_sections)
+    return func.json_array_length(Project.content_sections)
+
+
+def _detail_cache():
+    """Caché de detalles serializados, acotada por entradas y por bytes."""
+    return app_cache(
+        "project_detail",
+        maxsize=current_app.config.get("PROJECT_CACHE_MAX_ENTRIES", 256),
+        maxbytes=current_app.config.get("PROJECT_CACHE_MAX_BYTES", 32 * 1024 * 1024),
+    )
+
+
+def _truncate_sections(payload, free_sections_count):
+    """Deja solo las secciones gratuitas y añade cuántas quedan bloqueadas."""
+    sections = payload.get("content_sections") or []
+    free = DEFAULT_FREE_SECTIONS if free_sections_count is None else max(free_sections_count, 0)
+    payload["content_sections"] = sections[:free]
+    payload["locked_sections"] = max(len(sections) - free, 0)
+    return payload
+
+
+class ProjectService:
+    @staticmethod
+    def get_all_projects(view="summary", filters=None, sort=DEFAULT_SORT):
+        """Devuelve todos los proyectos filtrados en el orden solicitado."""
+        query = _apply_filters(_listing_query(view), filters)
+        return query.order_by(*_order_by(sort)).all()
+
+    @staticmethod
+    def get_listing_version(include_views=False):
+        """
+        Devuelve (count, última modificación) del catálogo sin cargar filas.
+        Se usa para decidir un 304 en el listado antes de consultar proyectos.
+
+        include_views añade sum(views): el contador de visitas no modifica
+        updated_at, así que los listados que ordenan o muestran visitas deben
+        incluirlo en su versión.
+        """
+        version = func.coalesce(Project.updated_at, Project.created_at)
+        columns = [func.count(Project.id), func.max(version)]
+        if include_views:
+            columns.append(func.coalesce(func.sum(Project.views), 0))
+        return tuple(db.session.query(*columns).one())
+
+    @staticmethod
+    def get_facets():
+        """
+        Devuelve el número de proyectos por category, status y featured.
+
+        Returns:
+            dict: {"category": [{"value": ..., "count": n}, ...], "status": [...],
+                   "featured": [...], "total": n}. Cada lista va ordenada por count.
+        """
+        cache = _facets_cache()
+        facets = cache.get(FACETS_CACHE_KEY)
+        if facets is not None:
+            return facets
+
+        facets = {name: [] for name in FACETS}
+        for name, value, count in _facet_rows():
+            if name == "featured" and value is not None:
+                value = bool(value)  # SQLite devuelve 0/1 en el UNION
+            facets[name].append({"value": value, "count": count})
+        for name in FACETS:
+            facets[name].sort(key=lambda item: (-item["count"], str(item["value"])))
+        facets["total"] = sum(item["count"] for item in facets["status"])
+
+        cache.set(FACETS_CACHE_KEY, facets)
+        return facets
+
+    @staticmethod
+    def invalidate_facets():
+        """Descarta las facetas cacheadas en este worker (tras una escritura)."""
+        _facets_cache().clear()
+
+    @staticmethod
+    def get_project_by_slug(slug):
+        """Devuelve el proyecto completo (incluye el grupo "content") o None."""
+        return (
+            Project.query.options(undefer_group("content"))
+            .filter_by(slug=slug)
+            .first()
+        )
+
+    @staticmethod
+    def get_project_ref(slug):
+        """
+        Devuelve (id, version, free_sections_count) del proyecto sin cargar sus
+        JSON, o None si no existe. version = updated_at o, si falta, created_at.
+        Los slugs que el registro descarta solo se comprueban por el índice de slug.
+        """
+        if slug_registry.is_known_missing("project", slug):
+            return None
+
+        ref = (
+            db.session.query(
+                Project.id,
+                func.coalesce(Project.updated_at, Project.created_at).label("version"),
+                Project.free_sections_count,
+            )
+            .filter(Project.slug == slug)
+            .first()
+        )
+        if ref is None:
+            slug_registry.remember_missing("project", slug)
+        return ref
+
+    @staticmethod
+    def get_detail_body(slug, ref, variant):
+        """
+        Devuelve el detalle de la variante pedida ya serializado a JSON (bytes).
+        Solo se consulta, se serializa con Marshmallow y se codifica si la
+        variante no está en caché; un acierto no toca ni el schema ni el encoder.
+
+        Args:
+            slug: Slug del proyecto.
+            ref: Resultado de get_project_ref(slug).
+            variant: FULL_VARIANT o FREE_VARIANT.
+        """
+        cache = _detail_cache()
+        key = (ref.id, ref.version, variant)
+        body = cache.get(key)
+        if body is not None:
+            return body
+
+        project = ProjectService.get_project_by_slug(slug)
+        payload = project_schema.dump(project)
+        if variant == FREE_VARIANT:
+            payload = _truncate_sections(payload, project.free_sections_count)
+        else:
+            payload["locked_sections"] = 0
+
+        body = current_app.json.dumps_bytes(payload)
+        cache.set(key, body)
+        return body
+
+    @staticmethod
+    def invalidate_project(project_id):
+        """Descarta de este worker todas las versiones y variantes del detalle."""
+        _detail_cache().discard_where(lambda key: key[0] == project_id)
+
+    @staticmethod
+    def bulk_upsert(data):
+        """
+        Crea o actualiza (por slug) una lista de proyectos en una sola transacción.
+        Los elementos no válidos se omiten y se informan; el resto se aplica.
+
+        Args:
+            data: Lista de dicts con el formato de ProjectInputSchema.
+
+        Returns:
+            list[dict]: Un resultado por elemento, en el orden recibido:
+            {"index", "slug", "status": "created" | "updated" | "error", "id" | "errors"}
+        """
+        errors = bulk_input_schema.validate(data)
+        results = [None] * len(data)
+        valid = []
+        seen = set()
+        for index, item in enumerate(data):
+            slug = item.get("slug") if isinstance(item, dict) else None
+            if index in errors:
+                results[index] = {"index": index, "slug": slug, "status": "error", "errors": errors[index]}
+            elif slug in seen:
+                results[index] = {
+                    "index": index, "slug": slug, "status": "error",
+                    "errors": {"slug": ["Slug duplicado en el lote"]},
+                }
+            else:
+                seen.add(slug)
+                valid.append((index, item))
+
+        if not valid:
+            return results
+
+        existing = {
+            slug
+            for (slug,) in db.session.query(Project.slug).filter(Project.slug.in_(seen))
+        }
+
+        # Una sentencia por conjunto de campos: las filas de un INSERT multi-VALUES
+        # deben tener las mismas columnas, y el UPDATE solo toca los campos enviados
+        groups = defaultdict(list)
+        for index, item in valid:
+            groups[frozenset(item)].append((index, item))
+
+        insert = _UPSERT_INSERTS[db.engine.dialect.name]
+        table = Project.__table__
+        now = datetime.now(timezone.utc)  # ON CONFLICT no aplica el onupdate de Python
+        ids = {}
+        try:
+            for group in groups.values():
+                rows = _upsert_rows([item for _, item in group])
+                statement = insert(table).values(rows)
+                columns = set(rows[0]) - {"slug"}
+                statement = statement.on_conflict_do_update(
+                    index_elements=[table.c.slug],
+                    set_={
+                        **{name: statement.excluded[name] for name in columns},
+                        "updated_at": now,
+                    },
+                ).returning(table.c.id, table.c.slug)
+                ids.update({slug: project_id for project_id, slug in db.session.execute(statement)})
+
+            reindex_sqlite_rows(db.session.connection(), "project", ids.values())
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        # Las altas con Core no disparan los eventos del ORM que sincronizan el registro
+        slug_registry.invalidate("project")
+
+        for index, item in valid:
+            slug = item["slug"]
+            if slug in existing:
+                ProjectService.invalidate_project(ids[slug])
+            results[index] = {
+                "index": index,
+                "slug": slug,
+                "status": "updated" if slug in existing else "created",
+                "id": ids[slug],
+            }
+        return results
+
+    @staticmethod
+    def patch_project(project_id, operations):
+        """
+        Aplica un JSON Patch (RFC 6902) a un proyecto y confirma la transacción.
+
+        Raises:
+            JsonPatchError: Parche mal formado.
+            JsonPatchConflict: Ruta inexistente o "test" fallido.
+            ValidationError: El resultado no cumple ProjectInputSchema.
+        """
+        server_side = _server_side_operations(operations)
+        if server_side:
+            _patch_server_side(project_id, server_side)
+        else:
+            _patch_in_python(project_id, operations)
+
+        db.session.commit()
+        db.session.expire_all()
+        ProjectService.invalidate_project(project_id)
+
+    @staticmethod
+    def get_sections(ref, variant, offset=0, limit=DEFAULT_SECTIONS_LIMIT, types=None):
+        """
+        Devuelve un tramo de content_sections sin cargar el documento completo.
+
+        Args:
+            ref: Resultado de get_project_ref(slug).
+            variant: FULL_VARIANT o FREE_VARIANT (limita las posiciones visibles).
+            offset: Número de secciones (visibles y del tipo pedido) a saltar.
+            limit: Máximo de secciones devueltas (se acota a MAX_SECTIONS_LIMIT).
+            types: Lista opcional de tipos de sección.
+
+        Returns:
+            dict: {"items": [{"index", "section"}], "total", "offset", "limit",
+                   "next_offset", "locked_sections"}
+        """
+        limit = min(max(limit or DEFAULT_SECTIONS_LIMIT, 1), MAX_SECTIONS_LIMIT)
+        offset = max(offset or 0, 0)
+        elements, position, section_type = _section_elements()
+
+        conditions = [Project.id == ref.id]
+        if types:
+            conditions.append(section_type.in_(types))
+
+        locked = 0
+        if variant == FREE_VARIANT:
+            free = DEFAULT_FREE_SECTIONS if ref.free_sections_count is None else max(ref.free_sections_count, 0)
+            conditions.append(position < free)
+            length = db.session.query(_sections_length()).filter(Project.id == ref.id).scalar() or 0
+            locked = max(length - free, 0)
+
+        base = select(Project.id).select_from(Project).join(elements, true()).where(*conditions)
+        total = db.session.scalar(select(func.count()).select_from(base.subquery()))
+
+        rows = db.session.execute(
+            select(position.label("index"), elements.c.value)
+            .select_from(Project)
+            .join(elements, true())
+            .where(*conditions)
+            .order_by(position)
+            .offset(offset)
+            .limit(limit)
+        ).all()
+
+        next_offset = offset + limit if offset + limit < total else None
+        return {
+            "items": [{"index": index, "section": section} for index, section in rows],
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "next_offset": next_offset,
+            "locked_sections": locked,
+        }
+
+    @staticmethod
+    def get_projects_page(limit=None, cursor=None, view="summary", filters=None, sort=DEFAULT_SORT):
+        """
+        Devuelve una página de proyectos paginada por cursor.
+
+        Args:
+            limit: Tamaño de página solicitado (se acota a MAX_PAGE_SIZE).
+            cursor: Cursor opaco devuelto en la página anterior (opcional).
+            view: "summary" (columnas de tarjeta) o "full" (modelo completo).
+            filters: dict con category, status, currency y section_type (listas),
+                featured (bool) y ranges ({nombre: (mínimo, máximo)} en céntimos/bp).
+            sort: Clave de SORTS.
+
+        Returns:
+            dict: {"projects": [...], "next_cursor": str | None, "limit": int}
+
+        Raises:
+            InvalidCursorError: Si el cursor no es válido.
+        """
+        limit = min(max(limit or DEFAULT_PAGE_SIZE, 1), MAX_PAGE_SIZE)
+        columns = SORTS[sort]
+
+        query = _apply_filters(_listing_query(view), filters)
+        if cursor:
+            cursor_sort, *values = decode_cursor(cursor, len(columns) + 1)
+            if cursor_sort != sort:
+                raise InvalidCursorError("Cursor inválido")
+            query = query.filter(keyset_after(columns, values))
+
+        # Se pide una fila extra para saber si existe página siguiente
+        rows = query.order_by(*_order_by(sort)).limit(limit + 1).all()
+        projects = rows[:limit]
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = projects[-1]
+            next_cursor = encode_cursor([sort] + [getattr(last, c.key) for c in columns])
+
+        return {
+            "projects": projects,
+            "next_cursor": next_cursor,
+            "limit": limit,
+        }
@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""
+recommendation_service.py — Artículos similares por TF-IDF.
+
+Contexto:
+Article.related es una lista manual de slugs y muchos artículos la dejan vacía.
+Este servicio calcula la similitud coseno entre los vectores TF-IDF (título,
+palabras clave y plain_text) y guarda los SIMILAR_LIMIT vecinos de cada artículo
+en article_similarities, que el detalle consulta con ?include=related.
+
+Si NumPy/SciPy están instalados, la matriz TF-IDF es una scipy.sparse.csr_matrix
+y la similitud se obtiene con un producto disperso; si no, se usa una
+implementación equivalente con diccionarios (mismos resultados, más lenta).
+La reconstrucción completa nunca materializa la matriz densa N×N: el producto
+X @ X.T se calcula por bloques de SIMILARITY_CHUNK_SIZE filas y de cada fila
+dispersa solo se conservan los SIMILAR_LIMIT mejores.
+
+Notas de mantenimiento:
+- build_similarities() recalcula todo (flask data build-similarities).
+- Las escrituras no calculan nada: ArticleService marca similarity_pending en
+  altas y cambios de título, palabras clave o contenido, y
+  refresh_pending() (flask data refresh-similarities, p. ej. cada minuto por
+  cron) los procesa fuera de la petición con una sola vectorización del corpus.
+- El refresco es incremental: puntúa solo el artículo pendiente contra el
+  corpus (un producto de una fila), reescribe su fila y actualiza su par en los
+  artículos a los que entra o que ya lo tenían como vecino. Las filas del resto
+  no se recalculan, así que sus scores conservan la IDF de su último cálculo y,
+  si el artículo sale del top-N de otro (o se borra), ese otro queda con menos
+  vecinos hasta la siguiente reconstrucción completa; conviene programar
+  también flask data build-similarities periódicamente.
+- remove_article() solo borra filas y no hace commit: ArticleService lo ejecuta
+  dentro de la transacción del borrado.
+- Solo se guardan pares con score > 0.
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+import math
+import re
+from collections import Counter
+
+from sqlalchemy import delete, func, or_, update
+
+from app.extensions import db
+from app.models.article import Article
+from app.models.article_similarity import ArticleSimilarity
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:  # pragma: no cover - dependencia opcional
+    np = None
+    sparse = None
+
+SIMILAR_LIMIT = 5
+SIMILARITY_CHUNK_SIZE = 256
+
+_TOKEN_RE = re.compile(r"[^\W\d_]{3,}", re.UNICODE)
+STOPWORDS = frozenset("""
+    aún como con cual cuando del desde donde durante ella ellas ello ellos entre era
+    eran eres esa esas ese eso esos esta estas este esto estos está están fue fueron
+    hace hacia han has hasta hay los las más mas muy nos nuestra nuestro otra otras
+    otro otros para pero por porque puede pueden que qué sea sean ser sin sobre son
+    sus también tan tanto tiene tienen todo todos una uno unos unas usted ustedes
+""".split())
+
+
+def _tokens(text):
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if t not in STOPWORDS]
+
+
+def _load_corpus():
+    """Devuelve (ids, listas de tokens) de todos los artículos."""
+    rows = db.session.execute(
+        db.select(Article.id, Article.title, Article.meta_keywords, Article.plain_text)
+        .order_by(Article.id)
+    ).all()
+    ids = [row.id for row in rows]
+    # El título y las palabras clave pesan el doble que el cuerpo
+    docs = [
+        _tokens(" ".join(filter(None, (row.title, row.meta_keywords)))) * 2 + _tokens(row.plain_text)
+        for row in rows
+    ]
+    return ids, docs
+
+
+class _SparseModel:
+    """TF-IDF con scipy.sparse: filas normalizadas L2, similitud = X @ X[i].T."""
+
+    def __init__(self, docs):
+        vocabulary = {}
+        indptr, indices, data = [0], [], []
+        for doc in docs:
+            for term, count in Counter(doc).items():
+                indices.append(vocabulary.setdefault(term, len(vocabulary)))
+                data.append(1.0 + math.log(count))  # tf sublineal
+            indptr.append(len(indices))
+
+        matrix = sparse.csr_matrix(
+            (np.asarray(data), np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(docs), len(vocabulary)),
+        )
+        df = np.bincount(matrix.indices, minlength=len(vocabulary))
+        idf = np.log((1 + len(docs)) / (1 + df)) + 1.0
+        matrix = matrix @ sparse.diags(idf)
+
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        self.matrix = sparse.csr_matrix(sparse.diags(1.0 / norms) @ matrix)
+
+    def scores(self, index):
+        return (self.matrix @ self.matrix[index].T).toarray().ravel()
+
+    def neighbours(self, ids, limit=SIMILAR_LIMIT, chunk_size=SIMILARITY_CHUNK_SIZE):
+        """Genera (índice, vecinos) de cada fila calculando X @ X.T por bloques dispersos."""
+        transposed = self.matrix.T.tocsc()
+        for start in range(0, self.matrix.shape[0], chunk_size):
+            block = sparse.csr_matrix(self.matrix[start:start + chunk_size] @ transposed)
+            for offset in range(block.shape[0]):
+                begin, end = block.indptr[offset], block.indptr[offset + 1]
+                candidates = zip(block.indices[begin:end], block.data[begin:end])
+                yield start + offset, _best(ids, start + offset, candidates, limit)
+
+
+class _DictModel:
+    """Misma TF-IDF con diccionarios, para entornos sin NumPy/SciPy."""
+
+    def __init__(self, docs):
+        counts = [Counter(doc) for doc in docs]
+        df = Counter(term for doc in counts for term in doc)
+        idf = {term: math.log((1 + len(docs)) / (1 + n)) + 1.0 for term, n in df.items()}
+
+        self.vectors = []
+        for doc in counts:
+            vector = {term: (1.0 + math.log(count)) * idf[term] for term, count in doc.items()}
+            norm = math.sqrt(sum(v * v for v in vector.values())) or 1.0
+            self.vectors.append({term: v / norm for term, v in vector.items()})
+
+    def scores(self, index):
+        target = self.vectors[index]
+        return [
+            sum(weight * vector.get(term, 0.0) for term, weight in target.items())
+            for vector in self.vectors
+        ]
+
+    def neighbours(self, ids, limit=SIMILAR_LIMIT, chunk_size=None):
+        """Genera (índice, vecinos) de cada fila, como _SparseModel.neighbours."""
+        for index in range(len(self.vectors)):
+            yield index, _top_neighbours(ids, index, self.scores(index), limit)
+
+
+def _model(docs):
+    if sparse is not None and any(docs):
+        return _SparseModel(docs)
+    return _DictModel(docs)
+
+
+def _best(ids, index, candidates, limit):
+    """[(related_id, score)] de los `limit` mejores pares (posición, score), sin el propio artículo."""
+    best = [
+        (ids[other], float(score))
+        for other, score in candidates
+        if other != index and score > 0
+    ]
+    best.sort(key=lambda item: (-item[1], item[0]))
+    return best[:limit]
+
+
+def _top_neighbours(ids, index, scores, limit=SIMILAR_LIMIT):
+    """[(related_id, score)] de los `limit` artículos más parecidos a ids[index]."""
+    return _best(ids, index, enumerate(scores), limit)
+
+
+def _merge_neighbour(existing, article_id, score, limit=SIMILAR_LIMIT):
+    """Top-N `existing` con el par (article_id, score) actualizado (o quitado si score es 0)."""
+    merged = [(related_id, value) for related_id, value in existing if related_id != article_id]
+    if score > 0:
+        merged.append((article_id, score))
+    merged.sort(key=lambda item: (-item[1], item[0]))
+    return merged[:limit]
+
+
+def _refresh(ids, model, index):
+    """
+    Puntúa solo ids[index] contra el corpus ya vectorizado: reescribe su fila y,
+    en los artículos a los que entra o que ya lo tenían como vecino, solo su par.
+    """
+    article_id = ids[index]
+    scores = model.scores(index)
+    neighbours = {article_id: _top_neighbours(ids, index, scores)}
+    new_scores = {
+        ids[other]: float(score)
+        for other, score in enumerate(scores)
+        if other != index and score > 0
+    }
+
+    # Recuento y umbral (score mínimo) del top-N actual de los demás artículos
+    holders = set(db.session.scalars(
+        db.select(ArticleSimilarity.article_id).where(ArticleSimilarity.related_id == article_id)
+    ))
+    stats = db.session.execute(
+        db.select(
+            ArticleSimilarity.article_id,
+            func.count(),
+            func.min(ArticleSimilarity.score),
+        )
+        .where(ArticleSimilarity.article_id != article_id)
+        .group_by(ArticleSimilarity.article_id)
+    ).all()
+    thresholds = {row[0]: (row[1], row[2]) for row in stats}
+    enters = {
+        other_id
+        for other_id, score in new_scores.items()
+        if other_id not in thresholds
+        or thresholds[other_id][0] < SIMILAR_LIMIT
+        or score > thresholds[other_id][1]
+    }
+
+    affected = sorted(holders | enters)
+    for chunk_start in range(0, len(affected), SIMILARITY_CHUNK_SIZE):
+        chunk = affected[chunk_start:chunk_start + SIMILARITY_CHUNK_SIZE]
+        current = {other_id: [] for other_id in chunk}
+        for row in ArticleSimilarity.query.filter(ArticleSimilarity.article_id.in_(chunk)):
+            current[row.article_id].append((row.related_id, row.score))
+        for other_id, existing in current.items():
+            neighbours[other_id] = _merge_neighbour(existing, article_id, new_scores.get(other_id, 0.0))
+
+    _replace_rows([article_id] + affected, neighbours)
+    return 1 + len(affected)
+
+
+def _clear_pending(condition):
+    """Desmarca similarity_pending sin tocar updated_at (los vecinos no son contenido)."""
+    db.session.execute(
+        update(Article)
+        .where(condition)
+        .values(similarity_pending=False, updated_at=Article.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _replace_rows(article_ids, neighbours):
+    """Sustituye las filas de article_ids por las de neighbours ({id: [(related_id, score)]})."""
+    if not article_ids:
+        return
+    db.session.execute(
+        delete(ArticleSimilarity).where(ArticleSimilarity.article_id.in_(article_ids))
+    )
+    rows = [
+        {"article_id": article_id, "related_id": related_id, "score": score}
+        for article_id in article_ids
+        for related_id, score in neighbours.get(article_id, ())
+    ]
+    if rows:
+        db.session.execute(db.insert(ArticleSimilarity), rows)
+
+
+class RecommendationService:
+    @staticmethod
+    def build_similarities():
+        """
+        Recalcula los vecinos de todos los artículos.
+
+        Returns:
+            int: Número de artículos procesados.
+        """
+        _clear_pending(Article.similarity_pending.is_(True))
+        ids, docs = _load_corpus()
+        db.session.execute(delete(ArticleSimilarity))
+        if ids:
+            neighbours = {
+                ids[index]: rows for index, rows in _model(docs).neighbours(ids)
+            }
+            _replace_rows(ids, neighbours)
+        db.session.commit()
+        return len(ids)
+
+    @staticmethod
+    def refresh_pending():
+        """
+        Recalcula los vecinos de los artículos con similarity_pending (altas y
+        cambios de contenido) con una sola carga del corpus para todo el lote.
+
+        Returns:
+            int: Número de artículos pendientes procesados.
+        """
+        pending = db.session.scalars(
+            db.select(Article.id).where(Article.similarity_pending.is_(True)).order_by(Article.id)
+        ).all()
+        if not pending:
+            return 0
+
+        # Se desmarcan antes de leer el corpus: una escritura posterior los vuelve a marcar
+        _clear_pending(Article.id.in_(pending))
+        ids, docs = _load_corpus()
+        if ids:
+            model = _model(docs)
+            position = {article_id: index for index, article_id in enumerate(ids)}
+            for article_id in pending:
+                if article_id in position:
+                    _refresh(ids, model, position[article_id])
+        db.session.commit()
+        return len(pending)
+
+    @staticmethod
+    def refresh_article(article_id):
+        """Recalcula los vecinos de un único artículo (sin commit)."""
+        ids, docs = _load_corpus()
+        if article_id not in ids:
+            return RecommendationService.remove_article(article_id)
+        return _refresh(ids, _model(docs), ids.index(article_id))
+
+    @staticmethod
+    def remove_article(article_id):
+        """Elimina las filas de un artículo borrado y sus pares en los demás artículos."""
+        holders = db.session.scalars(
+            db.select(ArticleSimilarity.article_id).where(ArticleSimilarity.related_id == article_id)
+        ).all()
+        db.session.execute(
+            delete(ArticleSimilarity).where(
+                or_(
+                    ArticleSimilarity.article_id == article_id,
+                    ArticleSimilarity.related_id == article_id,
+                )
+            )
+        )
+        return len(holders)
+
+    @staticmethod
+    def get_similar_ids(article_id, limit=SIMILAR_LIMIT):
+        """Ids de los artículos más parecidos, de mayor a menor similitud."""
+        rows = (
+            db.session.query(ArticleSimilarity.related_id)
+            .filter(ArticleSimilarity.article_id == article_id)
+            .order_by(ArticleSimilarity.score.desc(), ArticleSimilarity.related_id)
+            .limit(limit)
+            .all()
+        )
+        return [row.related_id for row in rows]
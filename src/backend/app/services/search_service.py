@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+search_service.py — Búsqueda de texto completo sobre artículos y proyectos.
+
+Contexto:
+En PostgreSQL se consulta la columna search_vector (índice GIN) con
+websearch_to_tsquery y la configuración es_unaccent, y los resultados se ordenan
+con ts_rank_cd. En SQLite (tests) se consulta la tabla FTS5 search_index con
+bm25. Los dos motores devuelven el mismo formato de resultado.
+
+Notas de mantenimiento:
+- Ninguna consulta recalcula vectores: se usan los mantenidos por triggers/eventos.
+- En FTS5 la entrada del usuario se reduce a términos entre comillas (AND implícito)
+  para que operadores o comillas sueltas no provoquen errores de sintaxis.
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+import re
+
+from sqlalchemy import desc, func, literal, literal_column, select, text, union_all
+
+from app.extensions import db
+from app.models.article import Article
+from app.models.project import Project
+from app.models.search_index import SEARCH_CONFIG, SQLITE_TABLE
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 50
+
+KINDS = ("project", "article")
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+# Modelo y columna usada como extracto de cada tipo buscable
+SOURCES = {
+    "project": (Project, Project.description),
+    "article": (Article, Article.excerpt),
+}
+
+
+def _result(kind, entity_id, slug, title, excerpt, rank):
+    return {
+        "type": kind,
+        "id": entity_id,
+        "slug": slug,
+        "title": title,
+        "excerpt": excerpt,
+        "rank": round(float(rank), 6),
+    }
+
+
+class SearchService:
+    @staticmethod
+    def search(q, kinds=KINDS, limit=DEFAULT_LIMIT):
+        """
+        Busca `q` en los tipos indicados.
+
+        Args:
+            q: Texto libre del usuario.
+            kinds: Subconjunto de KINDS.
+            limit: Número máximo de resultados (se acota a MAX_LIMIT).
+
+        Returns:
+            list[dict]: Resultados ordenados por relevancia descendente.
+        """
+        limit = min(max(limit or DEFAULT_LIMIT, 1), MAX_LIMIT)
+        if db.engine.dialect.name == "postgresql":
+            return SearchService._search_postgres(q, kinds, limit)
+        return SearchService._search_sqlite(q, kinds, limit)
+
+    @staticmethod
+    def _search_postgres(q, kinds, limit):
+        tsquery = func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'::regconfig"), q)
+
+        selects = []
+        for kind in kinds:
+            model, excerpt = SOURCES[kind]
+            selects.append(
+                select(
+                    literal(kind).label("type"),
+                    model.id,
+                    model.slug,
+                    model.title,
+                    excerpt.label("excerpt"),
+                    func.ts_rank_cd(model.search_vector, tsquery).label("rank"),
+                ).where(model.search_vector.op("@@")(tsquery))
+            )
+
+        query = union_all(*selects).order_by(desc("rank")).limit(limit)
+        return [_result(*row) for row in db.session.execute(query)]
+
+    @staticmethod
+    def _search_sqlite(q, kinds, limit):
+        terms = _TERM_RE.findall(q)
+        if not terms:
+            return []
+        match = " ".join(f'"{term}"' for term in terms)
+
+        placeholders = ", ".join(f":kind_{i}" for i in range(len(kinds)))
+        params = {f"kind_{i}": kind for i, kind in enumerate(kinds)}
+        hits = db.session.execute(
+            text(
+                f"SELECT kind, ref_id, bm25({SQLITE_TABLE}, 0, 0, 10.0, 1.0) AS score "
+                f"FROM {SQLITE_TABLE} WHERE {SQLITE_TABLE} MATCH :match "
+                f"AND kind IN ({placeholders}) ORDER BY score LIMIT :limit"
+            ),
+            {"match": match, "limit": limit, **params},
+        ).all()
+
+        rows = {}
+        for kind in {kind for kind, _, _ in hits}:
+            model, excerpt = SOURCES[kind]
+            ids = [ref_id for hit_kind, ref_id, _ in hits if hit_kind == kind]
+            for row in db.session.execute(
+                select(model.id, model.slug, model.title, excerpt).where(model.id.in_(ids))
+            ):
+                rows[(kind, row[0])] = row
+
+        # bm25 es menor cuanto más relevante: se invierte el signo
+        return [
+            _result(kind, *rows[(kind, ref_id)], -score)
+            for kind, ref_id, score in hits
+            if (kind, ref_id) in rows
+        ]
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+view_counter.py — Contador de visitas de proyectos con escritura diferida (write-behind).
+
+Contexto:
+Incrementar projects.views en cada visita al detalle convertiría la lectura más
+frecuente de la API en una escritura con bloqueo de fila. En su lugar, cada worker
+acumula los incrementos en memoria y los vuelca por lotes:
+- cada VIEW_COUNTER_FLUSH_INTERVAL segundos (hilo en segundo plano), o
+- al alcanzar VIEW_COUNTER_FLUSH_THRESHOLD visitas pendientes.
+
+Cada volcado es una única sentencia:
+    UPDATE projects SET views = projects.views + v.delta
+    FROM (VALUES (...), (...)) AS v(id, delta) WHERE projects.id = v.id
+En SQLite (tests) se usa un executemany equivalente.
+
+Notas de mantenimiento:
+- Si un volcado falla, los incrementos vuelven al buffer y se reintentan en el
+  siguiente ciclo. Al terminar el proceso (atexit) se hace un último volcado.
+- El hilo se arranca de forma perezosa en la primera visita y se recrea tras un
+  fork (gunicorn --preload), porque los hilos no sobreviven al fork.
+- No modifica updated_at: contar visitas no cambia la versión del contenido
+  (ETag y cachés siguen siendo válidos).
+- flush_views(app) fuerza el volcado (tests). Un comando CLI no serviría: se
+  ejecuta en otro proceso, con su propio buffer vacío.
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+import atexit
+import logging
+import os
+import threading
+from collections import Counter
+
+from flask import current_app
+from sqlalchemy import text
+
+from app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+EXTENSION_KEY = "view_counter"
+
+
+class ViewBuffer:
+    """Buffer de incrementos de visitas de un worker para una app concreta."""
+
+    def __init__(self, app):
+        self.app = app
+        self.flush_interval = app.config.get("VIEW_COUNTER_FLUSH_INTERVAL", 10)
+        self.flush_threshold = app.config.get("VIEW_COUNTER_FLUSH_THRESHOLD", 200)
+        self._pending = Counter()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def record(self, project_id, count=1):
+        """Acumula una visita; dispara el volcado si se supera el umbral."""
+        with self._lock:
+            self._pending[project_id] += count
+            pending = sum(self._pending.values())
+
+        if self.flush_interval:
+            self._ensure_thread()
+            if pending >= self.flush_threshold:
+                self._wakeup.set()
+        elif pending >= self.flush_threshold:
+            self.flush()
+
+    def pending(self):
+        """Copia de los incrementos pendientes (id -> delta)."""
+        with self._lock:
+            return dict(self._pending)
+
+    def flush(self):
+        """
+        Vuelca los incrementos pendientes en una única sentencia.
+
+        Returns:
+            int: Número de proyectos actualizados.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, Counter()
+            if not batch:
+                return 0
+
+            try:
+                with self.app.app_context():
+                    _apply_batch(batch)
+            except Exception:
+                # Se devuelven al buffer para el siguiente intento
+                with self._lock:
+                    self._pending.update(batch)
+                logger.exception("Error volcando %d contadores de visitas", len(batch))
+                raise
+            return len(batch)
+
+    def flush_on_exit(self):
+        """Volcado final al terminar el proceso (no propaga errores)."""
+        try:
+            self.flush()
+        except Exception:
+            logger.error("Se pierden %d visitas sin volcar al terminar", sum(self.pending().values()))
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="view-counter-flush", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                pass  # ya registrado; se reintenta en el siguiente ciclo
+
+
+def _apply_batch(batch):
+    """Ejecuta el UPDATE por lotes en una transacción propia."""
+    items = sorted(batch.items())  # orden estable de bloqueo de filas
+
+    with db.engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            rows = ", ".join(f"(:id_{i}, :delta_{i})" for i in range(len(items)))
+            params = {}
+            for i, (project_id, delta) in enumerate(items):
+                params[f"id_{i}"] = project_id
+                params[f"delta_{i}"] = delta
+            conn.execute(
+                text(
+                    "UPDATE projects SET views = projects.views + v.delta "
+                    f"FROM (VALUES {rows}) AS v(id, delta) "
+                    "WHERE projects.id = v.id"
+                ),
+                params,
+            )
+        else:
+            conn.execute(
+                text("UPDATE projects SET views = views + :delta WHERE id = :id"),
+                [{"id": project_id, "delta": delta} for project_id, delta in items],
+            )
+
+
+def init_app(app):
+    """Registra el buffer de visitas de la app y su volcado al terminar."""
+    buffer = ViewBuffer(app)
+    app.extensions[EXTENSION_KEY] = buffer
+    atexit.register(buffer.flush_on_exit)
+
+
+def record_view(project_id, app=None):
+    """Registra una visita al detalle de un proyecto."""
+    _get_buffer(app).record(project_id)
+
+
+def flush_views(app=None):
+    """Fuerza el volcado de las visitas pendientes. Devuelve proyectos actualizados."""
+    return _get_buffer(app).flush()
+
+
+def _get_buffer(app=None):
+    app = app or current_app
+    return app.extensions[EXTENSION_KEY]
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+article_content.py — Procesado del HTML de los artículos al escribirlos.
+
+Contexto:
+El excerpt se obtenía quitando etiquetas con la regex <.*?> y el frontend
+recalculaba el tiempo de lectura en cada render. process_content recorre el HTML
+una sola vez con HTMLParser (en streaming, sin construir un árbol) y devuelve
+los campos derivados que Article guarda en columnas propias: texto plano, número
+de palabras, minutos de lectura, índice de h2/h3 con anclas y cuerpo saneado.
+
+Notas de mantenimiento:
+- Article lo invoca desde @validates("content"): creación, actualización e
+  importación JSON quedan cubiertas sin llamadas explícitas.
+- El saneado es por lista blanca (ALLOWED_TAGS / ALLOWED_ATTRIBUTES); script y
+  style se descartan con su contenido. Los href/src con esquema distinto de
+  http(s), mailto o tel se eliminan.
+- Los h2/h3 sin id reciben uno a partir de su texto (create_slug), único dentro
+  del artículo; si ya tienen id se respeta.
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+import math
+from html import escape
+from html.parser import HTMLParser
+
+from app.schemas.article_schema import WORDS_PER_MINUTE, create_slug
+
+ALLOWED_TAGS = {
+    "a", "b", "blockquote", "br", "code", "div", "em", "figcaption", "figure",
+    "h1", "h2", "h3", "h4", "h5", "h6", "hr", "i", "img", "li", "ol", "p", "pre",
+    "span", "strong", "sub", "sup", "table", "tbody", "td", "th", "thead", "tr", "u", "ul",
+}
+ALLOWED_ATTRIBUTES = {"alt", "class", "height", "href", "id", "rel", "src", "target", "title", "width"}
+URL_ATTRIBUTES = {"href", "src"}
+SAFE_URL_SCHEMES = ("http:", "https:", "mailto:", "tel:")
+VOID_TAGS = {"br", "hr", "img"}
+DROPPED_CONTENT_TAGS = {"script", "style", "iframe", "object", "embed", "noscript", "template"}
+TOC_TAGS = ("h2", "h3")
+
+# Etiquetas de bloque: separan palabras en el texto plano
+BLOCK_TAGS = {
+    "blockquote", "br", "div", "figcaption", "figure", "h1", "h2", "h3", "h4", "h5",
+    "h6", "hr", "li", "p", "pre", "td", "th", "tr",
+}
+
+
+def _safe_url(value):
+    url = value.strip()
+    scheme = url.split("/", 1)[0].lower()
+    # URLs relativas (sin ":" antes de la primera "/") o con esquema permitido
+    return ":" not in scheme or scheme.startswith(SAFE_URL_SCHEMES)
+
+
+class _ContentParser(HTMLParser):
+    """Recorre el HTML una vez: extrae texto, índice y cuerpo saneado."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.text = []
+        self.html = []
+        self.toc = []
+        self._ids = set()
+        self._dropping = 0
+        self._open = []
+        # Encabezado en curso: (tag, attrs, posiciones en self.html, self.text y self._open)
+        self._heading = None
+
+    def _attrs(self, attrs):
+        parts = []
+        for name, value in attrs:
+            name = name.lower()
+            if name not in ALLOWED_ATTRIBUTES or value is None:
+                continue
+            if name in URL_ATTRIBUTES and not _safe_url(value):
+                continue
+            parts.append(f' {name}="{escape(value, quote=True)}"')
+        return "".join(parts)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in DROPPED_CONTENT_TAGS:
+            self._dropping += 1
+            return
+        if self._dropping:
+            return
+        if tag in BLOCK_TAGS:
+            self.text.append(" ")
+        if tag not in ALLOWED_TAGS:
+            return
+
+        if tag in TOC_TAGS and self._heading is None:
+            self._heading = (tag, attrs, len(self.html), len(self.text), len(self._open))
+            return
+
+        self.html.append(f"<{tag}{self._attrs(attrs)}>")
+        if tag not in VOID_TAGS:
+            self._open.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in DROPPED_CONTENT_TAGS:
+            return
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS and tag in ALLOWED_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in DROPPED_CONTENT_TAGS:
+            self._dropping = max(self._dropping - 1, 0)
+            return
+        if self._dropping:
+            return
+        if tag in BLOCK_TAGS:
+            self.text.append(" ")
+
+        if self._heading is not None and tag == self._heading[0]:
+            self._close_heading()
+            return
+        if tag in self._open:
+            # Cierra también las etiquetas que quedaron abiertas dentro
+            while self._open:
+                open_tag = self._open.pop()
+                self.html.append(f"</{open_tag}>")
+                if open_tag == tag:
+                    break
+
+    def handle_data(self, data):
+        if self._dropping:
+            return
+        self.text.append(data)
+        self.html.append(escape(data, quote=False))
+
+    def _close_heading(self):
+        tag, attrs, html_start, text_start, open_depth = self._heading
+        self._heading = None
+        while len(self._open) > open_depth:
+            self.html.append(f"</{self._open.pop()}>")
+
+        title = " ".join("".join(self.text[text_start:]).split())
+        anchor = dict((name.lower(), value) for name, value in attrs).get("id")
+        if not anchor:
+            anchor = base = create_slug(title) or tag
+            suffix = 2
+            while anchor in self._ids:
+                anchor = f"{base}-{suffix}"
+                suffix += 1
+            attrs = [(name, value) for name, value in attrs if name.lower() != "id"]
+            attrs.append(("id", anchor))
+        self._ids.add(anchor)
+
+        self.html.insert(html_start, f"<{tag}{self._attrs(attrs)}>")
+        self.html.append(f"</{tag}>")
+        if title:
+            self.toc.append({"id": anchor, "text": title, "level": int(tag[1])})
+
+    def close(self):
+        super().close()
+        if self._heading is not None:
+            self._close_heading()
+        while self._open:
+            self.html.append(f"</{self._open.pop()}>")
+
+
+def process_content(content):
+    """
+    Calcula los campos derivados del HTML de un artículo.
+
+    Returns:
+        dict: plain_text, word_count, reading_time (minutos), toc
+        ([{"id", "text", "level"}]) y content_html (cuerpo saneado con anclas).
+    """
+    parser = _ContentParser()
+    parser.feed(content or "")
+    parser.close()
+
+    plain_text = " ".join("".join(parser.text).split())
+    word_count = len(plain_text.split())
+    return {
+        "plain_text": plain_text,
+        "word_count": word_count,
+        "reading_time": max(math.ceil(word_count / WORDS_PER_MINUTE), 1),
+        "toc": parser.toc,
+        "content_html": "".join(parser.html),
+    }
+
+
+def make_excerpt(plain_text, length=150):
+    """Extracto por defecto a partir del texto plano."""
+    return plain_text[:length] + "..." if len(plain_text) > length else plain_text
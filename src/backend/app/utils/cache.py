@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+cache.py — Caché en memoria por proceso (LRU con TTL opcional).
+
+Contexto:
+Varias lecturas públicas (detalle de proyectos, facetas, listados) sirven el mismo
+contenido miles de veces entre dos modificaciones. Esta caché evita repetir la
+consulta y la serialización dentro de cada worker de gunicorn.
+
+Notas de mantenimiento:
+- Thread-safe: los workers pueden usar hilos (gthread).
+- Cada instancia de Flask tiene sus propias cachés (app.extensions), de modo que
+  apps distintas en el mismo proceso (tests) no comparten entradas.
+- No es una caché compartida entre workers: las claves deben incluir la versión
+  del contenido (p. ej. updated_at) o usar un TTL corto.
+- Con maxbytes (y sizeof) la caché también se acota por memoria: se expulsan las
+  entradas menos usadas hasta quedar por debajo del límite.
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Caché LRU thread-safe con número máximo de entradas, memoria máxima y TTL opcionales."""
+
+    def __init__(self, maxsize=256, ttl=None, maxbytes=None, sizeof=len):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self.currbytes = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        size = self.sizeof(value) if self.maxbytes else 0
+        if self.maxbytes and size > self.maxbytes:
+            return  # nunca cabría: no se expulsa toda la caché por una entrada
+        with self._lock:
+            self._remove(key)
+            self._data[key] = (value, expires_at)
+            self.currbytes += size
+            while len(self._data) > self.maxsize or (
+                self.maxbytes and self.currbytes > self.maxbytes
+            ):
+                self._remove(next(iter(self._data)))
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._remove(key)
+        return default if entry is _MISSING else entry[0]
+
+    def discard_where(self, predicate):
+        """Elimina las entradas cuya clave cumple predicate. Devuelve cuántas."""
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.currbytes = 0
+
+    def _remove(self, key):
+        """Elimina una entrada con el lock ya adquirido, actualizando currbytes."""
+        entry = self._data.pop(key, _MISSING)
+        if entry is not _MISSING and self.maxbytes:
+            self.currbytes -= self.sizeof(entry[0])
+        return entry
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+
+def app_cache(name, **options) -> LRUCache:
+    """
+    Devuelve la caché `name` de la app actual, creándola con `options`
+    (maxsize, ttl, maxbytes, sizeof) la primera vez que se usa.
+    """
+    caches = current_app.extensions.setdefault("lru_caches", {})
+    cache = caches.get(name)
+    if cache is None:
+        cache = caches.setdefault(name, LRUCache(**options))
+    return cache
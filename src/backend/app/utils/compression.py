@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+compression.py — Compresión gzip/brotli de respuestas JSON.
+
+Contexto:
+Los artículos (~13 KB de HTML) y los detalles de proyecto (decenas de KB de JSON)
+se enviaban sin comprimir. Este middleware negocia Accept-Encoding y comprime las
+respuestas JSON que superan COMPRESSION_MIN_SIZE, con brotli si el paquete está
+instalado y gzip en otro caso.
+
+Las respuestas GET con ETag se comprimen una sola vez por versión: los bytes
+comprimidos se cachean con clave (ETag, codificación), de modo que un artículo
+muy leído se comprime una vez por versión y no una vez por petición.
+
+Notas de mantenimiento:
+- El ETag pasa a débil (W/"...") en la representación comprimida; If-None-Match
+  usa comparación débil, así que los 304 siguen funcionando.
+- Vary: Accept-Encoding se añade a toda respuesta comprimible, se comprima o no.
+- No se tocan respuestas en streaming, con Content-Encoding, parciales ni 304.
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+import gzip
+
+from flask import request
+
+from app.utils.cache import app_cache
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependencia opcional
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = ("application/json",)
+
+
+def _encodings():
+    """Codificaciones soportadas, por orden de preferencia."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def _choose_encoding():
+    accepted = request.accept_encodings
+    candidates = [(accepted[name], name) for name in _encodings() if accepted[name] > 0]
+    if not candidates:
+        return None
+    # Mayor calidad; a igual calidad, el orden de preferencia de _encodings()
+    return max(candidates, key=lambda item: (item[0], -_encodings().index(item[1])))[1]
+
+
+def _compress(data, encoding, config):
+    if encoding == "br":
+        return brotli.compress(data, quality=config["COMPRESSION_BROTLI_QUALITY"])
+    return gzip.compress(data, compresslevel=config["COMPRESSION_GZIP_LEVEL"], mtime=0)
+
+
+def _is_compressible(response):
+    mimetype = response.mimetype or ""
+    return (
+        response.status_code == 200
+        and not response.direct_passthrough
+        and not response.is_streamed
+        and "Content-Encoding" not in response.headers
+        and (mimetype in COMPRESSIBLE_MIMETYPES or mimetype.endswith("+json"))
+    )
+
+
+def init_app(app):
+    """Registra la compresión de respuestas en la app (ajustes COMPRESSION_* de Config)."""
+
+    @app.after_request
+    def compress_response(response):
+        config = app.config
+        if not config["COMPRESSION_ENABLED"] or not _is_compressible(response):
+            return response
+
+        response.vary.add("Accept-Encoding")
+        if response.content_length is not None and response.content_length < config["COMPRESSION_MIN_SIZE"]:
+            return response
+
+        encoding = _choose_encoding()
+        if encoding is None:
+            return response
+
+        etag, weak = response.get_etag()
+        cacheable = request.method == "GET" and etag is not None
+        cache = app_cache("compressed_responses", maxsize=1024, maxbytes=config["COMPRESSION_CACHE_MAX_BYTES"])
+        key = (request.path, etag, encoding)
+
+        body = cache.get(key) if cacheable else None
+        if body is None:
+            data = response.get_data()
+            if len(data) < config["COMPRESSION_MIN_SIZE"]:
+                return response
+            body = _compress(data, encoding, config)
+            if cacheable:
+                cache.set(key, body)
+
+        response.set_data(body)
+        response.headers["Content-Encoding"] = encoding
+        if etag is not None and not weak:
+            response.set_etag(etag, weak=True)
+        return response
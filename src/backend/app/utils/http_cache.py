@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+http_cache.py — Validadores HTTP (ETag / Last-Modified) para endpoints de lectura.
+
+Contexto:
+El frontend (Next.js) revalida periódicamente proyectos y artículos. Con un ETag
+fuerte derivado de (id, updated_at) —o de count + max(updated_at) en listados—
+la API puede responder 304 Not Modified sin volver a consultar filas completas
+ni serializar con Marshmallow.
+
+Notas de mantenimiento:
+- La decisión 304 se toma ANTES de serializar (y en listados, antes de cargar filas).
+- updated_at solo se rellena tras la primera modificación: se usa created_at
+  como versión mientras updated_at sea NULL.
+- Los parámetros de la petición forman parte del ETag de los listados, de modo que
+  cada página/vista tiene su propio validador.
+- Los listados se validan solo por ETag: borrar una fila o reordenar por visitas
+  no mueve max(updated_at), así que un Last-Modified haría que If-Modified-Since
+  devolviera 304 con el listado anterior. El recuento del ETag sí lo detecta.
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+import hashlib
+from datetime import timezone
+
+from flask import current_app, request
+from werkzeug.http import is_resource_modified
+
+
+def make_etag(*parts) -> str:
+    """Genera un ETag fuerte (sin comillas) a partir de las partes de versión."""
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def entity_version(entity):
+    """Marca temporal de versión de una entidad: updated_at o, si falta, created_at."""
+    return getattr(entity, "updated_at", None) or getattr(entity, "created_at", None)
+
+
+def entity_validators(entity, *extra):
+    """
+    Devuelve (etag, last_modified) para una entidad con id/updated_at/created_at.
+    Las partes extra permiten distinguir variantes de la misma entidad.
+    """
+    version = entity_version(entity)
+    etag = make_etag(type(entity).__name__, getattr(entity, "id", None), version, *extra)
+    return etag, version
+
+
+def listing_validators(resource, count, last_modified, *extra):
+    """
+    Devuelve el ETag de un listado a partir de count y max(updated_at), incluyendo
+    los parámetros de la petición actual. Sin Last-Modified (ver notas).
+    """
+    args = sorted(request.args.items(multi=True))
+    return make_etag(resource, count, last_modified, args, *extra)
+
+
+def is_not_modified(etag, last_modified=None) -> bool:
+    """Indica si la petición condicional actual ya tiene la versión vigente."""
+    return not is_resource_modified(
+        request.environ, etag=etag, last_modified=_as_utc(last_modified)
+    )
+
+
+def not_modified(etag, last_modified=None):
+    """Respuesta 304 sin cuerpo con los validadores actuales."""
+    response = current_app.response_class(status=304)
+    return with_validators(response, etag, last_modified)
+
+
+def with_validators(response, etag, last_modified=None):
+    """Añade ETag y Last-Modified a una respuesta."""
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = _as_utc(last_modified)
+    return response
+
+
+def _as_utc(value):
+    """Las columnas DateTime sin zona se almacenan en UTC."""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+investment.py — Normalización de los datos financieros de investment_data.
+
+Contexto:
+investment_data es JSON libre: los importes llegan como números (110000) o como
+texto ("110.000 €") y las rentabilidades como texto ("12%", "12,5 %"). Para poder
+filtrar e indexar por rango, Project guarda copias tipadas en columnas propias:
+importes en céntimos y rentabilidades en puntos básicos (1 % = 100 bp).
+
+Notas de mantenimiento:
+- Valores no interpretables se guardan como NULL (no bloquean la escritura).
+- Formato español: "110.000" son ciento diez mil; "1,5" es uno coma cinco.
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+import re
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+_NUMBER_RE = re.compile(r"-?\d[\d.,]*")
+_THOUSANDS_RE = {
+    ".": re.compile(r"^-?\d{1,3}(\.\d{3})+$"),
+    ",": re.compile(r"^-?\d{1,3}(,\d{3})+$"),
+}
+_CURRENCY_RE = re.compile(r"^[A-Za-z]{3}$")
+
+# Claves de investment_data de las que se derivan las columnas
+MIN_INVESTMENT_KEY = "min_investment"
+TOTAL_INVESTMENT_KEY = "total_investment"
+EXPECTED_RETURN_KEY = "expected_return"
+CURRENCY_KEY = "currency"
+
+
+def parse_decimal(value):
+    """Convierte un número o texto numérico (formato español o inglés) en Decimal."""
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return Decimal(str(value))
+    if not isinstance(value, str):
+        return None
+
+    match = _NUMBER_RE.search(value.replace(" ", "").replace(" ", ""))
+    if not match:
+        return None
+    number = match.group().rstrip(".,")
+
+    if "," in number and "." in number:
+        # El último separador es el decimal
+        decimal_sep = "," if number.rfind(",") > number.rfind(".") else "."
+        thousands_sep = "." if decimal_sep == "," else ","
+        number = number.replace(thousands_sep, "").replace(decimal_sep, ".")
+    else:
+        for sep in (",", "."):
+            if sep in number:
+                if _THOUSANDS_RE[sep].match(number):
+                    number = number.replace(sep, "")
+                else:
+                    number = number.replace(sep, ".")
+
+    try:
+        return Decimal(number)
+    except InvalidOperation:
+        return None
+
+
+def to_cents(value):
+    """Importe en céntimos (int) o None."""
+    amount = parse_decimal(value)
+    if amount is None:
+        return None
+    return int((amount * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+
+
+def to_basis_points(value):
+    """Porcentaje ("12%", 12, "12,5 %") en puntos básicos (int) o None."""
+    return to_cents(value)  # 1 % = 100 bp: misma escala que euros -> céntimos
+
+
+def normalize_currency(value):
+    """Código ISO 4217 en mayúsculas o None."""
+    if isinstance(value, str) and _CURRENCY_RE.match(value.strip()):
+        return value.strip().upper()
+    return None
+
+
+def derive_investment_columns(investment_data):
+    """
+    Calcula las columnas tipadas de Project a partir de investment_data.
+
+    Returns:
+        dict: min_investment_cents, total_investment_cents, expected_return_bp, currency.
+    """
+    data = investment_data if isinstance(investment_data, dict) else {}
+    return {
+        "min_investment_cents": to_cents(data.get(MIN_INVESTMENT_KEY)),
+        "total_investment_cents": to_cents(data.get(TOTAL_INVESTMENT_KEY)),
+        "expected_return_bp": to_basis_points(data.get(EXPECTED_RETURN_KEY)),
+        "currency": normalize_currency(data.get(CURRENCY_KEY)),
+    }
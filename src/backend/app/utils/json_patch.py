@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+json_patch.py — Aplicación de JSON Patch (RFC 6902) sobre documentos JSON.
+
+Contexto:
+Permite modificar una parte de un documento (p. ej. una entrada de FAQ dentro de
+content_sections) enviando solo la operación, en lugar del documento completo.
+Las rutas usan JSON Pointer (RFC 6901): "/content_sections/3/content".
+
+Notas de mantenimiento:
+- apply_patch no modifica el documento recibido: devuelve una copia.
+- Un parche mal formado lanza JsonPatchError (400); una operación "test" fallida o
+  una ruta inexistente lanzan JsonPatchConflict (409).
+- El parche es atómico: si una operación falla no se aplica ninguna.
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+import copy
+
+OPERATIONS = ("add", "remove", "replace", "move", "copy", "test")
+
+
+class JsonPatchError(ValueError):
+    """El parche no es un JSON Patch válido."""
+
+
+class JsonPatchConflict(JsonPatchError):
+    """El parche es válido pero no se puede aplicar sobre el documento actual."""
+
+
+def parse_pointer(pointer):
+    """Convierte un JSON Pointer en la lista de sus segmentos ("" = documento raíz)."""
+    if not isinstance(pointer, str) or (pointer and not pointer.startswith("/")):
+        raise JsonPatchError(f"Ruta no válida: {pointer!r}")
+    if pointer == "":
+        return []
+    return [part.replace("~1", "/").replace("~0", "~") for part in pointer[1:].split("/")]
+
+
+def _array_index(container, token, allow_end=False):
+    if allow_end and token == "-":
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token.startswith("0")):
+        raise JsonPatchConflict(f"Índice no válido: {token!r}")
+    index = int(token)
+    limit = len(container) + (1 if allow_end else 0)
+    if index >= limit:
+        raise JsonPatchConflict(f"Índice fuera de rango: {index}")
+    return index
+
+
+def _resolve(document, parts):
+    """Devuelve el valor en la ruta indicada."""
+    node = document
+    for token in parts:
+        if isinstance(node, dict):
+            if token not in node:
+                raise JsonPatchConflict(f"Ruta inexistente: /{'/'.join(parts)}")
+            node = node[token]
+        elif isinstance(node, list):
+            node = node[_array_index(node, token)]
+        else:
+            raise JsonPatchConflict(f"Ruta inexistente: /{'/'.join(parts)}")
+    return node
+
+
+def _add(document, parts, value):
+    if not parts:
+        return value
+    parent = _resolve(document, parts[:-1])
+    token = parts[-1]
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent.insert(_array_index(parent, token, allow_end=True), value)
+    else:
+        raise JsonPatchConflict(f"Ruta inexistente: /{'/'.join(parts)}")
+    return document
+
+
+def _remove(document, parts):
+    if not parts:
+        raise JsonPatchError("No se puede eliminar el documento raíz")
+    parent = _resolve(document, parts[:-1])
+    token = parts[-1]
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise JsonPatchConflict(f"Ruta inexistente: /{'/'.join(parts)}")
+        return parent.pop(token)
+    if isinstance(parent, list):
+        return parent.pop(_array_index(parent, token))
+    raise JsonPatchConflict(f"Ruta inexistente: /{'/'.join(parts)}")
+
+
+def _apply_operation(document, operation):
+    if not isinstance(operation, dict) or operation.get("op") not in OPERATIONS:
+        raise JsonPatchError(f"Operación no válida: {operation!r}")
+
+    op = operation["op"]
+    parts = parse_pointer(operation.get("path"))
+
+    if op in ("add", "replace", "test") and "value" not in operation:
+        raise JsonPatchError(f"La operación {op} requiere 'value'")
+    if op in ("move", "copy"):
+        from_parts = parse_pointer(operation.get("from"))
+
+    if op == "add":
+        return _add(document, parts, copy.deepcopy(operation["value"]))
+    if op == "remove":
+        _remove(document, parts)
+        return document
+    if op == "replace":
+        _resolve(document, parts)
+        if not parts:
+            return copy.deepcopy(operation["value"])
+        _remove(document, parts)
+        return _add(document, parts, copy.deepcopy(operation["value"]))
+    if op == "move":
+        if parts[:len(from_parts)] == from_parts and parts != from_parts:
+            raise JsonPatchError("No se puede mover un valor dentro de sí mismo")
+        value = _remove(document, from_parts)
+        return _add(document, parts, value)
+    if op == "copy":
+        return _add(document, parts, copy.deepcopy(_resolve(document, from_parts)))
+
+    # test
+    if _resolve(document, parts) != operation["value"]:
+        raise JsonPatchConflict(f"La comprobación falló en {operation['path']}")
+    return document
+
+
+def apply_patch(document, operations):
+    """
+    Aplica una lista de operaciones JSON Patch y devuelve el documento resultante.
+
+    Raises:
+        JsonPatchError: Si el parche está mal formado.
+        JsonPatchConflict: Si una ruta no existe o un "test" falla.
+    """
+    if not isinstance(operations, list):
+        raise JsonPatchError("El parche debe ser una lista de operaciones")
+
+    document = copy.deepcopy(document)
+    for operation in operations:
+        document = _apply_operation(document, operation)
+    return document
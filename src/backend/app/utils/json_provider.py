@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+json_provider.py — Proveedor JSON rápido (orjson) para Flask y SQLAlchemy.
+
+Contexto:
+Los detalles de proyecto son diccionarios grandes y anidados; codificarlos con el
+módulo json estándar aparece en los perfiles. Si orjson está instalado, jsonify,
+request.get_json() y las columnas JSON del motor SQLAlchemy lo usan; si no, se
+mantiene el comportamiento estándar de Flask sin cambios.
+
+Notas de mantenimiento:
+- La salida es compatible con el proveedor por defecto de Flask: claves ordenadas,
+  datetime/date como fecha HTTP y Decimal, UUID y dataclasses como en Flask.
+- Opciones que orjson no soporta (indent en modo debug, separators
+  personalizados, cls...) delegan en el proveedor estándar.
+- Benchmark: python -m app.scripts.benchmark_json
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+import json
+
+from flask.json.provider import DefaultJSONProvider, _default
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dependencia opcional
+    orjson = None
+
+# Opciones de dumps que la ruta rápida sabe respetar
+_FAST_KWARGS = {"default", "sort_keys", "ensure_ascii"}
+
+
+def _orjson_options(sort_keys):
+    # datetime/date pasan a default para mantener el formato de Flask (fecha HTTP)
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if sort_keys:
+        options |= orjson.OPT_SORT_KEYS
+    return options
+
+
+def json_dumps(obj, default=_default, sort_keys=False) -> str:
+    """dumps compacto para el motor SQLAlchemy (json_serializer)."""
+    if orjson is None:
+        return json.dumps(obj, default=default, sort_keys=sort_keys)
+    return orjson.dumps(obj, default=default, option=_orjson_options(sort_keys)).decode("utf-8")
+
+
+def json_loads(value):
+    """loads para el motor SQLAlchemy (json_deserializer) y las peticiones."""
+    if orjson is None:
+        return json.loads(value)
+    return orjson.loads(value)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """DefaultJSONProvider que codifica y decodifica con orjson si está disponible."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        if orjson is None or set(kwargs) - _FAST_KWARGS:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(
+            obj,
+            default=kwargs.get("default", self.default),
+            sort_keys=kwargs.get("sort_keys", self.sort_keys),
+        ).decode("utf-8")
+
+    def dumps_bytes(self, obj, default=None, sort_keys=None) -> bytes:
+        """Codifica directamente a bytes UTF-8 (sin pasar por str con orjson)."""
+        if sort_keys is None:
+            sort_keys = self.sort_keys
+        if orjson is None:
+            return super().dumps(obj, sort_keys=sort_keys).encode("utf-8")
+        return orjson.dumps(
+            obj, default=default or self.default, option=_orjson_options(sort_keys)
+        )
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+pagination.py — Utilidades de paginación por cursor (keyset).
+
+Contexto:
+La paginación por OFFSET obliga a la base de datos a recorrer y descartar todas
+las filas anteriores a la página pedida. Con keyset, el cliente devuelve un cursor
+opaco con los valores de ordenación de la última fila recibida y la siguiente
+página se resuelve como un rango acotado sobre un índice compuesto.
+
+Notas de mantenimiento:
+- El cursor es JSON compacto codificado en base64 url-safe (sin padding).
+- Las fechas se serializan como {"$dt": "<isoformat>"} para recuperarlas tipadas.
+- Un cursor corrupto o manipulado lanza InvalidCursorError (la API responde 400).
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from sqlalchemy import tuple_
+
+
+class InvalidCursorError(ValueError):
+    """El cursor recibido no se puede decodificar o no encaja con la ordenación."""
+
+
+def encode_cursor(values) -> str:
+    """Codifica una secuencia de valores de ordenación en un cursor opaco."""
+    payload = [{"$dt": v.isoformat()} if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """
+    Decodifica un cursor generado por encode_cursor.
+
+    Args:
+        cursor: Cadena recibida del cliente.
+        size: Número de valores que debe contener (uno por columna de ordenación).
+
+    Raises:
+        InvalidCursorError: Si el cursor no es válido.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(payload, list) or len(payload) != size:
+            raise InvalidCursorError("Cursor inválido")
+        values = [
+            datetime.fromisoformat(v["$dt"]) if isinstance(v, dict) else v
+            for v in payload
+        ]
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError("Cursor inválido") from e
+
+    if any(v is None or isinstance(v, (dict, list)) for v in values):
+        raise InvalidCursorError("Cursor inválido")
+    return values
+
+
+def keyset_after(columns, values):
+    """
+    Condición "fila posterior al cursor" para una ordenación descendente en todas
+    las columnas. Se expresa como comparación de tuplas para que PostgreSQL la
+    resuelva como un único rango sobre el índice compuesto.
+    """
+    return tuple_(*columns) < tuple_(*values)
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+responsive_images.py — Variantes responsive de imágenes de Cloudinary.
+
+Contexto:
+Project.gallery guardaba solo {url|src, alt} y Article.image una URL: el frontend
+descargaba la imagen de 1200px también en móvil y sin ancho/alto reservaba mal
+el espacio (CLS). Al escribir, build_variants() calcula con el constructor de
+URLs de Cloudinary (cloudinary.utils.cloudinary_url, sin llamadas a la API) una
+URL por ancho de RESPONSIVE_BREAKPOINTS y, si se conocen, las dimensiones
+intrínsecas y la relación de aspecto. Las lecturas sirven el JSON tal cual.
+
+Notas de mantenimiento:
+- Solo se procesan URLs de entrega de Cloudinary (res.cloudinary.com/.../upload/);
+  las demás devuelven None y el frontend usa la URL original.
+- Las transformaciones ya presentes en la URL se sustituyen por c_limit
+  (nunca amplía), q_auto y f_auto con el ancho de cada variante.
+- Las dimensiones no se deducen de la URL: las aporta la subida
+  (ImageService.upload_image), los propios elementos de la galería (width/height)
+  o flask data backfill-image-variants --fetch-dimensions.
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+import re
+
+from cloudinary.utils import cloudinary_url
+
+RESPONSIVE_BREAKPOINTS = (320, 640, 960, 1200)
+
+_CLOUDINARY_URL_RE = re.compile(
+    r"^https?://res\.cloudinary\.com/(?P<cloud_name>[^/]+)/(?P<resource_type>image)/upload/"
+    r"(?P<path>.+)$"
+)
+# Parámetros de transformación de Cloudinary (w_640, c_limit, f_auto, $var_...)
+_TRANSFORMATION_KEYS = (
+    "a|ac|af|ar|b|bo|br|c|co|cs|d|dl|dn|dpr|du|e|eo|f|fl|fn|fps|g|h|if|ki|"
+    "l|o|p|pg|q|r|so|sp|t|u|vc|vs|w|x|y|z|\\$[a-z]\\w*"
+)
+_TRANSFORMATION_RE = re.compile(
+    rf"^(?:{_TRANSFORMATION_KEYS})_[^/,]+(?:,(?:{_TRANSFORMATION_KEYS})_[^/,]+)*$"
+)
+_VERSION_RE = re.compile(r"^v\d+$")
+
+
+def parse_cloudinary_url(url):
+    """
+    Descompone una URL de entrega de Cloudinary.
+
+    Returns:
+        dict | None: cloud_name, public_id, version y format, o None si la URL no
+        es de Cloudinary.
+    """
+    match = _CLOUDINARY_URL_RE.match((url or "").strip().split("?", 1)[0])
+    if not match:
+        return None
+
+    segments = match.group("path").split("/")
+    version = None
+    # Las transformaciones y la versión preceden al public_id. Con versión, todo
+    # lo anterior son transformaciones; sin ella, solo se quitan los segmentos
+    # con parámetros conocidos (carpetas como img_files/ forman parte del public_id).
+    version_index = next(
+        (i for i, segment in enumerate(segments[:-1]) if _VERSION_RE.match(segment)), None
+    )
+    if version_index is not None and all(
+        _TRANSFORMATION_RE.match(segment) for segment in segments[:version_index]
+    ):
+        version = segments[version_index][1:]
+        segments = segments[version_index + 1:]
+    else:
+        while len(segments) > 1 and _TRANSFORMATION_RE.match(segments[0]):
+            segments.pop(0)
+
+    public_id, _, extension = "/".join(segments).rpartition(".")
+    if not public_id:
+        public_id, extension = extension, None
+    return {
+        "cloud_name": match.group("cloud_name"),
+        "public_id": public_id,
+        "version": version,
+        "format": extension,
+    }
+
+
+def _dimension(value):
+    """Dimensión en píxeles como int (admite "800" u 800.0 de JSON antiguos) o None."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, str) and value.strip().isdigit():
+        value = int(value.strip())
+    elif isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return value if isinstance(value, int) and value > 0 else None
+
+
+def build_variants(url, width=None, height=None, breakpoints=RESPONSIVE_BREAKPOINTS):
+    """
+    Calcula las variantes responsive de una imagen de Cloudinary.
+
+    Args:
+        url: URL de entrega de Cloudinary.
+        width, height: Dimensiones intrínsecas, si se conocen (int o cadena numérica).
+
+    Returns:
+        dict | None: {"width", "height", "aspect_ratio", "srcset": [{"width", "url"}]}
+        o None si la URL no es de Cloudinary.
+    """
+    parts = parse_cloudinary_url(url)
+    if parts is None:
+        return None
+
+    width, height = _dimension(width), _dimension(height)
+    # c_limit no amplía: por encima del ancho real basta con la variante del ancho real
+    widths = sorted({min(breakpoint, width) for breakpoint in breakpoints} if width else breakpoints)
+
+    srcset = []
+    for variant_width in widths:
+        variant_url, _ = cloudinary_url(
+            parts["public_id"],
+            cloud_name=parts["cloud_name"],
+            version=parts["version"],
+            format=parts["format"],
+            secure=True,
+            transformation=[{
+                "width": variant_width, "crop": "limit", "quality": "auto", "fetch_format": "auto",
+            }],
+        )
+        srcset.append({"width": variant_width, "url": variant_url})
+
+    return {
+        "width": width,
+        "height": height,
+        "aspect_ratio": round(width / height, 4) if width and height else None,
+        "srcset": srcset,
+    }
+
+
+def enrich_gallery(gallery):
+    """
+    Añade a cada imagen de la galería sus variantes (width, height, aspect_ratio,
+    srcset). Acepta la URL en "url" o en "src"; devuelve una lista nueva. Solo se
+    añaden los valores conocidos: un None calculado no borra los del elemento.
+    """
+    if not isinstance(gallery, list):
+        return gallery
+
+    enriched = []
+    for item in gallery:
+        if isinstance(item, dict):
+            variants = build_variants(
+                item.get("url") or item.get("src"), item.get("width"), item.get("height")
+            )
+            if variants:
+                item = {**item, **{key: value for key, value in variants.items() if value is not None}}
+        enriched.append(item)
+    return enriched
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+slug_allocation.py — Asignación de slugs únicos con sufijo -N.
+
+Contexto:
+El slug de un artículo se genera a partir del título y la columna es única: dos
+artículos con el mismo título chocaban con la restricción y el editor recibía un
+400 genérico. next_free_slug() devuelve el slug base o, si ya existe, el
+siguiente sufijo (base-2, base-3, ...) con una sola consulta por prefijo
+(slug = base OR slug LIKE 'base-%'), que usa el índice de patrones de la columna.
+
+allocate_slugs() hace lo mismo para muchos títulos a la vez (importaciones):
+una consulta por bloque de bases y sufijos únicos también dentro del lote.
+
+Notas de mantenimiento:
+- La consulta no reserva nada: dos escrituras concurrentes pueden obtener el
+  mismo slug. Quien inserta debe reintentar ante IntegrityError
+  (ArticleService lo hace con un savepoint por intento).
+- Solo cuentan como ocupados el slug base y base-<número>; "base-extra" no.
+- El sufijo es el mayor asignado + 1: los huecos de slugs borrados no se
+  reutilizan, para que una URL antigua (base-2) no pase a otro contenido.
+- Con source=(Article.title, create_slug), el mayor sufijo solo se toma de filas
+  cuyo título da la misma base: un número del propio título ("guia-2025") no
+  desplaza la serie de "guia".
+- is_slug_conflict() distingue la violación de la restricción única del slug
+  de otras IntegrityError.
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+import re
+
+from sqlalchemy import and_, null, or_, select
+
+from app.extensions import db
+
+# Bases por consulta en allocate_slugs
+ALLOCATION_BATCH_SIZE = 100
+
+
+def _escape_like(value):
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _prefix_filter(column, base):
+    return or_(column == base, column.like(f"{_escape_like(base)}-%", escape="\\"))
+
+
+def _suffix_state(bases, rows, slugify=None):
+    """
+    {base: (slugs ocupados, mayor sufijo asignado)} a partir de filas (slug, origen).
+
+    Todos los slugs base y base-<número> cuentan como ocupados, pero solo cuentan
+    para el máximo las filas cuyo origen (el título) da esa misma base: "guia-2025"
+    de un título que termina en 2025 no es un sufijo de "guia". El slug base
+    cuenta como sufijo 1.
+    """
+    patterns = {base: re.compile(rf"{re.escape(base)}(?:-(\d+))?") for base in bases}
+    state = {base: (set(), [0]) for base in bases}
+    for slug, origin in rows:
+        for base, pattern in patterns.items():
+            match = pattern.fullmatch(slug)
+            if not match:
+                continue
+            taken, top = state[base]
+            taken.add(slug)
+            if slugify is None or origin is None or slugify(origin) == base:
+                top[0] = max(top[0], int(match.group(1)) if match.group(1) else 1)
+    return {base: (taken, top[0]) for base, (taken, top) in state.items()}
+
+
+def _next_suffix(base, taken, top):
+    """Siguiente sufijo tras el mayor asignado (sin rellenar huecos) que no esté ocupado."""
+    suffix = top + 1
+    while _with_suffix(base, suffix) in taken:
+        suffix += 1
+    return suffix
+
+
+def _with_suffix(base, suffix):
+    return base if suffix == 1 else f"{base}-{suffix}"
+
+
+def _rows(column, condition, source):
+    origin = source[0] if source else null()
+    return db.session.execute(select(column, origin).where(condition)).all()
+
+
+def next_free_slug(column, base, exclude_id=None, source=None):
+    """
+    Devuelve `base` si está libre o base-(mayor sufijo asignado + 1).
+
+    Args:
+        column: Columna única de slugs (p. ej. Article.slug).
+        base: Slug deseado (normalmente create_slug(title)).
+        exclude_id: Id de la fila que se está editando, cuyo slug no cuenta.
+        source: (columna de origen, slugify), p. ej. (Article.title, create_slug):
+            solo las filas cuyo origen da `base` cuentan para el mayor sufijo.
+    """
+    condition = _prefix_filter(column, base)
+    if exclude_id is not None:
+        condition = and_(condition, column.class_.id != exclude_id)
+    slugify = source[1] if source else None
+    taken, top = _suffix_state([base], _rows(column, condition, source), slugify)[base]
+    return _with_suffix(base, _next_suffix(base, taken, top))
+
+
+def allocate_slugs(column, bases, source=None):
+    """
+    Asigna slugs únicos a una lista de bases en una pasada (`source` como en
+    next_free_slug).
+
+    Returns:
+        list[str]: Un slug por base, en el mismo orden, únicos entre sí y frente a la BD.
+    """
+    distinct = list(dict.fromkeys(bases))
+    slugify = source[1] if source else None
+    state = {}
+    for start in range(0, len(distinct), ALLOCATION_BATCH_SIZE):
+        chunk = distinct[start:start + ALLOCATION_BATCH_SIZE]
+        condition = or_(*(_prefix_filter(column, base) for base in chunk))
+        state.update(_suffix_state(chunk, _rows(column, condition, source), slugify))
+
+    top = {base: state[base][1] for base in distinct}
+    allocated, taken = [], set().union(*(slugs for slugs, _ in state.values()))
+    for base in bases:
+        # taken incluye los slugs del lote: una base puede coincidir con el
+        # slug con sufijo de otra (p. ej. "a-2")
+        suffix = _next_suffix(base, taken, top[base])
+        top[base] = suffix
+        slug = _with_suffix(base, suffix)
+        taken.add(slug)
+        allocated.append(slug)
+    return allocated
+
+
+def is_slug_conflict(error, column):
+    """
+    True si el IntegrityError viene de la restricción única de `column` y no de
+    otra (NOT NULL, clave foránea...), que no debe presentarse como conflicto de slug.
+    """
+    column = getattr(column, "expression", column)
+    table, name = column.table.name, column.name
+    constraint = getattr(getattr(error.orig, "diag", None), "constraint_name", None)
+    if constraint is not None:
+        # PostgreSQL: nombre por defecto de UniqueConstraint('slug') o índice único
+        return constraint in (f"{table}_{name}_key", f"ix_{table}_{name}")
+    # SQLite (tests) no expone el nombre de la restricción
+    return f"UNIQUE constraint failed: {table}.{name}" in str(error.orig)
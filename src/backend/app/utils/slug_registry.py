@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+slug_registry.py — Registro en memoria de slugs existentes y caché de fallos.
+
+Contexto:
+Los bots y crawlers piden slugs inexistentes de artículos y proyectos, y cada
+petición cargaba la fila completa (o el proyecto con sus JSON) solo para devolver
+404. Cada worker mantiene un registro de los slugs existentes de cada tipo: un
+set o, por encima de SLUG_REGISTRY_BLOOM_THRESHOLD slugs, un filtro de Bloom.
+Un slug que el registro no contiene se confirma con una consulta mínima por el
+índice único (SELECT 1 ... WHERE slug = :slug LIMIT 1) antes de responder 404:
+el registro de un worker no ve al instante las altas de otro, así que nunca se
+responde 404 sin que la BD lo confirme.
+
+Los slugs que el registro sí contiene pero no existen (falsos positivos del
+filtro de Bloom o borrados en otro worker) se recuerdan en una caché de fallos
+con TTL corto (SLUG_NEGATIVE_CACHE_TTL): la siguiente petición pasa también por
+la comprobación mínima en lugar de por la consulta completa.
+
+Notas de mantenimiento:
+- Sincronización: track_slugs() registra eventos del ORM (alta, cambio de slug
+  y borrado) que se aplican al hacer commit. Las escrituras con Core
+  (p. ej. bulk_upsert) deben llamar a invalidate(kind). Un slug que la
+  comprobación encuentra en la BD se añade al registro del worker.
+- El registro se reconstruye al arrancar y cada SLUG_REGISTRY_REFRESH_INTERVAL
+  segundos. Solo la petición que encuentra el registro caducado lo recarga; las
+  concurrentes del mismo worker siguen usando el anterior mientras tanto. Si la
+  reconstrucción falla (p. ej. sin tablas) el registro no filtra.
+- El filtro de Bloom no admite borrados: un slug eliminado sigue "pudiendo
+  existir" hasta la siguiente reconstrucción (lo cubre la caché de fallos).
+- Ni el registro ni la caché de fallos deciden un 404 por sí solos: solo
+  eligen entre la consulta completa y la comprobación mínima.
+
+@author Boost A Project Team
+@since v2.2.0
+"""
+
+import hashlib
+import logging
+import math
+import threading
+import time
+
+from flask import current_app, has_app_context
+from sqlalchemy import event, inspect, literal, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.extensions import db
+from app.utils.cache import app_cache
+
+logger = logging.getLogger(__name__)
+
+_TRACKED = {}
+_PENDING_KEY = "slug_registry_pending"
+
+
+class BloomFilter:
+    """Filtro de Bloom sobre un bytearray (k posiciones por doble hash de blake2b)."""
+
+    def __init__(self, capacity, error_rate=0.01):
+        capacity = max(capacity, 1)
+        self.size = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.hashes = max(int(round(self.size / capacity * math.log(2))), 1)
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, value):
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value):
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class SlugRegistry:
+    """Slugs existentes de un tipo (set o BloomFilter), reconstruido periódicamente."""
+
+    def __init__(self, loader, refresh_interval=30, bloom_threshold=50_000, error_rate=0.01):
+        self._loader = loader
+        self.refresh_interval = refresh_interval
+        self.bloom_threshold = bloom_threshold
+        self.error_rate = error_rate
+        self._slugs = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self._rebuild_lock = threading.Lock()
+
+    @property
+    def is_bloom(self):
+        return isinstance(self._slugs, BloomFilter)
+
+    def rebuild(self):
+        """Carga todos los slugs. Si falla, el registro deja de filtrar hasta el siguiente intento."""
+        try:
+            slugs = list(self._loader())
+        except SQLAlchemyError:
+            logger.warning("No se pudo construir el registro de slugs", exc_info=True)
+            slugs = None
+
+        if slugs is not None and len(slugs) > self.bloom_threshold:
+            container = BloomFilter(len(slugs) * 2, self.error_rate)
+            for slug in slugs:
+                container.add(slug)
+        else:
+            container = set(slugs) if slugs is not None else None
+
+        with self._lock:
+            self._slugs = container
+            self._expires_at = time.monotonic() + self.refresh_interval
+
+    def might_exist(self, slug):
+        """False solo si el slug seguro que no existe."""
+        if time.monotonic() >= self._expires_at:
+            self._refresh()
+        slugs = self._slugs
+        return slugs is None or slug in slugs
+
+    def _refresh(self):
+        """Reconstruye el registro caducado; si otra petición ya lo hace, no espera."""
+        if not self._rebuild_lock.acquire(blocking=False):
+            return
+        try:
+            if time.monotonic() >= self._expires_at:
+                self.rebuild()
+        finally:
+            self._rebuild_lock.release()
+
+    def add(self, slug):
+        with self._lock:
+            if self._slugs is not None:
+                self._slugs.add(slug)
+
+    def discard(self, slug):
+        with self._lock:
+            if isinstance(self._slugs, set):
+                self._slugs.discard(slug)
+
+    def invalidate(self):
+        """Fuerza la reconstrucción en la siguiente consulta."""
+        with self._lock:
+            self._expires_at = 0.0
+
+
+def _misses():
+    return app_cache(
+        "slug_misses",
+        maxsize=4096,
+        ttl=current_app.config.get("SLUG_NEGATIVE_CACHE_TTL", 30),
+    )
+
+
+def get_registry(kind):
+    """Registro de slugs de `kind` para la app actual (se crea la primera vez)."""
+    registries = current_app.extensions.setdefault("slug_registries", {})
+    registry = registries.get(kind)
+    if registry is None:
+        column = _TRACKED[kind]
+        config = current_app.config
+        registry = registries.setdefault(kind, SlugRegistry(
+            lambda: db.session.execute(select(column)).scalars(),
+            refresh_interval=config.get("SLUG_REGISTRY_REFRESH_INTERVAL", 30),
+            bloom_threshold=config.get("SLUG_REGISTRY_BLOOM_THRESHOLD", 50_000),
+        ))
+    return registry
+
+
+def _exists(kind, slug):
+    """Comprobación mínima por el índice único de slug."""
+    column = _TRACKED[kind]
+    query = select(literal(1)).select_from(column.table).where(column == slug).limit(1)
+    return db.session.execute(query).first() is not None
+
+
+def is_known_missing(kind, slug):
+    """
+    True si el slug no existe. Cuando el registro o la caché de fallos lo
+    descartan se confirma con una consulta mínima (sin cargar la fila); si no,
+    devuelve False y quien llama hace la consulta completa.
+    """
+    if not current_app.config.get("SLUG_REGISTRY_ENABLED", True):
+        return False
+    registry = get_registry(kind)
+    if registry.might_exist(slug) and (kind, slug) not in _misses():
+        return False
+    if _exists(kind, slug):
+        # Alta de otro worker (o por Core) que este registro aún no conocía
+        registry.add(slug)
+        _misses().pop((kind, slug))
+        return False
+    return True
+
+
+def remember_missing(kind, slug):
+    """Recuerda un slug que no se encontró en la BD durante SLUG_NEGATIVE_CACHE_TTL."""
+    if current_app.config.get("SLUG_REGISTRY_ENABLED", True):
+        _misses().set((kind, slug), True)
+
+
+def invalidate(kind):
+    """Tras escrituras que no pasan por el ORM: reconstruye el registro y olvida los fallos."""
+    get_registry(kind).invalidate()
+    _misses().discard_where(lambda key: key[0] == kind)
+
+
+def warm_up():
+    """Construye los registros de todos los tipos (al arrancar la app)."""
+    for kind in _TRACKED:
+        get_registry(kind).rebuild()
+
+
+def _pending(session):
+    return session.info.setdefault(_PENDING_KEY, [])
+
+
+def track_slugs(model, kind):
+    """Mantiene el registro de `kind` sincronizado con las altas, cambios y bajas de `model`."""
+    _TRACKED[kind] = model.__table__.c.slug
+
+    def after_insert(mapper, connection, target):
+        _pending(inspect(target).session).append((kind, "add", target.slug))
+
+    def after_update(mapper, connection, target):
+        history = inspect(target).attrs.slug.history
+        if history.has_changes():
+            pending = _pending(inspect(target).session)
+            pending.extend((kind, "discard", old) for old in history.deleted if old)
+            pending.append((kind, "add", target.slug))
+
+    def after_delete(mapper, connection, target):
+        _pending(inspect(target).session).append((kind, "discard", target.slug))
+
+    event.listen(model, "after_insert", after_insert)
+    event.listen(model, "after_update", after_update)
+    event.listen(model, "after_delete", after_delete)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending or not has_app_context():
+        return
+    for kind, action, slug in pending:
+        registry = get_registry(kind)
+        if action == "add":
+            registry.add(slug)
+            _misses().pop((kind, slug))
+        else:
+            registry.discard(slug)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    session.info.pop(_PENDING_KEY, None)
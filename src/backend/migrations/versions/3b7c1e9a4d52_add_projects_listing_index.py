@@ -0,0 +1,42 @@
+"""add composite listing index to projects
+
+Revision ID: 3b7c1e9a4d52
+Revises: ff570f0e0564
+Create Date: 2026-10-17 10:12:41.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b7c1e9a4d52'
+down_revision = 'ff570f0e0564'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # La paginación por cursor compara tuplas (priority, created_at, id):
+    # no puede haber NULL en las columnas de ordenación.
+    op.execute("UPDATE projects SET priority = 0 WHERE priority IS NULL")
+    op.execute("UPDATE projects SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL")
+
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.alter_column('priority', existing_type=sa.Integer(), nullable=False)
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=False)
+
+    op.create_index(
+        'ix_projects_listing',
+        'projects',
+        [sa.text('priority DESC'), sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_projects_listing', table_name='projects')
+
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=True)
+        batch_op.alter_column('priority', existing_type=sa.Integer(), nullable=True)
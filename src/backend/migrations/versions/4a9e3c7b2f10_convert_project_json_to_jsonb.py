@@ -0,0 +1,84 @@
+"""convert project json columns to jsonb with gin indexes
+
+Revision ID: 4a9e3c7b2f10
+Revises: c5d1f7a2e894
+Create Date: 2026-10-17 13:22:08.517349
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '4a9e3c7b2f10'
+down_revision = 'c5d1f7a2e894'
+branch_labels = None
+depends_on = None
+
+
+JSON_COLUMNS = ('gallery', 'investment_data', 'content_sections')
+
+# PostgreSQL no permite cambiar el tipo de una columna nombrada en un trigger
+# (UPDATE OF ... de c5d1f7a2e894): se elimina antes del ALTER y se recrea después.
+# La función projects_search_vector_update() no cambia.
+DROP_SEARCH_TRIGGER = "DROP TRIGGER IF EXISTS projects_search_vector_trigger ON projects"
+CREATE_SEARCH_TRIGGER = """
+CREATE TRIGGER projects_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, subtitle, description, category,
+        investment_data, content_sections ON projects
+    FOR EACH ROW EXECUTE FUNCTION projects_search_vector_update();
+"""
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.execute(DROP_SEARCH_TRIGGER)
+    for column in JSON_COLUMNS:
+        op.alter_column(
+            'projects',
+            column,
+            existing_type=postgresql.JSON(),
+            type_=postgresql.JSONB(),
+            postgresql_using=f'{column}::jsonb',
+        )
+    op.execute(CREATE_SEARCH_TRIGGER)
+
+    # jsonb_path_ops: índice más pequeño, especializado en contención (@>)
+    op.create_index(
+        'ix_projects_investment_data',
+        'projects',
+        ['investment_data'],
+        postgresql_using='gin',
+        postgresql_ops={'investment_data': 'jsonb_path_ops'},
+    )
+    op.create_index(
+        'ix_projects_content_sections',
+        'projects',
+        ['content_sections'],
+        postgresql_using='gin',
+        postgresql_ops={'content_sections': 'jsonb_path_ops'},
+    )
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_projects_content_sections', table_name='projects')
+    op.drop_index('ix_projects_investment_data', table_name='projects')
+
+    op.execute(DROP_SEARCH_TRIGGER)
+    for column in JSON_COLUMNS:
+        op.alter_column(
+            'projects',
+            column,
+            existing_type=postgresql.JSONB(),
+            type_=postgresql.JSON(),
+            postgresql_using=f'{column}::json',
+        )
+    op.execute(CREATE_SEARCH_TRIGGER)
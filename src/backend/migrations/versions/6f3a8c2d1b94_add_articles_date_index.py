@@ -0,0 +1,30 @@
+"""add listing index to articles
+
+Revision ID: 6f3a8c2d1b94
+Revises: 9d2b6e1f5a83
+Create Date: 2026-10-17 16:21:09.402817
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6f3a8c2d1b94'
+down_revision = '9d2b6e1f5a83'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # El listado y la paginación por cursor ordenan por (date DESC, id DESC)
+    op.create_index(
+        'ix_articles_date',
+        'articles',
+        [sa.text('date DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_articles_date', table_name='articles')
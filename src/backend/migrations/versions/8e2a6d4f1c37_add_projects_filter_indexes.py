@@ -0,0 +1,71 @@
+"""add filter and sort indexes to projects
+
+Revision ID: 8e2a6d4f1c37
+Revises: 3b7c1e9a4d52
+Create Date: 2026-10-17 11:03:12.904377
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e2a6d4f1c37'
+down_revision = '3b7c1e9a4d52'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Las ordenaciones por cursor comparan tuplas: sin NULL en featured/views
+    op.execute("UPDATE projects SET featured = false WHERE featured IS NULL")
+    op.execute("UPDATE projects SET views = 0 WHERE views IS NULL")
+
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.alter_column('featured', existing_type=sa.Boolean(), nullable=False)
+        batch_op.alter_column('views', existing_type=sa.Integer(), nullable=False)
+
+    op.create_index(
+        'ix_projects_created',
+        'projects',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_projects_views',
+        'projects',
+        [sa.text('views DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_projects_category_listing',
+        'projects',
+        ['category', sa.text('priority DESC'), sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_projects_status_listing',
+        'projects',
+        ['status', sa.text('priority DESC'), sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    # Índice parcial para los destacados de la homepage
+    op.create_index(
+        'ix_projects_featured',
+        'projects',
+        [sa.text('priority DESC'), sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text('featured'),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_projects_featured', table_name='projects')
+    op.drop_index('ix_projects_status_listing', table_name='projects')
+    op.drop_index('ix_projects_category_listing', table_name='projects')
+    op.drop_index('ix_projects_views', table_name='projects')
+    op.drop_index('ix_projects_created', table_name='projects')
+
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.alter_column('views', existing_type=sa.Integer(), nullable=True)
+        batch_op.alter_column('featured', existing_type=sa.Boolean(), nullable=True)
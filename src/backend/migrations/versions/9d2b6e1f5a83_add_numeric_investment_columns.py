@@ -0,0 +1,39 @@
+"""add typed investment columns to projects
+
+Revision ID: 9d2b6e1f5a83
+Revises: 4a9e3c7b2f10
+Create Date: 2026-10-17 14:05:47.261930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d2b6e1f5a83'
+down_revision = '4a9e3c7b2f10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Los valores se rellenan con: flask data backfill-investment
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('min_investment_cents', sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column('total_investment_cents', sa.BigInteger(), nullable=True))
+        batch_op.add_column(sa.Column('expected_return_bp', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('currency', sa.String(length=3), nullable=True))
+
+    op.create_index('ix_projects_min_investment', 'projects', ['min_investment_cents'], unique=False)
+    op.create_index('ix_projects_expected_return', 'projects', ['expected_return_bp'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_projects_expected_return', table_name='projects')
+    op.drop_index('ix_projects_min_investment', table_name='projects')
+
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_column('currency')
+        batch_op.drop_column('expected_return_bp')
+        batch_op.drop_column('total_investment_cents')
+        batch_op.drop_column('min_investment_cents')
@@ -0,0 +1,35 @@
+"""add derived content fields to articles
+
+Revision ID: a7c4e1f9d306
+Revises: 6f3a8c2d1b94
+Create Date: 2026-10-17 17:02:33.815460
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c4e1f9d306'
+down_revision = '6f3a8c2d1b94'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Los valores se rellenan con: flask data backfill-article-content
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('plain_text', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('word_count', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('reading_time', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('toc', sa.JSON(), nullable=True))
+        batch_op.add_column(sa.Column('content_html', sa.Text(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.drop_column('content_html')
+        batch_op.drop_column('toc')
+        batch_op.drop_column('reading_time')
+        batch_op.drop_column('word_count')
+        batch_op.drop_column('plain_text')
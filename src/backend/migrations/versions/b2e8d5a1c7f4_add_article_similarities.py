@@ -0,0 +1,33 @@
+"""add article similarities table
+
+Revision ID: b2e8d5a1c7f4
+Revises: a7c4e1f9d306
+Create Date: 2026-10-17 17:48:12.107394
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b2e8d5a1c7f4'
+down_revision = 'a7c4e1f9d306'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Se rellena con: flask data build-similarities
+    op.create_table(
+        'article_similarities',
+        sa.Column('article_id', sa.Integer(), nullable=False),
+        sa.Column('related_id', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['article_id'], ['articles.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['related_id'], ['articles.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('article_id', 'related_id'),
+    )
+
+
+def downgrade():
+    op.drop_table('article_similarities')
@@ -0,0 +1,115 @@
+"""add full text search vectors to articles and projects
+
+Revision ID: c5d1f7a2e894
+Revises: 8e2a6d4f1c37
+Create Date: 2026-10-17 12:41:55.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5d1f7a2e894'
+down_revision = '8e2a6d4f1c37'
+branch_labels = None
+depends_on = None
+
+
+# Español sin acentos: "inversión" e "inversion" producen el mismo lexema
+CREATE_CONFIG = """
+CREATE EXTENSION IF NOT EXISTS unaccent;
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'es_unaccent') THEN
+        CREATE TEXT SEARCH CONFIGURATION es_unaccent (COPY = spanish);
+        ALTER TEXT SEARCH CONFIGURATION es_unaccent
+            ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+    END IF;
+END
+$$;
+"""
+
+# Pesos: A = título, B = resumen, C = metadatos, D = cuerpo
+ARTICLES_TRIGGER = """
+CREATE OR REPLACE FUNCTION articles_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('es_unaccent', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('es_unaccent', coalesce(NEW.excerpt, '')), 'B') ||
+        setweight(to_tsvector('es_unaccent', coalesce(NEW.meta_keywords, '')), 'C') ||
+        setweight(to_tsvector('es_unaccent',
+            regexp_replace(coalesce(NEW.content, ''), '<[^>]+>', ' ', 'g')), 'D');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER articles_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, excerpt, meta_keywords, content ON articles
+    FOR EACH ROW EXECUTE FUNCTION articles_search_vector_update();
+"""
+
+# jsonb_to_tsvector(..., '["string"]') indexa solo los valores de texto del JSON
+PROJECTS_TRIGGER = """
+CREATE OR REPLACE FUNCTION projects_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('es_unaccent', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('es_unaccent',
+            coalesce(NEW.subtitle, '') || ' ' || coalesce(NEW.description, '')), 'B') ||
+        setweight(to_tsvector('es_unaccent', coalesce(NEW.category, '')) ||
+            jsonb_to_tsvector('es_unaccent',
+                coalesce(NEW.investment_data::jsonb, '{}'::jsonb), '["string"]'), 'C') ||
+        setweight(jsonb_to_tsvector('es_unaccent',
+            coalesce(NEW.content_sections::jsonb, '[]'::jsonb), '["string"]'), 'D');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER projects_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, subtitle, description, category,
+        investment_data, content_sections ON projects
+    FOR EACH ROW EXECUTE FUNCTION projects_search_vector_update();
+"""
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        # SQLite usa la tabla FTS5 creada por db.create_all() (ver search_index.py)
+        return
+
+    op.execute(CREATE_CONFIG)
+
+    op.add_column('articles', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.add_column('projects', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    op.execute(ARTICLES_TRIGGER)
+    op.execute(PROJECTS_TRIGGER)
+
+    # Rellenar los vectores existentes disparando los triggers una sola vez
+    op.execute("UPDATE articles SET title = title")
+    op.execute("UPDATE projects SET title = title")
+
+    op.create_index('ix_articles_search', 'articles', ['search_vector'], postgresql_using='gin')
+    op.create_index('ix_projects_search', 'projects', ['search_vector'], postgresql_using='gin')
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_projects_search', table_name='projects')
+    op.drop_index('ix_articles_search', table_name='articles')
+
+    op.execute("DROP TRIGGER IF EXISTS projects_search_vector_trigger ON projects")
+    op.execute("DROP TRIGGER IF EXISTS articles_search_vector_trigger ON articles")
+    op.execute("DROP FUNCTION IF EXISTS projects_search_vector_update()")
+    op.execute("DROP FUNCTION IF EXISTS articles_search_vector_update()")
+
+    op.drop_column('projects', 'search_vector')
+    op.drop_column('articles', 'search_vector')
+
+    op.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS es_unaccent")
@@ -0,0 +1,34 @@
+"""add prefix index to article slugs
+
+Revision ID: c8f2a4d6e1b3
+Revises: b2e8d5a1c7f4
+Create Date: 2026-10-17 19:02:37.518430
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8f2a4d6e1b3'
+down_revision = 'b2e8d5a1c7f4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # slug LIKE 'base-%' (sufijos libres) solo usa un índice con varchar_pattern_ops
+    # cuando la collation de la base de datos no es C
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_index(
+            'ix_articles_slug_pattern',
+            'articles',
+            ['slug'],
+            unique=False,
+            postgresql_ops={'slug': 'varchar_pattern_ops'},
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_articles_slug_pattern', table_name='articles')
@@ -0,0 +1,28 @@
+"""add responsive image variants to articles
+
+Revision ID: d9a3b7e5c2f1
+Revises: c8f2a4d6e1b3
+Create Date: 2026-10-17 19:48:12.604927
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd9a3b7e5c2f1'
+down_revision = 'c8f2a4d6e1b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Los valores (y las variantes de las galerías) se rellenan con:
+    # flask data backfill-image-variants
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('image_variants', sa.JSON(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.drop_column('image_variants')
@@ -0,0 +1,31 @@
+"""add similarity_pending flag to articles
+
+Revision ID: e7c4a9d2b5f3
+Revises: d9a3b7e5c2f1
+Create Date: 2026-10-17 21:05:37.118402
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7c4a9d2b5f3'
+down_revision = 'd9a3b7e5c2f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Las filas existentes ya tienen vecinos (o los calcula flask data build-similarities)
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column('similarity_pending', sa.Boolean(), nullable=False, server_default=sa.false())
+        )
+        batch_op.create_index('ix_articles_similarity_pending', ['similarity_pending'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('articles', schema=None) as batch_op:
+        batch_op.drop_index('ix_articles_similarity_pending')
+        batch_op.drop_column('similarity_pending')
@@ -0,0 +1,134 @@
+# test_article_slugs_api.py
+# -----------------------------------------------------------------------------
+# Tests de la asignación de slugs únicos de artículos contra la BD de tests:
+# sufijo -N para títulos repetidos, reintento ante IntegrityError, cambio de
+# título en la actualización, números en el título que no son sufijos
+# ("guia-2025"), huecos de borrados no reutilizados, asignación en lote
+# (importaciones) y distinción de IntegrityError ajenos al slug.
+# -----------------------------------------------------------------------------
+
+import uuid
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db
+
+from app.models.article import Article
+from app.services import article_service
+from app.utils.slug_allocation import allocate_slugs, is_slug_conflict, next_free_slug
+
+
+def _payload(title):
+    return {"title": title, "image": "https://example.com/img.jpg", "content": "<p>Contenido</p>"}
+
+
+def test_repeated_titles_get_numbered_slugs(client):
+    title = f"Titulo repetido {uuid.uuid4().hex[:8]}"
+    slugs = [client.post("/api/articles/", json=_payload(title)).get_json()["slug"] for _ in range(3)]
+    base = slugs[0]
+    assert slugs == [base, f"{base}-2", f"{base}-3"]
+
+    # Un slug que solo comparte prefijo no cuenta como sufijo ocupado
+    assert next_free_slug(Article.slug, base[:-1]) == base[:-1]
+
+
+def test_year_like_suffix_does_not_shift_numbering(client):
+    base = f"guia-{uuid.uuid4().hex[:8]}"
+    client.post("/api/articles/", json=_payload(f"{base} 2025"))
+    assert next_free_slug(Article.slug, base, source=article_service.SLUG_SOURCE) == base
+
+    client.post("/api/articles/", json=_payload(base))
+    # "base-2025" viene de un título que termina en un año, no del asignador
+    assert client.post("/api/articles/", json=_payload(base)).get_json()["slug"] == f"{base}-2"
+    assert allocate_slugs(Article.slug, [base, base], source=article_service.SLUG_SOURCE) == [
+        f"{base}-3", f"{base}-4",
+    ]
+
+
+def test_create_retries_when_slug_is_taken_concurrently(client):
+    title = f"Titulo concurrente {uuid.uuid4().hex[:8]}"
+    base = client.post("/api/articles/", json=_payload(title)).get_json()["slug"]
+
+    # La primera consulta devuelve un slug ya ocupado, como si otra petición se adelantara
+    calls = []
+
+    def stale_then_real(column, slug_base, **kwargs):
+        calls.append(slug_base)
+        if len(calls) == 1:
+            return slug_base
+        return next_free_slug(column, slug_base, **kwargs)
+
+    with patch.object(article_service, "next_free_slug", stale_then_real):
+        res = client.post("/api/articles/", json=_payload(title))
+    assert res.status_code == 201
+    assert res.get_json()["slug"] == f"{base}-2"
+    assert len(calls) == 2
+
+
+def test_update_keeps_suffixed_slug_and_allocates_new_one(client):
+    title = f"Titulo editado {uuid.uuid4().hex[:8]}"
+    client.post("/api/articles/", json=_payload(title))
+    second = client.post("/api/articles/", json=_payload(title)).get_json()
+    assert second["slug"].endswith("-2")
+
+    res = client.put(f"/api/articles/{second['id']}", json={"title": title})
+    assert res.get_json()["slug"] == second["slug"]
+
+    other = f"Otro titulo {uuid.uuid4().hex[:8]}"
+    taken = client.post("/api/articles/", json=_payload(other)).get_json()["slug"]
+    res = client.put(f"/api/articles/{second['id']}", json={"title": other})
+    assert res.status_code == 200
+    assert res.get_json()["slug"] == f"{taken}-2"
+    assert res.get_json()["title"] == other
+
+
+def test_allocate_slugs_in_bulk(client):
+    base = f"lote-{uuid.uuid4().hex[:8]}"
+    client.post("/api/articles/", json=_payload(base))
+
+    assert allocate_slugs(Article.slug, [base, f"{base}-x", base, f"{base}-3"]) == [
+        f"{base}-2", f"{base}-x", f"{base}-3", f"{base}-3-2",
+    ]
+
+
+def test_deleted_suffix_is_not_reused(client):
+    title = f"Titulo borrado {uuid.uuid4().hex[:8]}"
+    created = [client.post("/api/articles/", json=_payload(title)).get_json() for _ in range(3)]
+    base = created[0]["slug"]
+
+    client.delete(f"/api/articles/{created[1]['id']}")
+    # base-2 puede seguir enlazado o indexado: no pasa a otro contenido
+    assert client.post("/api/articles/", json=_payload(title)).get_json()["slug"] == f"{base}-4"
+
+
+def test_retitle_does_not_keep_numeric_tail_of_another_base(client):
+    word = f"Retitulo {uuid.uuid4().hex[:8]}"
+    base = client.post("/api/articles/", json=_payload(word)).get_json()["slug"]
+    yearly = client.post("/api/articles/", json=_payload(f"{word} 2025")).get_json()
+    assert yearly["slug"] == f"{base}-2025"
+
+    res = client.put(f"/api/articles/{yearly['id']}", json={"title": word})
+    assert res.get_json()["slug"] == f"{base}-2"
+
+
+def test_is_slug_conflict_ignores_other_integrity_errors(app):
+    taken = f"conflicto-{uuid.uuid4().hex[:8]}"
+    db.session.add(Article(title="Conflicto", slug=taken, image="img.jpg", content="<p>x</p>"))
+    db.session.commit()
+
+    with pytest.raises(IntegrityError) as duplicate:
+        db.session.add(Article(title="Conflicto", slug=taken, image="img.jpg", content="<p>x</p>"))
+        db.session.flush()
+    db.session.rollback()
+    assert is_slug_conflict(duplicate.value, Article.slug)
+
+    with pytest.raises(IntegrityError) as not_null:
+        db.session.add(Article(title=None, slug=f"{taken}-x", image="img.jpg", content="<p>x</p>"))
+        db.session.flush()
+    db.session.rollback()
+    assert not is_slug_conflict(not_null.value, Article.slug)
+
+    db.session.delete(Article.query.filter_by(slug=taken).one())
+    db.session.commit()
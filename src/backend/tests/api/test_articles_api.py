@@ -8,6 +8,8 @@
 # Usa mocking de ArticleService para evitar lógica de negocio real.
 
 import pytest
+from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 from app import create_app
 
@@ -24,13 +26,56 @@ def app():
 def client(app):
     return app.test_client()
 
+@patch("app.api.articles.ArticleService.get_listing_version", return_value=(0, None))
 @patch("app.api.articles.ArticleService.get_all_articles")
-def test_get_articles(mock_get_all, client):
+def test_get_articles(mock_get_all, mock_version, client):
     mock_get_all.return_value = {"articles": [], "total": 0, "current_page": 1, "total_pages": 1}
     res = client.get("/api/articles/")
     assert res.status_code == 200
     assert isinstance(res.get_json(), dict)
 
+@patch("app.api.articles.ArticleService.get_listing_version", return_value=(0, None))
+@patch("app.api.articles.ArticleService.get_articles_page")
+def test_get_articles_cursor_mode(mock_page, mock_version, client):
+    mock_page.return_value = {"articles": [], "next_cursor": "abc", "limit": 5, "total": 12}
+    res = client.get("/api/articles/?cursor=&limit=5&exact=false")
+    assert res.status_code == 200
+    assert res.get_json() == {"articles": [], "next_cursor": "abc", "limit": 5, "total": 12}
+    mock_page.assert_called_once_with(5, "", exact_total=False, fields=None)
+
+@patch("app.api.articles.ArticleService.get_listing_version", return_value=(0, None))
+@patch("app.api.articles.ArticleService.get_all_articles")
+def test_get_articles_summary_and_fields(mock_get_all, mock_version, client):
+    article = SimpleNamespace(
+        id=1, title="Test", slug="test", author="BAP", date=datetime(2025, 1, 1), excerpt="Resumen",
+        image="img.jpg", image_alt=None, content="<p>" + "palabra " * 450 + "</p>", related=[],
+        meta_description=None, meta_keywords=None, word_count=450, reading_time=3, toc=[],
+        content_html=None,
+    )
+    mock_get_all.return_value = {"articles": [article], "total": 1, "current_page": 1, "total_pages": 1}
+
+    summary = client.get("/api/articles/").get_json()["articles"][0]
+    assert "content" not in summary
+    assert summary["reading_time"] == 3
+    assert mock_get_all.call_args.kwargs["fields"] is None
+
+    full = client.get("/api/articles/?fields=all").get_json()["articles"][0]
+    assert full["content"] == article.content
+    assert "content" in mock_get_all.call_args.kwargs["fields"]
+
+    res = client.get("/api/articles/?fields=title,slug")
+    assert res.get_json()["articles"][0] == {"title": "Test", "slug": "test"}
+    assert mock_get_all.call_args.kwargs["fields"] == ("title", "slug")
+
+    res = client.get("/api/articles/?fields=title,password")
+    assert res.status_code == 400
+
+@patch("app.api.articles.ArticleService.get_listing_version", return_value=(0, None))
+def test_get_articles_invalid_cursor(mock_version, client):
+    res = client.get("/api/articles/?cursor=no-es-un-cursor")
+    assert res.status_code == 400
+    assert "message" in res.get_json()
+
 @patch("app.api.articles.ArticleService.get_article_by_id")
 def test_get_article_by_id(mock_get, client):
     mock_get.return_value = {"id": 1, "title": "Test"}
@@ -43,6 +88,57 @@ def test_get_article_by_slug(mock_get, client):
     res = client.get("/api/articles/slug/test-slug")
     assert res.status_code == 200
 
+@patch("app.api.articles.ArticleService.get_article_by_slug")
+def test_get_article_by_slug_not_modified(mock_get, client):
+    mock_get.return_value = SimpleNamespace(
+        id=7, slug="test-slug", title="Test", updated_at=datetime(2025, 1, 1, 12, 0), created_at=None
+    )
+    res = client.get("/api/articles/slug/test-slug")
+    assert res.status_code == 200
+    etag = res.headers["ETag"]
+
+    res = client.get("/api/articles/slug/test-slug", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.data == b""
+
+    mock_get.return_value.updated_at = datetime(2025, 1, 2, 12, 0)
+    res = client.get("/api/articles/slug/test-slug", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+
+@patch("app.api.articles.ArticleService.get_related_articles")
+@patch("app.api.articles.ArticleService.get_article_by_slug")
+def test_get_article_by_slug_include_related(mock_get, mock_related, client):
+    mock_get.return_value = SimpleNamespace(
+        id=7, slug="test-slug", title="Test", updated_at=datetime(2025, 1, 1), created_at=None
+    )
+    mock_related.return_value = [SimpleNamespace(
+        id=8, slug="otro", title="Otro", updated_at=datetime(2025, 1, 1), created_at=None
+    )]
+
+    res = client.get("/api/articles/slug/test-slug?include=related")
+    assert res.status_code == 200
+    assert [a["slug"] for a in res.get_json()["related_articles"]] == ["otro"]
+    etag = res.headers["ETag"]
+
+    # Un cambio en un relacionado invalida el ETag del detalle
+    mock_related.return_value[0].updated_at = datetime(2025, 1, 2)
+    res = client.get("/api/articles/slug/test-slug?include=related", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+
+    assert client.get("/api/articles/slug/test-slug").headers["ETag"] != etag
+    assert client.get("/api/articles/slug/test-slug?include=autor").status_code == 400
+
+@patch("app.api.articles.ArticleService.get_listing_version", return_value=(3, datetime(2025, 1, 1)))
+@patch("app.api.articles.ArticleService.get_all_articles")
+def test_get_articles_not_modified_skips_query(mock_get_all, mock_version, client):
+    mock_get_all.return_value = {"articles": [], "total": 3, "current_page": 1, "total_pages": 1}
+    etag = client.get("/api/articles/").headers["ETag"]
+    mock_get_all.reset_mock()
+
+    res = client.get("/api/articles/", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    mock_get_all.assert_not_called()
+
 @patch("app.api.articles.ArticleService.create_article")
 def test_create_article(mock_create, client):
     mock_create.return_value = {"id": 1, "title": "Nuevo"}
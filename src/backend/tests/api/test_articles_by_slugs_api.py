@@ -0,0 +1,68 @@
+# test_articles_by_slugs_api.py
+# -----------------------------------------------------------------------------
+# Tests de POST /api/articles/by-slugs contra la BD de tests: orden, duplicados,
+# vista resumida, límite de slugs y caché por slug (solo los ausentes van a la BD).
+# -----------------------------------------------------------------------------
+
+import uuid
+from sqlalchemy import event
+from app.extensions import db
+from app.services.article_service import MAX_SLUGS_PER_REQUEST, ArticleService
+
+
+def _create(title):
+    return ArticleService.create_article({
+        "title": title,
+        "slug": f"by-slugs-{uuid.uuid4().hex[:8]}",
+        "image": "https://example.com/img.jpg",
+        "content": "<p>Contenido de prueba</p>",
+    })
+
+
+def _count_queries():
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(db.engine, "before_cursor_execute", listener)
+    return statements, lambda: event.remove(db.engine, "before_cursor_execute", listener)
+
+
+def test_by_slugs_order_dedupe_and_cache(client):
+    first, second = _create("Primero"), _create("Segundo")
+    slugs = [second.slug, "no-existe", first.slug, second.slug]
+
+    res = client.post("/api/articles/by-slugs", json={"slugs": slugs})
+    assert res.status_code == 200
+    assert [a["slug"] for a in res.get_json()] == [second.slug, first.slug]
+    assert "content" in res.get_json()[0]
+
+    statements, stop = _count_queries()
+    try:
+        res = client.post("/api/articles/by-slugs", json={"slugs": slugs})
+        assert [a["slug"] for a in res.get_json()] == [second.slug, first.slug]
+        assert not [s for s in statements if "FROM articles" in s]
+    finally:
+        stop()
+
+    # Una modificación invalida la entrada del slug
+    ArticleService.update_article(first.id, {"excerpt": "Nuevo extracto"})
+    res = client.post("/api/articles/by-slugs", json={"slugs": [first.slug]})
+    assert res.get_json()[0]["excerpt"] == "Nuevo extracto"
+
+    ArticleService.delete_article(first.id)
+    ArticleService.delete_article(second.id)
+
+
+def test_by_slugs_summary_and_limits(client):
+    article = _create("Resumen")
+
+    res = client.post("/api/articles/by-slugs?view=summary", json={"slugs": [article.slug]})
+    assert res.status_code == 200
+    assert "content" not in res.get_json()[0]
+    assert res.get_json()[0]["reading_time"] == 1
+
+    too_many = [f"slug-{i}" for i in range(MAX_SLUGS_PER_REQUEST + 1)]
+    assert client.post("/api/articles/by-slugs", json={"slugs": too_many}).status_code == 400
+    assert client.post("/api/articles/by-slugs?view=otra", json={"slugs": []}).status_code == 400
+    assert client.post("/api/articles/by-slugs", json={"slugs": [1, 2]}).status_code == 400
+
+    ArticleService.delete_article(article.id)
@@ -0,0 +1,90 @@
+# test_feeds_api.py
+# -----------------------------------------------------------------------------
+# Tests de GET /api/sitemap.xml y GET /api/articles/feed.xml contra la BD de
+# tests: URLs generadas, 304 condicional (solo por ETag), <dc:creator> y caché
+# regenerada solo cuando cambia max(updated_at) o el número de filas (borrados).
+# -----------------------------------------------------------------------------
+
+import uuid
+from xml.etree import ElementTree
+
+from sqlalchemy import event
+from app.extensions import db
+from app.services.article_service import ArticleService
+
+
+def _create(title):
+    return ArticleService.create_article({
+        "title": title,
+        "slug": f"feed-{uuid.uuid4().hex[:8]}",
+        "image": "https://example.com/img.jpg",
+        "content": "<p>Contenido & más</p>",
+        "excerpt": "Resumen <breve>",
+    })
+
+
+def _count_queries():
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(db.engine, "before_cursor_execute", listener)
+    return statements, lambda: event.remove(db.engine, "before_cursor_execute", listener)
+
+
+def test_sitemap_lists_articles_and_is_cached(client, app):
+    article = _create("Artículo del sitemap")
+
+    res = client.get("/api/sitemap.xml")
+    assert res.status_code == 200
+    assert res.mimetype == "application/xml"
+    root = ElementTree.fromstring(res.data)
+    locs = [el.text for el in root.iter("{http://www.sitemaps.org/schemas/sitemap/0.9}loc")]
+    assert f"{app.config['SITE_URL']}/blog/{article.slug}" in locs
+
+    statements, stop = _count_queries()
+    try:
+        cached = client.get("/api/sitemap.xml")
+    finally:
+        stop()
+    assert cached.data == res.data
+    # Solo las consultas de versión: no se recorren las tablas
+    assert not any("slug" in statement for statement in statements)
+
+    conditional = client.get("/api/sitemap.xml", headers={"If-None-Match": res.headers["ETag"]})
+    assert conditional.status_code == 304
+
+
+def test_feed_regenerates_when_articles_change(client, app):
+    first = _create("Primer artículo del feed")
+
+    res = client.get("/api/articles/feed.xml")
+    assert res.status_code == 200
+    assert res.mimetype == "application/rss+xml"
+    channel = ElementTree.fromstring(res.data).find("channel")
+    items = {item.findtext("link"): item for item in channel.findall("item")}
+    item = items[f"{app.config['SITE_URL']}/blog/{first.slug}"]
+    assert item.findtext("title") == "Primer artículo del feed"
+    assert item.findtext("description") == "Resumen <breve>"
+    assert item.findtext("pubDate")
+
+    second = _create("Segundo artículo del feed")
+    updated = client.get("/api/articles/feed.xml")
+    assert updated.headers["ETag"] != res.headers["ETag"]
+    assert second.slug.encode() in updated.data
+
+
+def test_feed_uses_dc_creator_and_etag_only(client, app):
+    article = _create("Artículo con autor")
+
+    res = client.get("/api/articles/feed.xml")
+    assert "Last-Modified" not in res.headers
+    channel = ElementTree.fromstring(res.data).find("channel")
+    item = next(i for i in channel.findall("item") if i.findtext("link").endswith(article.slug))
+    assert item.find("author") is None
+    assert item.findtext("{http://purl.org/dc/elements/1.1/}creator") == article.author
+
+    # Un borrado no cambia max(updated_at), pero sí el ETag (recuento)
+    ArticleService.delete_article(article.id)
+    res = client.get("/api/articles/feed.xml", headers={"If-None-Match": res.headers["ETag"]})
+    assert res.status_code == 200
+    assert article.slug.encode() not in res.data
+    assert "Last-Modified" not in client.get("/api/sitemap.xml").headers
@@ -2,6 +2,7 @@ import json
 import pytest
 import uuid
 from app.models.project import Project
+from app.models.user import User
 
 
 def test_get_projects(client):
@@ -272,3 +273,744 @@ def test_create_project_missing_required_fields(client, admin_token):
     assert res.status_code == 400  # Validation error
     response_data = res.get_json()
     assert "title" in response_data
+
+
+def _create_projects(_db, count, priority=0):
+    """Crea proyectos directamente en BD y devuelve sus slugs."""
+    unique_id = str(uuid.uuid4())[:8]
+    slugs = []
+    for i in range(count):
+        project = Project(
+            slug=f"paged-{unique_id}-{i}",
+            title=f"Paged Project {i}",
+            priority=priority,
+        )
+        _db.session.add(project)
+        slugs.append(project.slug)
+    _db.session.commit()
+    return slugs
+
+
+def test_get_projects_cursor_pagination(client, _db):
+    """Recorre todas las páginas con cursor sin repetir ni perder proyectos"""
+    slugs = _create_projects(_db, 3, priority=5)
+
+    seen = []
+    cursor = None
+    while True:
+        url = "/api/projects/?limit=2" + (f"&cursor={cursor}" if cursor else "")
+        res = client.get(url)
+        assert res.status_code == 200
+        body = res.get_json()
+        assert body["limit"] == 2
+        assert len(body["projects"]) <= 2
+        seen.extend(body["projects"])
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+
+    seen_slugs = [p["slug"] for p in seen]
+    assert len(seen_slugs) == len(set(seen_slugs))
+    assert set(slugs) <= set(seen_slugs)
+    assert seen_slugs == [p.slug for p in Project.query.order_by(
+        Project.priority.desc(), Project.created_at.desc(), Project.id.desc()
+    ).all()]
+
+
+def test_get_projects_limit_is_capped(client):
+    """El tamaño de página se acota al máximo permitido"""
+    res = client.get("/api/projects/?limit=100000")
+    assert res.status_code == 200
+    assert res.get_json()["limit"] == 100
+
+
+def test_get_projects_invalid_cursor(client):
+    """Un cursor manipulado devuelve 400"""
+    res = client.get("/api/projects/?cursor=not-a-valid-cursor")
+    assert res.status_code == 400
+    assert "Cursor inválido" in res.get_json()["error"]
+
+
+def test_get_projects_summary_view_excludes_heavy_json(client, _db):
+    """La vista por defecto no incluye content_sections ni gallery"""
+    unique_id = str(uuid.uuid4())[:8]
+    project = Project(
+        slug=f"summary-{unique_id}",
+        title="Summary Project",
+        gallery=[{"url": "https://example.com/a.jpg", "alt": "a"}],
+        investment_data={
+            "total_investment": 110000,
+            "expected_return": "12%",
+            "financial_breakdown": [{"concept": "Compra", "amount": 85000}],
+            "property_specs": {"address": "Calle Venezuela", "rooms": 5, "floor": "Primera planta"},
+        },
+        content_sections=[{"type": "hero", "title": "Hero"}],
+    )
+    _db.session.add(project)
+    _db.session.commit()
+    _db.session.expunge_all()
+
+    res = client.get("/api/projects/")
+    assert res.status_code == 200
+    item = next(p for p in res.get_json() if p["slug"] == f"summary-{unique_id}")
+    assert "content_sections" not in item
+    assert "gallery" not in item
+    assert item["investment_data"] == {
+        "total_investment": 110000,
+        "expected_return": "12%",
+        "property_specs": {"address": "Calle Venezuela", "rooms": 5},
+    }
+
+    res = client.get("/api/projects/?view=full")
+    item = next(p for p in res.get_json() if p["slug"] == f"summary-{unique_id}")
+    assert item["content_sections"] == [{"type": "hero", "title": "Hero"}]
+    assert item["investment_data"]["financial_breakdown"][0]["amount"] == 85000
+
+
+def test_get_projects_invalid_view(client):
+    """Una vista desconocida devuelve 400"""
+    res = client.get("/api/projects/?view=everything")
+    assert res.status_code == 400
+
+
+def test_get_project_etag_not_modified(client, _db):
+    """El detalle responde 304 con el ETag vigente y 200 tras una modificación"""
+    slug = _create_projects(_db, 1)[0]
+
+    res = client.get(f"/api/projects/{slug}")
+    assert res.status_code == 200
+    etag = res.headers["ETag"]
+    assert res.headers["Last-Modified"]
+
+    res = client.get(f"/api/projects/{slug}", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.data == b""
+
+    res = client.put(f"/api/projects/{slug}", json={"description": "Nueva descripción"})
+    assert res.status_code == 200
+
+    res = client.get(f"/api/projects/{slug}", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.headers["ETag"] != etag
+
+
+def test_get_projects_list_etag_changes_with_catalogue(client, _db):
+    """El ETag del listado depende del catálogo y de los parámetros"""
+    etag = client.get("/api/projects/").headers["ETag"]
+    assert client.get("/api/projects/", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/api/projects/?view=full", headers={"If-None-Match": etag}).status_code == 200
+
+    _create_projects(_db, 1)
+    assert client.get("/api/projects/", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_get_projects_list_ignores_if_modified_since(client, _db):
+    """El listado no envía Last-Modified: un borrado no cambia max(updated_at)"""
+    slug = _create_projects(_db, 1)[0]
+    res = client.get("/api/projects/")
+    etag = res.headers["ETag"]
+    assert "Last-Modified" not in res.headers
+    headers = {"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+    assert client.get("/api/projects/", headers=headers).status_code == 200
+
+    _db.session.delete(Project.query.filter_by(slug=slug).one())
+    _db.session.commit()
+    res = client.get("/api/projects/", headers={"If-None-Match": etag, **headers})
+    assert res.status_code == 200
+    assert slug not in {project["slug"] for project in res.get_json()}
+
+
+def test_get_projects_filters(client, _db):
+    """Filtra por categoría, estados y destacados en servidor"""
+    unique_id = str(uuid.uuid4())[:8]
+    category = f"cat-{unique_id}"
+    rows = [
+        ("a", "open", True, 3),
+        ("b", "funded", False, 2),
+        ("c", "closed", True, 1),
+    ]
+    for suffix, status, featured, priority in rows:
+        _db.session.add(Project(
+            slug=f"filter-{unique_id}-{suffix}",
+            title=f"Filter {suffix}",
+            category=category,
+            status=status,
+            featured=featured,
+            priority=priority,
+        ))
+    _db.session.commit()
+
+    res = client.get(f"/api/projects/?category={category}")
+    assert [p["slug"][-1] for p in res.get_json()] == ["a", "b", "c"]
+
+    res = client.get(f"/api/projects/?category={category}&status=open,funded")
+    assert [p["slug"][-1] for p in res.get_json()] == ["a", "b"]
+
+    res = client.get(f"/api/projects/?category={category}&status=open&status=closed&featured=true")
+    assert [p["slug"][-1] for p in res.get_json()] == ["a", "c"]
+
+    res = client.get(f"/api/projects/?category={category}&featured=false")
+    assert [p["slug"][-1] for p in res.get_json()] == ["b"]
+
+
+def test_get_projects_sort_by_views_with_cursor(client, _db):
+    """Ordena por visitas y el cursor respeta la ordenación"""
+    unique_id = str(uuid.uuid4())[:8]
+    category = f"views-{unique_id}"
+    for i, views in enumerate([10, 30, 20]):
+        _db.session.add(Project(
+            slug=f"views-{unique_id}-{i}", title="Views", category=category, views=views
+        ))
+    _db.session.commit()
+
+    res = client.get(f"/api/projects/?category={category}&sort=views&limit=2")
+    body = res.get_json()
+    assert [p["slug"] for p in body["projects"]] == [f"views-{unique_id}-1", f"views-{unique_id}-2"]
+
+    res = client.get(f"/api/projects/?category={category}&sort=views&limit=2&cursor={body['next_cursor']}")
+    assert [p["slug"] for p in res.get_json()["projects"]] == [f"views-{unique_id}-0"]
+
+    # Un cursor de otra ordenación no es válido
+    res = client.get(f"/api/projects/?category={category}&sort=created_at&cursor={body['next_cursor']}")
+    assert res.status_code == 400
+
+
+def test_get_projects_invalid_filters(client):
+    """Valores de filtro u orden no válidos devuelven 400"""
+    assert client.get("/api/projects/?status=pending").status_code == 400
+    assert client.get("/api/projects/?featured=maybe").status_code == 400
+    assert client.get("/api/projects/?sort=title").status_code == 400
+
+
+def _create_freemium_project(_db, free_sections_count=2, sections=5):
+    unique_id = str(uuid.uuid4())[:8]
+    project = Project(
+        slug=f"freemium-{unique_id}",
+        title="Freemium Project",
+        free_sections_count=free_sections_count,
+        content_sections=[{"type": "section", "title": f"S{i}"} for i in range(sections)],
+    )
+    _db.session.add(project)
+    _db.session.commit()
+    return project.slug
+
+
+def _login(client, _db, is_admin=False):
+    unique_id = str(uuid.uuid4())[:8]
+    user = User(
+        username=f"Reader_{unique_id}", last_name="Test", email=f"reader_{unique_id}@test.com",
+        is_admin=is_admin,
+    )
+    user.set_password("SecurePass123!")
+    _db.session.add(user)
+    _db.session.commit()
+    res = client.post("/api/auth/login", json={"email": user.email, "password": "SecurePass123!"})
+    assert res.status_code == 200
+
+
+def test_get_project_anonymous_receives_free_sections_only(client, _db):
+    """Los anónimos reciben solo las secciones gratuitas"""
+    slug = _create_freemium_project(_db, free_sections_count=2, sections=5)
+
+    res = client.get(f"/api/projects/{slug}")
+    assert res.status_code == 200
+    body = res.get_json()
+    assert [s["title"] for s in body["content_sections"]] == ["S0", "S1"]
+    assert body["locked_sections"] == 3
+    assert "Cookie" in res.headers["Vary"]
+
+
+def test_get_project_authenticated_receives_all_sections(client, _db):
+    """Un usuario autenticado recibe todas las secciones y su propio ETag"""
+    slug = _create_freemium_project(_db, free_sections_count=1, sections=3)
+    anonymous_etag = client.get(f"/api/projects/{slug}").headers["ETag"]
+
+    _login(client, _db)
+    res = client.get(f"/api/projects/{slug}", headers={"If-None-Match": anonymous_etag})
+    assert res.status_code == 200
+    body = res.get_json()
+    assert len(body["content_sections"]) == 3
+    assert body["locked_sections"] == 0
+
+
+def test_get_project_full_requires_admin_session(client, _db):
+    """El editor del panel recibe todas las secciones solo con sesión de administrador"""
+    slug = _create_freemium_project(_db, free_sections_count=1, sections=3)
+    assert client.get(f"/api/projects/{slug}/full").status_code == 401
+
+    _login(client, _db)
+    assert client.get(f"/api/projects/{slug}/full").status_code == 403
+
+    _login(client, _db, is_admin=True)
+    res = client.get(f"/api/projects/{slug}/full")
+    assert res.status_code == 200
+    assert len(res.get_json()["content_sections"]) == 3
+    assert res.headers["Cache-Control"] == "private, no-store"
+
+
+def test_update_project_keeps_locked_sections_from_free_payload(client, _db):
+    """Un PUT con las secciones de la variante gratuita no borra las bloqueadas"""
+    slug = _create_freemium_project(_db, free_sections_count=1, sections=3)
+    free = client.get(f"/api/projects/{slug}").get_json()
+
+    sections = [{**free["content_sections"][0], "title": "S0 editada"}]
+    res = client.put(f"/api/projects/{slug}", json={
+        "content_sections": sections, "locked_sections": free["locked_sections"],
+    })
+    assert res.status_code == 200
+    assert [s["title"] for s in res.get_json()["content_sections"]] == ["S0 editada", "S1", "S2"]
+
+    res = client.put(f"/api/projects/{slug}", json={"content_sections": sections, "locked_sections": 9})
+    assert res.status_code == 409
+
+
+def test_get_project_variants_are_cached_separately(client, _db):
+    """Cada variante se serializa una vez y se sirve después desde caché"""
+    from unittest.mock import patch
+    from app.services import project_service
+
+    slug = _create_freemium_project(_db, free_sections_count=1, sections=3)
+    original_dump = project_service.project_schema.dump
+    with patch.object(project_service.project_schema, "dump", side_effect=original_dump) as dump:
+        for _ in range(3):
+            assert len(client.get(f"/api/projects/{slug}").get_json()["content_sections"]) == 1
+        assert dump.call_count == 1
+
+        _login(client, _db)
+        for _ in range(3):
+            assert len(client.get(f"/api/projects/{slug}").get_json()["content_sections"]) == 3
+        assert dump.call_count == 2
+
+
+def _facet_count(facets, name, value):
+    return next((f["count"] for f in facets[name] if f["value"] == value), 0)
+
+
+def test_get_project_facets(client, _db):
+    """Las facetas cuentan proyectos por categoría, estado y destacado"""
+    category = f"cat-{uuid.uuid4().hex[:8]}"
+    for featured in (True, False, False):
+        _db.session.add(Project(
+            slug=f"facet-{uuid.uuid4().hex[:8]}",
+            title="Facet Project",
+            category=category,
+            status="funded",
+            featured=featured,
+        ))
+    _db.session.commit()
+    client.post("/api/projects/", json={"slug": f"facet-{uuid.uuid4().hex[:8]}", "title": "Reset"})
+
+    res = client.get("/api/projects/facets")
+    assert res.status_code == 200
+    facets = res.get_json()
+    assert _facet_count(facets, "category", category) == 3
+    assert facets["total"] == Project.query.count()
+    assert facets["total"] == sum(f["count"] for f in facets["featured"])
+    assert {f["value"] for f in facets["featured"]} <= {True, False}
+
+
+def test_get_project_facets_cache_invalidated_by_writes(client, _db):
+    """Las facetas se cachean y se invalidan al escribir a través de la API"""
+    category = f"cat-{uuid.uuid4().hex[:8]}"
+    slug = f"facet-{uuid.uuid4().hex[:8]}"
+    client.get("/api/projects/facets")
+
+    # Una escritura fuera de projects_bp no invalida la caché
+    _db.session.add(Project(slug=f"facet-{uuid.uuid4().hex[:8]}", title="Direct", category=category))
+    _db.session.commit()
+    assert _facet_count(client.get("/api/projects/facets").get_json(), "category", category) == 0
+
+    res = client.post("/api/projects/", json={"slug": slug, "title": "Facet", "category": category})
+    assert res.status_code == 201
+    assert _facet_count(client.get("/api/projects/facets").get_json(), "category", category) == 2
+
+    client.put(f"/api/projects/{slug}", json={"category": f"{category}-b"})
+    facets = client.get("/api/projects/facets").get_json()
+    assert _facet_count(facets, "category", category) == 1
+    assert _facet_count(facets, "category", f"{category}-b") == 1
+
+    client.delete(f"/api/projects/{slug}")
+    facets = client.get("/api/projects/facets").get_json()
+    assert _facet_count(facets, "category", f"{category}-b") == 0
+
+
+def test_get_projects_filter_by_json_fields(client, _db):
+    """Filtros sobre investment_data.currency y el tipo de las secciones"""
+    category = f"cat-{uuid.uuid4().hex[:8]}"
+    data = [
+        ("EUR", [{"type": "hero"}, {"type": "location"}]),
+        ("EUR", [{"type": "faq"}]),
+        ("USD", [{"type": "location"}]),
+    ]
+    slugs = []
+    for currency, sections in data:
+        slug = f"json-{uuid.uuid4().hex[:8]}"
+        _db.session.add(Project(
+            slug=slug,
+            title="JSON Project",
+            category=category,
+            investment_data={"currency": currency, "min_investment": 1000},
+            content_sections=sections,
+        ))
+        slugs.append(slug)
+    _db.session.commit()
+
+    def listed(query):
+        res = client.get(f"/api/projects/?category={category}&{query}")
+        assert res.status_code == 200
+        return {p["slug"] for p in res.get_json()}
+
+    assert listed("currency=eur") == {slugs[0], slugs[1]}
+    assert listed("section_type=location") == {slugs[0], slugs[2]}
+    assert listed("section_type=location&currency=EUR") == {slugs[0]}
+    assert listed("section_type=faq,hero") == {slugs[0], slugs[1]}
+
+
+def test_get_projects_investment_range_filters(client, _db):
+    """Rangos sobre las columnas tipadas derivadas de investment_data"""
+    from app.scripts.import_service import importar_proyectos_desde_json
+
+    category = f"cat-{uuid.uuid4().hex[:8]}"
+    slugs = [f"range-{uuid.uuid4().hex[:8]}" for _ in range(3)]
+    importar_proyectos_desde_json([
+        {"slug": slugs[0], "title": "Range A", "category": category,
+         "investment_data": {"min_investment": 100, "total_investment": "110.000 €",
+                             "expected_return": "12%", "currency": "eur"}},
+        {"slug": slugs[1], "title": "Range B", "category": category,
+         "investment_data": {"min_investment": "1.000", "expected_return": "8,5 %"}},
+    ])
+    res = client.post("/api/projects/", json={
+        "slug": slugs[2], "title": "Range C", "category": category,
+        "investment_data": {"min_investment": 500, "expected_return": "10%"},
+    })
+    assert res.status_code == 201
+
+    project = Project.query.filter_by(slug=slugs[0]).first()
+    assert (project.min_investment_cents, project.total_investment_cents) == (10000, 11000000)
+    assert (project.expected_return_bp, project.currency) == (1200, "EUR")
+
+    def listed(query):
+        res = client.get(f"/api/projects/?category={category}&{query}")
+        assert res.status_code == 200
+        return {p["slug"] for p in res.get_json()}
+
+    assert listed("min_investment_max=500") == {slugs[0], slugs[2]}
+    assert listed("expected_return_min=10") == {slugs[0], slugs[2]}
+    assert listed("expected_return_min=8.5&expected_return_max=10") == {slugs[1], slugs[2]}
+    assert listed("currency=EUR") == {slugs[0]}
+
+    # Reimportar con nuevos datos recalcula las columnas
+    importar_proyectos_desde_json([{"slug": slugs[1], "investment_data": {"min_investment": 50}}])
+    assert listed("min_investment_max=500") == set(slugs)
+
+    assert client.get("/api/projects/?min_investment_max=mucho").status_code == 400
+
+
+def test_backfill_investment_command(runner, _db):
+    """El comando de backfill rellena las columnas sin tocar updated_at"""
+    slug = f"backfill-{uuid.uuid4().hex[:8]}"
+    project = Project(slug=slug, title="Backfill", investment_data={"min_investment": 250})
+    _db.session.add(project)
+    _db.session.commit()
+    _db.session.execute(
+        Project.__table__.update()
+        .where(Project.__table__.c.id == project.id)
+        .values(min_investment_cents=None, updated_at=None)
+    )
+    _db.session.commit()
+
+    result = runner.invoke(args=["data", "backfill-investment", "--batch-size", "2"])
+    assert result.exit_code == 0, result.output
+
+    _db.session.expire_all()
+    project = Project.query.filter_by(slug=slug).first()
+    assert project.min_investment_cents == 25000
+    assert project.updated_at is None
+
+
+def test_get_project_detail_served_from_serialized_cache(client, app, _db):
+    """Un acierto de caché no vuelve a codificar JSON; update y delete invalidan"""
+    from unittest.mock import patch
+    from app.services import project_service
+    from app.utils.cache import app_cache
+
+    slug = _create_freemium_project(_db, free_sections_count=1, sections=3)
+    project_id = Project.query.filter_by(slug=slug).first().id
+    original_dumps = app.json.dumps_bytes
+    with patch.object(app.json, "dumps_bytes", side_effect=original_dumps) as dumps:
+        bodies = {client.get(f"/api/projects/{slug}").data for _ in range(3)}
+        assert len(bodies) == 1
+        assert dumps.call_count == 1
+
+    with app.test_request_context():
+        cache = app_cache("project_detail")
+        assert any(key[0] == project_id for key in list(cache._data))
+        client.put(f"/api/projects/{slug}", json={"title": "Título actualizado"})
+        assert not any(key[0] == project_id for key in list(cache._data))
+
+    assert client.get(f"/api/projects/{slug}").get_json()["title"] == "Título actualizado"
+    with patch.object(project_service.project_schema, "dump") as dump:
+        client.get(f"/api/projects/{slug}")
+        dump.assert_not_called()
+
+
+def test_bulk_upsert_projects(client, _db):
+    """El alta masiva crea, actualiza e informa de errores por elemento"""
+    existing = f"bulk-{uuid.uuid4().hex[:8]}"
+    _db.session.add(Project(slug=existing, title="Existing", status="funded", priority=3))
+    _db.session.commit()
+    new = f"bulk-{uuid.uuid4().hex[:8]}"
+
+    res = client.post("/api/projects/bulk", json=[
+        {"slug": new, "title": "New Project", "investment_data": {"min_investment": "1.500"}},
+        {"slug": existing, "title": "Existing Updated"},
+        {"slug": "x", "title": "Too short slug"},
+        {"slug": new, "title": "Duplicated"},
+    ])
+    assert res.status_code == 207
+    results = res.get_json()["results"]
+    assert [r["status"] for r in results] == ["created", "updated", "error", "error"]
+    assert "slug" in results[2]["errors"]
+
+    _db.session.expire_all()
+    created = Project.query.filter_by(slug=new).first()
+    assert created.id == results[0]["id"]
+    assert (created.status, created.views, created.min_investment_cents) == ("open", 0, 150000)
+    assert created.updated_at is None
+
+    updated = Project.query.filter_by(slug=existing).first()
+    assert updated.title == "Existing Updated"
+    assert (updated.status, updated.priority) == ("funded", 3)
+    assert updated.updated_at is not None
+
+
+def test_bulk_upsert_projects_invalid_body(client):
+    assert client.post("/api/projects/bulk", json={"slug": "no-list"}).status_code == 400
+    assert client.post("/api/projects/bulk", json=[]).status_code == 400
+
+
+PATCH_HEADERS = {"Content-Type": "application/json-patch+json"}
+
+
+def test_patch_project_section_field(client, _db):
+    """Un replace dentro de content_sections se aplica sin reenviar el array"""
+    slug = _create_freemium_project(_db, free_sections_count=5, sections=3)
+    etag = client.get(f"/api/projects/{slug}").headers["ETag"]
+
+    res = client.patch(f"/api/projects/{slug}", headers=PATCH_HEADERS, data=json.dumps([
+        {"op": "replace", "path": "/content_sections/1/title", "value": "Título corregido"},
+    ]))
+    assert res.status_code == 200
+    sections = res.get_json()["content_sections"]
+    assert sections[1]["title"] == "Título corregido"
+    assert sections[0]["title"] == "S0"
+
+    res = client.get(f"/api/projects/{slug}", headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.get_json()["content_sections"][1]["title"] == "Título corregido"
+
+
+def test_patch_project_general_operations(client, _db):
+    """Operaciones add/remove/test sobre cualquier campo, validadas con el schema"""
+    slug = _create_freemium_project(_db, free_sections_count=5, sections=2)
+
+    res = client.patch(f"/api/projects/{slug}", headers=PATCH_HEADERS, data=json.dumps([
+        {"op": "test", "path": "/content_sections/0/type", "value": "section"},
+        {"op": "add", "path": "/content_sections/-", "value": {"type": "faq", "title": "Nueva"}},
+        {"op": "remove", "path": "/content_sections/0"},
+        {"op": "replace", "path": "/investment_data", "value": {"min_investment": 300}},
+    ]))
+    assert res.status_code == 200
+    body = res.get_json()
+    assert [s["title"] for s in body["content_sections"]] == ["S1", "Nueva"]
+    assert Project.query.filter_by(slug=slug).first().min_investment_cents == 30000
+
+    def patch(operations):
+        return client.patch(f"/api/projects/{slug}", headers=PATCH_HEADERS, data=json.dumps(operations))
+
+    assert patch([{"op": "test", "path": "/title", "value": "Otro"}]).status_code == 409
+    assert patch([{"op": "replace", "path": "/content_sections/9/title", "value": "x"}]).status_code == 409
+    assert patch([{"op": "replace", "path": "/status", "value": "archived"}]).status_code == 400
+    assert patch([{"op": "add", "path": "/slug", "value": "otro-slug"}]).status_code == 400
+    assert patch([{"op": "jump", "path": "/title"}]).status_code == 400
+    assert client.patch(f"/api/projects/{slug}", json=[]).status_code == 415
+
+
+def test_put_project_section(client, _db):
+    """PUT de una sección concreta"""
+    slug = _create_freemium_project(_db, free_sections_count=5, sections=3)
+
+    res = client.put(f"/api/projects/{slug}/sections/2", json={"type": "faq", "content": "FAQ"})
+    assert res.status_code == 200
+    assert res.get_json()["content_sections"][2] == {"type": "faq", "content": "FAQ"}
+    assert len(res.get_json()["content_sections"]) == 3
+
+    assert client.put(f"/api/projects/{slug}/sections/7", json={"type": "faq"}).status_code == 404
+    assert client.put(f"/api/projects/{slug}/sections/0", json=["no"]).status_code == 400
+    assert client.put("/api/projects/no-existe/sections/0", json={"type": "faq"}).status_code == 404
+
+
+def _create_typed_sections_project(_db, free_sections_count=3):
+    types = ["hero", "location", "financial_breakdown", "faq", "legal", "faq"]
+    project = Project(
+        slug=f"sections-{uuid.uuid4().hex[:8]}",
+        title="Sections Project",
+        free_sections_count=free_sections_count,
+        content_sections=[{"type": t, "title": f"S{i}"} for i, t in enumerate(types)],
+    )
+    _db.session.add(project)
+    _db.session.commit()
+    return project.slug
+
+
+def test_get_project_sections_slices(client, _db):
+    """Tramos de secciones con offset/limit/types para usuarios autenticados"""
+    slug = _create_typed_sections_project(_db)
+    _login(client, _db)
+
+    res = client.get(f"/api/projects/{slug}/sections?limit=2")
+    assert res.status_code == 200
+    page = res.get_json()
+    assert [item["index"] for item in page["items"]] == [0, 1]
+    assert page["items"][0]["section"] == {"type": "hero", "title": "S0"}
+    assert (page["total"], page["next_offset"], page["locked_sections"]) == (6, 2, 0)
+
+    page = client.get(f"/api/projects/{slug}/sections?offset=4&limit=5").get_json()
+    assert [item["index"] for item in page["items"]] == [4, 5]
+    assert page["next_offset"] is None
+
+    page = client.get(f"/api/projects/{slug}/sections?types=faq,legal").get_json()
+    assert [item["index"] for item in page["items"]] == [3, 4, 5]
+    assert page["total"] == 3
+
+
+def test_get_project_sections_anonymous_respects_freemium(client, _db):
+    """Los anónimos solo reciben las secciones gratuitas"""
+    slug = _create_typed_sections_project(_db, free_sections_count=3)
+
+    res = client.get(f"/api/projects/{slug}/sections?limit=10")
+    page = res.get_json()
+    assert [item["index"] for item in page["items"]] == [0, 1, 2]
+    assert (page["total"], page["locked_sections"]) == (3, 3)
+    assert client.get(f"/api/projects/{slug}/sections?types=faq").get_json()["items"] == []
+
+    res = client.get(f"/api/projects/{slug}/sections?limit=10", headers={"If-None-Match": res.headers["ETag"]})
+    assert res.status_code == 304
+
+    assert client.get(f"/api/projects/{slug}/sections?limit=0").status_code == 400
+    assert client.get("/api/projects/no-existe/sections").status_code == 404
+
+
+def test_get_project_detail_gzip_compressed_once_per_version(client, _db):
+    """Los JSON grandes se comprimen según Accept-Encoding y se cachean por ETag"""
+    import gzip
+    from unittest.mock import patch
+    from app.utils import compression
+
+    slug = _create_freemium_project(_db, free_sections_count=200, sections=200)
+    plain = client.get(f"/api/projects/{slug}")
+    assert "Content-Encoding" not in plain.headers
+    assert "Accept-Encoding" in plain.headers["Vary"]
+
+    with patch.object(compression, "brotli", None), \
+            patch.object(compression, "_compress", side_effect=compression._compress) as compress:
+        for _ in range(2):
+            res = client.get(f"/api/projects/{slug}", headers={"Accept-Encoding": "gzip, deflate"})
+            assert res.headers["Content-Encoding"] == "gzip"
+            assert gzip.decompress(res.data) == plain.data
+        assert compress.call_count == 1
+
+    etag = res.headers["ETag"]
+    assert etag.startswith("W/")
+    res = client.get(f"/api/projects/{slug}", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert res.status_code == 304
+
+    small = client.get("/api/projects/no-existe", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in small.headers
+
+
+def test_unknown_project_slug_answered_with_minimal_query(client, app, _db):
+    """Un slug que el registro descarta se confirma con SELECT 1 por slug, sin cargar el proyecto"""
+    from sqlalchemy import event
+
+    slug = f"registry-{uuid.uuid4().hex[:8]}"
+    assert client.get(f"/api/projects/{slug}").status_code == 404
+
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(_db.engine, "before_cursor_execute", listener)
+    try:
+        assert client.get(f"/api/projects/{slug}").status_code == 404
+    finally:
+        event.remove(_db.engine, "before_cursor_execute", listener)
+    project_queries = [s for s in statements if "FROM projects" in s]
+    assert len(project_queries) == 1
+    assert "free_sections_count" not in project_queries[0]
+
+    # Alta hecha en otro worker: este registro no la conoce, pero no responde 404
+    other_slug = f"registry-{uuid.uuid4().hex[:8]}"
+    assert client.get(f"/api/projects/{other_slug}").status_code == 404
+    _db.session.execute(Project.__table__.insert().values(slug=other_slug, title="Otro worker"))
+    _db.session.commit()
+    assert client.get(f"/api/projects/{other_slug}").status_code == 200
+    _db.session.execute(Project.__table__.delete().where(Project.__table__.c.slug == other_slug))
+    _db.session.commit()
+
+    # Alta por el ORM y por el upsert masivo (Core)
+    project = Project(slug=slug, title="Registro")
+    _db.session.add(project)
+    _db.session.commit()
+    assert client.get(f"/api/projects/{slug}").status_code == 200
+
+    bulk_slug = f"registry-{uuid.uuid4().hex[:8]}"
+    assert client.get(f"/api/projects/{bulk_slug}").status_code == 404
+    client.post("/api/projects/bulk", json=[{"slug": bulk_slug, "title": "Registro masivo"}])
+    assert client.get(f"/api/projects/{bulk_slug}").status_code == 200
+
+    _db.session.delete(project)
+    _db.session.commit()
+    assert client.get(f"/api/projects/{slug}").status_code == 404
+
+
+def test_slug_registry_bloom_filter_mode():
+    """Por encima del umbral el registro usa un filtro de Bloom sin falsos negativos"""
+    from app.utils.slug_registry import SlugRegistry
+
+    slugs = [f"slug-{i}" for i in range(2000)]
+    registry = SlugRegistry(lambda: slugs, bloom_threshold=1000, error_rate=0.01)
+    registry.rebuild()
+
+    assert registry.is_bloom
+    assert all(registry.might_exist(slug) for slug in slugs)
+    false_positives = sum(registry.might_exist(f"otro-{i}") for i in range(2000))
+    assert false_positives < 100
+
+    registry.add("nuevo")
+    assert registry.might_exist("nuevo")
+
+
+def test_slug_registry_rebuilds_once_under_concurrency():
+    """Con el registro caducado, solo una petición recarga los slugs; las demás no esperan"""
+    import threading
+    from app.utils.slug_registry import SlugRegistry
+
+    loading, release, calls = threading.Event(), threading.Event(), []
+
+    def slow_loader():
+        calls.append(1)
+        loading.set()
+        release.wait(5)
+        return ["existe"]
+
+    registry = SlugRegistry(slow_loader)
+    worker = threading.Thread(target=registry.might_exist, args=("existe",))
+    worker.start()
+    loading.wait(5)
+
+    # Mientras se construye por primera vez no hay registro: no se descarta nada
+    assert registry.might_exist("otro")
+    release.set()
+    worker.join()
+
+    assert len(calls) == 1
+    assert not registry.might_exist("otro")
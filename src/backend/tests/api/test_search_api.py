@@ -0,0 +1,101 @@
+# test_search_api.py
+# -----------------------------------------------------------------------------
+# Tests del endpoint de búsqueda de texto completo (/api/search).
+# En TestingConfig se usa el índice FTS5 de SQLite, mantenido por eventos del ORM
+# al crear, modificar y eliminar artículos y proyectos.
+# -----------------------------------------------------------------------------
+
+import uuid
+from app.models.article import Article
+from app.models.project import Project
+
+
+def _token():
+    """Palabra única para que los tests no compartan resultados."""
+    return "zq" + uuid.uuid4().hex[:10]
+
+
+def _create_article(_db, word, title="Artículo de prueba"):
+    article = Article(
+        title=title,
+        slug=f"search-article-{uuid.uuid4().hex[:8]}",
+        image="https://example.com/img.jpg",
+        excerpt="Extracto del artículo",
+        content=f"<p>Guía de inversión en <strong>{word}</strong> para principiantes</p>",
+    )
+    _db.session.add(article)
+    _db.session.commit()
+    return article
+
+
+def _create_project(_db, word):
+    project = Project(
+        slug=f"search-project-{uuid.uuid4().hex[:8]}",
+        title="Coliving Centro",
+        description="Proyecto de coliving",
+        category="inmobiliario",
+        investment_data={"property": {"address": f"Calle Mayor 1, {word}"}},
+        content_sections=[{"type": "text", "content": "Ubicación en Málaga"}],
+    )
+    _db.session.add(project)
+    _db.session.commit()
+    return project
+
+
+def test_search_finds_articles_and_projects(client, _db):
+    word = _token()
+    article = _create_article(_db, word)
+    project = _create_project(_db, word)
+
+    # La URL documentada, sin barra final, responde sin redirección 308
+    response = client.get(f"/api/search?q={word}")
+    assert response.status_code == 200
+    assert response.get_json() == client.get(f"/api/search/?q={word}").get_json()
+    results = response.get_json()["results"]
+    assert {(r["type"], r["slug"]) for r in results} == {
+        ("article", article.slug),
+        ("project", project.slug),
+    }
+
+
+def test_search_ignores_accents_and_filters_by_type(client, _db):
+    word = _token()
+    project = _create_project(_db, word)
+    _create_article(_db, word)
+
+    response = client.get(f"/api/search/?q=malaga {word}&type=project")
+    assert response.status_code == 200
+    results = response.get_json()["results"]
+    assert [r["slug"] for r in results] == [project.slug]
+
+
+def test_search_index_follows_updates_and_deletes(client, _db):
+    old_word, new_word = _token(), _token()
+    article = _create_article(_db, old_word)
+
+    article.content = f"<p>{new_word}</p>"
+    _db.session.commit()
+    assert client.get(f"/api/search/?q={old_word}").get_json()["results"] == []
+    assert len(client.get(f"/api/search/?q={new_word}").get_json()["results"]) == 1
+
+    _db.session.delete(article)
+    _db.session.commit()
+    assert client.get(f"/api/search/?q={new_word}").get_json()["results"] == []
+
+
+def test_search_ranks_title_matches_first(client, _db):
+    word = _token()
+    in_body = _create_article(_db, word)
+    in_title = _create_article(_db, "otro", title=f"Invertir en {word}")
+
+    results = client.get(f"/api/search/?q={word}").get_json()["results"]
+    assert [r["slug"] for r in results] == [in_title.slug, in_body.slug]
+
+
+def test_search_validates_params(client):
+    assert client.get("/api/search/").status_code == 400
+    assert client.get("/api/search/?q=coliving&type=users").status_code == 400
+    assert client.get("/api/search/?q=coliving&limit=0").status_code == 400
+    response = client.get('/api/search/?q="(*')
+    assert response.status_code == 200
+    assert response.get_json()["results"] == []
@@ -26,3 +26,31 @@ def test_init_app():
     assert cors is not None
     assert ma is not None
     assert mail is not None
+
+
+def test_fast_json_provider_matches_flask_default():
+    """El proveedor JSON rápido produce la misma salida que el de Flask."""
+    from datetime import datetime, timezone
+    from decimal import Decimal
+    from flask.json.provider import DefaultJSONProvider
+    from app.utils.json_provider import FastJSONProvider
+
+    app = Flask(__name__)
+    payload = {
+        "b": [1, 2.5, None, True],
+        "a": {"fecha": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc), "importe": Decimal("10.50")},
+        "texto": "inversión",
+    }
+    fast, default = FastJSONProvider(app), DefaultJSONProvider(app)
+
+    assert default.loads(fast.dumps(payload)) == default.loads(default.dumps(payload))
+    assert fast.dumps_bytes(payload) == fast.dumps(payload).encode("utf-8")
+    assert fast.loads(b'{"a": [1, "\\u00f1"]}') == {"a": [1, "ñ"]}
+    assert list(fast.loads(fast.dumps(payload))) == ["a", "b", "texto"]
+
+
+def test_create_app_uses_fast_json_provider():
+    from app.utils.json_provider import FastJSONProvider
+
+    app = create_app()
+    assert isinstance(app.json, FastJSONProvider)
@@ -53,3 +53,81 @@ def test_article_serialization(app):
 
         db.session.delete(article)
         db.session.commit()
+
+def test_article_derived_content_fields(app):
+    """Los campos derivados se calculan al crear y al actualizar content."""
+    with app.app_context():
+        article = Article(
+            title="Test Derivados",
+            slug="test-derivados",
+            image="img.jpg",
+            content='<h2>Primera parte</h2><p onclick="x()">' + "palabra " * 250 + "</p><script>y()</script>",
+        )
+        db.session.add(article)
+        db.session.commit()
+
+        assert article.word_count == 252
+        assert article.reading_time == 2
+        assert article.toc == [{"id": "primera-parte", "text": "Primera parte", "level": 2}]
+        assert article.content_html.startswith('<h2 id="primera-parte">Primera parte</h2><p>')
+        assert "script" not in article.content_html
+        assert "onclick" not in article.content_html
+
+        article.content = "<p>Texto nuevo</p><h3>Detalle</h3>"
+        db.session.commit()
+        assert article.plain_text == "Texto nuevo Detalle"
+        assert article.reading_time == 1
+        assert article.toc == [{"id": "detalle", "text": "Detalle", "level": 3}]
+
+        db.session.delete(article)
+        db.session.commit()
+
+def test_article_image_variants_are_derived_on_write(app):
+    """image_variants se calcula con el constructor de URLs de Cloudinary al asignar image."""
+    with app.app_context():
+        article = Article(
+            title="Test Variantes",
+            slug="test-variantes",
+            image="https://res.cloudinary.com/demo/image/upload/w_1200,c_limit/v1744023669/blog/portada.webp",
+            content="<p>Contenido</p>",
+        )
+        db.session.add(article)
+        db.session.commit()
+
+        srcset = article.image_variants["srcset"]
+        assert [variant["width"] for variant in srcset] == [320, 640, 960, 1200]
+        assert srcset[0]["url"] == (
+            "https://res.cloudinary.com/demo/image/upload/c_limit,f_auto,q_auto,w_320/v1744023669/blog/portada.webp"
+        )
+        assert article.image_variants["aspect_ratio"] is None
+
+        # Imágenes fuera de Cloudinary no tienen variantes
+        article.image = "/images/local.jpg"
+        db.session.commit()
+        assert article.image_variants is None
+
+        db.session.delete(article)
+        db.session.commit()
+
+def test_article_image_variants_use_upload_dimensions(app):
+    """Las dimensiones de la subida limitan las variantes y se conservan si la imagen no cambia."""
+    from app.services.article_service import ArticleService
+
+    with app.app_context():
+        image = "https://res.cloudinary.com/demo/image/upload/v1744023669/blog/pequena.webp"
+        article = ArticleService.create_article({
+            "title": "Test Dimensiones",
+            "slug": "test-dimensiones-subida",
+            "image": image,
+            "image_width": 800,
+            "image_height": 400,
+            "content": "<p>Contenido</p>",
+        })
+
+        assert article.image_variants["aspect_ratio"] == 2.0
+        assert [variant["width"] for variant in article.image_variants["srcset"]] == [320, 640, 800]
+
+        ArticleService.update_article(article.id, {"image": image, "title": "Test Dimensiones 2"})
+        assert article.image_variants["width"] == 800
+
+        ArticleService.delete_article(article.id)
@@ -0,0 +1,74 @@
+# src/backend/tests/models/test_project_model.py
+#
+# Tests unitarios del modelo Project.
+# Valida las variantes responsive que se añaden a la galería al asignarla.
+
+from app.extensions import db
+from app.models.project import Project
+
+
+def test_project_gallery_gets_responsive_variants(app):
+    """Cada imagen de Cloudinary de la galería guarda srcset, dimensiones y aspect_ratio."""
+    with app.app_context():
+        project = Project(
+            title="Proyecto con galería",
+            slug="proyecto-galeria-variantes",
+            gallery=[
+                {
+                    "url": "https://res.cloudinary.com/demo/image/upload/v1760624551/salon.webp",
+                    "alt": "Salón",
+                    "width": 800,
+                    "height": 600,
+                },
+                {"src": "https://example.com/externa.jpg", "alt": "Externa"},
+            ],
+        )
+        db.session.add(project)
+        db.session.commit()
+
+        first, second = project.gallery
+        assert first["alt"] == "Salón"
+        assert first["aspect_ratio"] == 1.3333
+        # c_limit no amplía: el ancho real sustituye a los breakpoints mayores
+        assert [variant["width"] for variant in first["srcset"]] == [320, 640, 800]
+        assert first["srcset"][-1]["url"].endswith("/c_limit,f_auto,q_auto,w_800/v1760624551/salon.webp")
+        assert second == {"src": "https://example.com/externa.jpg", "alt": "Externa"}
+
+        db.session.delete(project)
+        db.session.commit()
+
+
+def test_gallery_variants_keep_folders_in_public_id(app):
+    """Las carpetas con guion bajo (img_files/, ui_assets/) no se toman por transformaciones."""
+    with app.app_context():
+        project = Project(
+            title="Proyecto con carpetas",
+            slug="proyecto-galeria-carpetas",
+            gallery=[
+                {"url": "https://res.cloudinary.com/demo/image/upload/w_300,c_fill/img_files/salon.jpg"},
+                {"url": "https://res.cloudinary.com/demo/image/upload/c_fill/v1760624551/ui_assets/cocina.png"},
+            ],
+        )
+
+        first, second = project.gallery
+        assert first["srcset"][0]["url"].endswith("/c_limit,f_auto,q_auto,w_320/v1/img_files/salon.jpg")
+        assert second["srcset"][0]["url"].endswith("/c_limit,f_auto,q_auto,w_320/v1760624551/ui_assets/cocina.png")
+
+
+def test_gallery_variants_keep_existing_dimensions(app):
+    """Dimensiones como cadena (JSON antiguo) se convierten y las desconocidas no borran las del elemento."""
+    with app.app_context():
+        project = Project(
+            title="Proyecto con dimensiones antiguas",
+            slug="proyecto-galeria-dimensiones",
+            gallery=[
+                {"url": "https://res.cloudinary.com/demo/image/upload/v1/salon.webp", "width": "800", "height": "600"},
+                {"url": "https://res.cloudinary.com/demo/image/upload/v1/cocina.webp", "width": "ancho", "height": 600},
+            ],
+        )
+
+        first, second = project.gallery
+        assert (first["width"], first["height"], first["aspect_ratio"]) == (800, 600, 1.3333)
+        assert [variant["width"] for variant in first["srcset"]] == [320, 640, 800]
+        assert (second["width"], second["height"]) == ("ancho", 600)
+        assert "aspect_ratio" not in second
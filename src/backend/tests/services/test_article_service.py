@@ -1,8 +1,10 @@
 # src/backend/tests/test_article_service.py
 
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 from app.services.article_service import ArticleService
+from app.utils.pagination import decode_cursor
 from app import create_app
 
 # Fixture para crear la app y activar contexto Flask
@@ -23,6 +25,7 @@ def client(app):
 @pytest.fixture
 def mock_article_query(monkeypatch, app):
     class QueryMock:
+        def options(self, *args): return self
         def order_by(self, *args, **kwargs): return self
         def offset(self, n): return self
         def limit(self, n): return self
@@ -48,6 +51,37 @@ def test_get_article_by_id():
         article = ArticleService.get_article_by_id(1)
         assert article == mock_article
 
+@pytest.mark.usefixtures("app")
+def test_article_count_is_cached_until_invalidated():
+    ArticleService.invalidate_count()
+    with patch("app.services.article_service.Article.query") as mock_query:
+        mock_query.count.return_value = 5
+        assert ArticleService.count_articles() == 5
+        mock_query.count.return_value = 6
+        assert ArticleService.count_articles() == 5
+        # Fuera de PostgreSQL no hay estimación: se usa el contador exacto
+        assert ArticleService.count_articles(exact=False) == 5
+
+        ArticleService.invalidate_count()
+        assert ArticleService.count_articles() == 6
+        assert mock_query.count.call_count == 2
+
+@pytest.mark.usefixtures("app")
+def test_get_articles_page_uses_extra_row_for_next_cursor():
+    ArticleService.invalidate_count()
+    rows = [MagicMock(id=i, date=datetime(2025, 1, 10 - i, tzinfo=timezone.utc)) for i in range(3)]
+    with patch("app.services.article_service.Article.query") as mock_query:
+        mock_query.options.return_value = mock_query
+        mock_query.order_by.return_value.limit.return_value.all.return_value = rows
+        mock_query.count.return_value = 3
+        page = ArticleService.get_articles_page(limit=2)
+
+    assert page["articles"] == rows[:2]
+    assert page["total"] == 3
+    assert decode_cursor(page["next_cursor"], 2) == [rows[1].date, 1]
+    mock_query.order_by.return_value.limit.assert_called_once_with(3)
+
+@pytest.mark.usefixtures("app")
 @patch("app.services.article_service.db.session")
 @patch("app.services.article_service.Article")
 def test_create_article(mock_article_class, mock_db_session):
@@ -0,0 +1,104 @@
+# test_recommendation_service.py
+# -----------------------------------------------------------------------------
+# Tests de los artículos similares por TF-IDF (RecommendationService).
+# Los artículos usan palabras únicas para no depender del resto de la BD de tests;
+# las escrituras solo marcan similarity_pending y refresh_pending() actualiza
+# article_similarities de forma incremental fuera de la petición.
+# -----------------------------------------------------------------------------
+
+import uuid
+import pytest
+from app.services import recommendation_service
+from app.services.article_service import ArticleService
+from app.services.recommendation_service import RecommendationService
+
+
+def _word():
+    """Palabra única solo con letras (el tokenizador descarta los dígitos)."""
+    return "zr" + "".join(chr(ord("a") + int(c, 16)) for c in uuid.uuid4().hex[:10])
+
+
+def _create(words):
+    return ArticleService.create_article({
+        "title": _word(),
+        "slug": f"similar-{uuid.uuid4().hex[:8]}",
+        "image": "https://example.com/img.jpg",
+        "content": "<p>" + " ".join(words) + "</p>",
+    })
+
+
+def test_sparse_and_dict_models_agree():
+    if recommendation_service.sparse is None:
+        pytest.skip("NumPy/SciPy no instalados")
+    docs = [["renta", "alquiler", "piso"], ["alquiler", "piso", "piso"], ["bolsa", "fondos"], []]
+    sparse_model = recommendation_service._SparseModel(docs)
+    dict_model = recommendation_service._DictModel(docs)
+    for index in range(len(docs)):
+        assert list(sparse_model.scores(index)) == pytest.approx(dict_model.scores(index))
+
+    # Los vecinos por bloques coinciden con los calculados fila a fila
+    ids = [10, 20, 30, 40]
+    assert dict(sparse_model.neighbours(ids, chunk_size=3)) == pytest.approx(dict(dict_model.neighbours(ids)))
+
+
+def test_similarities_are_refreshed_on_write(app):
+    shared, other = _word(), _word()
+    first = _create([shared, shared, _word()])
+    second = _create([shared, _word()])
+    third = _create([other, _word()])
+
+    # La escritura no calcula vecinos: quedan pendientes
+    assert first.similarity_pending
+    assert RecommendationService.get_similar_ids(first.id) == []
+    assert RecommendationService.refresh_pending() >= 3
+    assert not first.similarity_pending
+    assert RecommendationService.get_similar_ids(first.id) == [second.id]
+    assert RecommendationService.get_similar_ids(third.id) == []
+
+    # Al cambiar el contenido, el artículo entra en los vecinos de los demás
+    ArticleService.update_article(third.id, {"content": f"<p>{shared} {shared} {other}</p>"})
+    assert third.similarity_pending
+    RecommendationService.refresh_pending()
+    assert set(RecommendationService.get_similar_ids(first.id)) == {second.id, third.id}
+
+    ArticleService.delete_article(second.id)
+    assert RecommendationService.get_similar_ids(first.id) == [third.id]
+
+    # La reconstrucción completa da el mismo resultado que los refrescos incrementales
+    RecommendationService.build_similarities()
+    assert RecommendationService.get_similar_ids(first.id) == [third.id]
+
+    ArticleService.delete_article(first.id)
+    ArticleService.delete_article(third.id)
+
+
+def test_related_articles_prefer_manual_slugs(app):
+    shared = _word()
+    first = _create([shared])
+    second = _create([shared])
+    manual = _create([_word()])
+    RecommendationService.refresh_pending()
+
+    assert [a.id for a in ArticleService.get_related_articles(first)] == [second.id]
+
+    first.related = [manual.slug, "no-existe"]
+    assert [a.slug for a in ArticleService.get_related_articles(first)] == [manual.slug]
+
+    for article in (first, second, manual):
+        ArticleService.delete_article(article.id)
+
+
+def test_refresh_only_touches_affected_articles(app):
+    shared = _word()
+    first = _create([shared])
+    second = _create([shared])
+    lonely = _create([_word()])
+    RecommendationService.refresh_pending()
+
+    # Un artículo sin palabras en común no reescribe las filas de nadie más
+    assert RecommendationService.refresh_article(lonely.id) == 1
+    assert RecommendationService.refresh_article(first.id) == 2
+    assert RecommendationService.get_similar_ids(second.id) == [first.id]
+
+    for article in (first, second, lonely):
+        ArticleService.delete_article(article.id)
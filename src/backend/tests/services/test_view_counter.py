@@ -0,0 +1,66 @@
+# test_view_counter.py
+# -----------------------------------------------------------------------------
+# Tests del contador de visitas con escritura diferida.
+# Verifica que las visitas al detalle se acumulan en memoria, que el volcado
+# aplica los incrementos en lote sin tocar updated_at y que un volcado fallido
+# conserva los incrementos para el siguiente intento. Los listados que ordenan
+# por visitas cambian de ETag tras el volcado.
+# -----------------------------------------------------------------------------
+
+import uuid
+import pytest
+from unittest.mock import patch
+from app.extensions import db
+from app.models.project import Project
+from app.services import view_counter
+
+
+@pytest.fixture
+def project(app):
+    project = Project(slug=f"views-{uuid.uuid4().hex[:8]}", title="Views Project")
+    db.session.add(project)
+    db.session.commit()
+    view_counter.flush_views(app)
+    return project
+
+
+def test_detail_views_are_buffered_until_flush(client, app, project):
+    """Las visitas no escriben en BD hasta el volcado."""
+    for _ in range(3):
+        assert client.get(f"/api/projects/{project.slug}").status_code == 200
+
+    db.session.refresh(project)
+    assert project.views == 0
+    assert view_counter._get_buffer(app).pending()[project.id] == 3
+
+    assert view_counter.flush_views(app) == 1
+    db.session.refresh(project)
+    assert project.views == 3
+    assert project.updated_at is None
+
+
+def test_failed_flush_keeps_pending_views(app, project):
+    """Si el volcado falla, los incrementos vuelven al buffer."""
+    view_counter.record_view(project.id, app=app)
+    view_counter.record_view(project.id, app=app)
+
+    with patch("app.services.view_counter._apply_batch", side_effect=RuntimeError("db down")):
+        with pytest.raises(RuntimeError):
+            view_counter.flush_views(app)
+
+    assert view_counter._get_buffer(app).pending()[project.id] == 2
+    view_counter.flush_views(app)
+    db.session.refresh(project)
+    assert project.views == 2
+
+
+def test_views_listing_etag_changes_after_flush(client, app, project):
+    """?sort=views no responde 304 con el orden anterior tras volcar visitas."""
+    res = client.get("/api/projects/?sort=views")
+    etag = res.headers["ETag"]
+    assert "Last-Modified" not in res.headers
+    assert client.get("/api/projects/?sort=views", headers={"If-None-Match": etag}).status_code == 304
+
+    client.get(f"/api/projects/{project.slug}")
+    view_counter.flush_views(app)
+    assert client.get("/api/projects/?sort=views", headers={"If-None-Match": etag}).status_code == 200
@@ -53,6 +53,8 @@ export default function EditArticlePage() {
                 excerpt: formData.excerpt,
                 content: formData.content,
                 image: formData.image,
+                image_width: formData.image_width,
+                image_height: formData.image_height,
                 related: formData.related,
             })
             alert('Artículo actualizado correctamente')
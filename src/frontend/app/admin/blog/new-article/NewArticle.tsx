@@ -34,6 +34,8 @@ const NewArticle: React.FC = () => {
           excerpt: articleData.excerpt,
           content: articleData.content,
           image: articleData.image,
+          image_width: articleData.image_width,
+          image_height: articleData.image_height,
           related: articleData.related,
         })
       }
@@ -3,6 +3,7 @@
  *
  * Esta vista utiliza el componente ProjectForm para editar los datos del proyecto.
  * La lógica de actualización se delega a projectService.ts con protección JWT vía fetchWithAuth.
+ * El proyecto se carga con getProjectForEdit (todas las secciones, sesión de administrador).
  */
 
 'use client'
@@ -12,7 +13,7 @@ import ProjectForm from '@/components/admin/projects/ProjectForm'
 import Link from 'next/link'
 import Button from '@/components/ui/Button'
 import LoadingState from '@/components/ui/LoadingState'
-import { getProjectBySlug, updateProject } from '@/lib/api/projectService'
+import { getProjectForEdit, updateProject } from '@/lib/api/projectService'
 import { useRouter, useParams } from 'next/navigation'
 import type { Project, ProjectFormData } from '@/types/project'
 
@@ -27,7 +28,7 @@ const EditProject = () => {
   useEffect(() => {
     const fetchProject = async () => {
       try {
-        const response = await getProjectBySlug(projectId)
+        const response = await getProjectForEdit(projectId)
         setProject(response)
       } catch (error) {
         console.error('Error cargando proyecto:', error)
@@ -57,6 +58,8 @@ const EditProject = () => {
         gallery: projectData.gallery,
         investment_data: projectData.investment_data,
         content_sections: projectData.content_sections,
+        // Si el proyecto llegara truncado, el backend conserva las secciones bloqueadas
+        locked_sections: project?.locked_sections ?? 0,
       })
       alert('Proyecto actualizado correctamente.')
       router.push('/admin/projects')
@@ -65,9 +65,9 @@ const ArticlePage: React.FC = () => {
     }
   );
 
-  // --- SWR secundarios (artículos relacionados) ---
+  // --- SWR secundarios (solo si el backend no resolvió los relacionados) ---
   const { data: allArticles } = useSWR(
-    '/api/articles/related',
+    article && !article.related_articles ? '/api/articles/related' : null,
     relatedFetcher,
     {
       revalidateOnFocus: false,
@@ -78,6 +78,7 @@ const ArticlePage: React.FC = () => {
 
   // --- Calcular artículos relacionados ---
   const relatedArticles = useMemo(() => {
+    if (article?.related_articles) return article.related_articles;
     if (!article?.related || !allArticles?.articles) return [];
     return allArticles.articles.filter((a) => article.related.includes(a.slug));
   }, [article, allArticles]);
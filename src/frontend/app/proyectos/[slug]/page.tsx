@@ -52,10 +52,9 @@ import ProjectProfitabilityScenarios from '@/components/projects/sections/Projec
 import ProjectProcess from '@/components/projects/sections/ProjectProcess';
 import ProjectSensitivityAnalysis from '@/components/projects/sections/ProjectSensitivityAnalysis';
 
-// SWR fetcher function para cache automático
-const fetcher = function fetcher(url: string) {
-    const slug = url.split('/').pop();
-    return getProjectBySlug(slug!);
+// SWR fetcher: la clave incluye la sesión para volver a pedir la variante completa al iniciar sesión
+const fetcher = function fetcher([, slug]: [string, string, boolean]) {
+    return getProjectBySlug(slug);
 };
 
 // TYPE GUARDS PROFESIONALES
@@ -99,7 +98,7 @@ const ProjectDetailPage: React.FC = () => {
 
     // SWR para cache inteligente y revalidación automática
     const { data: project, error, isLoading } = useSWR<Project>(
-        `/api/projects/${slug}`,
+        ['/api/projects', slug, isAuthenticated],
         fetcher,
         {
             revalidateOnFocus: false,
@@ -473,69 +472,43 @@ const ProjectDetailPage: React.FC = () => {
                         </Card>
 
                         {/* CONTENIDO FLEXIBLE CON SISTEMA FREEMIUM */}
+                        {/* El backend solo envía las secciones visibles; locked_sections cuenta las premium */}
                         {project.content_sections && project.content_sections.length > 0 && (
                             <div className="space-y-8">
-                                {project.content_sections.map((section: ContentSection, index: number) => {
-                                    const freeSections = project.free_sections_count || 5;
-
-                                    if (index < freeSections) {
-                                        return renderSection(section, index);
-                                    }
-
-                                    if (index === freeSections) {
-                                        const premiumSections = project.content_sections!.slice(freeSections);
-
-                                        if (isAuthenticated) {
-                                            return (
-                                                <div key="premium-content">
-                                                    {premiumSections.map((premiumSection: ContentSection, premiumIndex: number) =>
-                                                        renderSection(premiumSection, premiumIndex + freeSections)
-                                                    )}
-                                                </div>
-                                            );
-                                        }
-
-                                        return (
-                                            <div key="premium-content">
-                                                <div className="sticky top-36 left-0 right-0 bg-white/70 border-b border-[#6290C3]/20 py-8 px-6 z-10">
-                                                    <div className="text-center max-w-4xl mx-auto">
-                                                        <h3 className="text-3xl font-bold text-[#1A1341] mb-4">
-                                                            Para ver esta información debes estar logueado
-                                                        </h3>
-                                                        <p className="text-lg text-[#6290C3] mb-3">
-                                                            Si aún no tienes cuenta, puedes crearla fácilmente.
-                                                        </p>
-                                                        <p className="text-base text-[#1A1341] mb-6">
-                                                            Si ya tienes cuenta,{' '}
-                                                            <button
-                                                                onClick={() => router.push('/login')}
-                                                                className="underline text-[#1DA1F2] hover:text-[#1A1341] transition-colors"
-                                                            >
-                                                                accede aquí
-                                                            </button>
-                                                        </p>
-                                                        <button
-                                                            onClick={() => router.push('/signup')}
-                                                            className="bg-[#C2E7DA] text-[#1A1341] py-3 px-8 rounded-md font-semibold text-lg hover:bg-white hover:border hover:border-[#C2E7DA] transition-all duration-300 shadow-md hover:shadow-lg"
-                                                        >
-                                                            Regístrate gratis
-                                                        </button>
-                                                    </div>
-                                                </div>
-
-                                                <div className="relative">
-                                                    <div className="blur-sm select-none pointer-events-none">
-                                                        {premiumSections.map((premiumSection: ContentSection, premiumIndex: number) =>
-                                                            renderSection(premiumSection, premiumIndex + freeSections)
-                                                        )}
-                                                    </div>
-                                                </div>
-                                            </div>
-                                        );
-                                    }
+                                {project.content_sections.map((section: ContentSection, index: number) =>
+                                    renderSection(section, index)
+                                )}
+                            </div>
+                        )}
 
-                                    return null;
-                                })}
+                        {(project.locked_sections ?? 0) > 0 && (
+                            <div className="mt-8">
+                                <div className="bg-white border border-[#6290C3]/20 rounded-lg py-8 px-6">
+                                    <div className="text-center max-w-4xl mx-auto">
+                                        <h3 className="text-3xl font-bold text-[#1A1341] mb-4">
+                                            Para ver esta información debes estar logueado
+                                        </h3>
+                                        <p className="text-lg text-[#6290C3] mb-3">
+                                            {project.locked_sections} secciones más de análisis del proyecto.
+                                            Si aún no tienes cuenta, puedes crearla fácilmente.
+                                        </p>
+                                        <p className="text-base text-[#1A1341] mb-6">
+                                            Si ya tienes cuenta,{' '}
+                                            <button
+                                                onClick={() => router.push('/login')}
+                                                className="underline text-[#1DA1F2] hover:text-[#1A1341] transition-colors"
+                                            >
+                                                accede aquí
+                                            </button>
+                                        </p>
+                                        <button
+                                            onClick={() => router.push('/signup')}
+                                            className="bg-[#C2E7DA] text-[#1A1341] py-3 px-8 rounded-md font-semibold text-lg hover:bg-white hover:border hover:border-[#C2E7DA] transition-all duration-300 shadow-md hover:shadow-lg"
+                                        >
+                                            Regístrate gratis
+                                        </button>
+                                    </div>
+                                </div>
                             </div>
                         )}
                     </div>
@@ -33,6 +33,7 @@ const BlogArticleForm: React.FC<BlogArticleFormProps> = ({ onSubmit, initialData
   const [excerpt, setExcerpt] = useState(initialData?.excerpt || '')
   const [content, setContent] = useState(initialData?.content || '')
   const [image, setImage] = useState(initialData?.image || '')
+  const [imageDimensions, setImageDimensions] = useState<{ width: number; height: number } | null>(null)
   const [related, setRelated] = useState<string[]>(initialData?.related || [])
   const [isPreviewMode, setIsPreviewMode] = useState(false)
 
@@ -60,6 +61,8 @@ const BlogArticleForm: React.FC<BlogArticleFormProps> = ({ onSubmit, initialData
       excerpt,
       content,
       image,
+      // Solo tras una subida nueva: con la misma imagen el backend conserva las dimensiones
+      ...(imageDimensions && { image_width: imageDimensions.width, image_height: imageDimensions.height }),
       related,
     }
 
@@ -70,8 +73,9 @@ const BlogArticleForm: React.FC<BlogArticleFormProps> = ({ onSubmit, initialData
     setIsPreviewMode(true)
   }
 
-  const handleImageUpload = (imageUrl: string) => {
+  const handleImageUpload = (imageUrl: string, dimensions?: { width: number; height: number }) => {
     setImage(imageUrl)
+    setImageDimensions(dimensions ?? null)
   }
 
   if (isPreviewMode) {
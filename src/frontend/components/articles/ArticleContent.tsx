@@ -43,7 +43,7 @@ const ArticleContent: React.FC<ArticleContentProps> = ({ article }) => {
         {/* Contenido HTML del artículo con estilos directos de Tailwind */}
         <div
           className="prose prose-lg max-w-none text-[#1A1341] article-content"
-          dangerouslySetInnerHTML={{ __html: article.content }}
+          dangerouslySetInnerHTML={{ __html: article.content_html ?? article.content }}
         />
 
 
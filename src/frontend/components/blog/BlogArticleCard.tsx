@@ -40,7 +40,8 @@ const BlogArticleCard: React.FC<BlogArticleCardProps> = ({ article, from }) => {
   };
 
   const formattedDate = formatDate(article.date);
-  const readTime = calculateReadTime(article.content);
+  // El listado devuelve reading_time y no incluye content
+  const readTime = article.reading_time ?? calculateReadTime(article.content ?? '');
 
   return (
     <article
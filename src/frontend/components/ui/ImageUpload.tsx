@@ -6,7 +6,7 @@
  * Encargado de gestionar la subida de imágenes desde el panel de administración:
  * - Permite seleccionar archivo manualmente o mediante arrastrar y soltar
  * - Muestra vista previa de la imagen seleccionada
- * - Sube la imagen al backend usando el servicio `uploadImage` con protección JWT/CSRF
+ * - Sube la imagen al backend con protección JWT/CSRF y devuelve URL y dimensiones
  * - Permite reemplazar imagen una vez subida
  * - Incluye validación inteligente y manejo de errores visuales integrados
  *
@@ -15,10 +15,10 @@
 
 import React, { useRef, useState, useEffect, useCallback } from 'react'
 import LoadingState from '@/components/ui/LoadingState'
-import { uploadImage } from '@/lib/api/imageService'
+import { uploadImageWithDimensions } from '@/lib/api/imageService'
 
 interface ImageUploadProps {
-  onImageUpload: (imageUrl: string) => void
+  onImageUpload: (imageUrl: string, dimensions?: { width: number; height: number }) => void
   initialImage?: string
   error?: string
   onErrorChange?: (hasError: boolean) => void
@@ -106,8 +106,12 @@ const ImageUpload: React.FC<ImageUploadProps> = ({
     try {
       setIsUploading(true)
       setErrorMessage('')
-      const imageUrl = await uploadImage(formData)
-      onImageUpload(imageUrl)
+      const { url, width, height } = await uploadImageWithDimensions(formData)
+      if (width && height) {
+        onImageUpload(url, { width, height })
+      } else {
+        onImageUpload(url)
+      }
       setUploaded(true)
       setSuccessMessage('Imagen subida con éxito')
       setInternalError(null)
@@ -5,6 +5,12 @@
 
 import { fetchWithAuth } from '@/lib/utils/fetchWithAuth';
 
+export interface UploadedImage {
+    url: string;
+    width?: number;
+    height?: number;
+}
+
 /**
  * Sube una imagen al servidor (Cloudinary o almacenamiento backend)
  * Utiliza un FormData con campo 'image'
@@ -14,6 +20,19 @@ import { fetchWithAuth } from '@/lib/utils/fetchWithAuth';
  * @throws Error si la subida falla
  */
 export async function uploadImage(formData: FormData): Promise<string> {
+    const { url } = await uploadImageWithDimensions(formData);
+    return url;
+}
+
+/**
+ * Sube una imagen y devuelve también sus dimensiones intrínsecas
+ * (las usa el backend para limitar las variantes responsive y calcular aspect_ratio)
+ *
+ * @param formData - FormData que contiene el archivo a subir
+ * @returns URL, ancho y alto de la imagen subida
+ * @throws Error si la subida falla
+ */
+export async function uploadImageWithDimensions(formData: FormData): Promise<UploadedImage> {
     const response = await fetchWithAuth('/api/images/upload', {
         method: 'POST',
         body: formData,
@@ -24,5 +43,9 @@ export async function uploadImage(formData: FormData): Promise<string> {
     }
 
     const data = await response.json();
-    return data.image.url;
+    return {
+        url: data.image.url,
+        width: data.image.width,
+        height: data.image.height,
+    };
 }
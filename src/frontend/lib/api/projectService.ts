@@ -31,9 +31,20 @@ export const getProjects = async (): Promise<Project[]> => {
 
 /**
  * Obtiene un proyecto por su slug.
+ * Envía la cookie de sesión: el backend solo devuelve las secciones premium
+ * a usuarios autenticados (los anónimos reciben locked_sections).
  */
 export const getProjectBySlug = async (slug: string): Promise<Project> => {
-    const res = await fetch(buildApiUrl(`/api/projects/${slug}`))
+    const res = await fetch(buildApiUrl(`/api/projects/${slug}`), { credentials: "include" })
+    if (!res.ok) throw new Error("Project not found")
+    return await res.json()
+}
+
+/**
+ * Obtiene un proyecto completo para el editor del panel (requiere sesión de administrador).
+ */
+export const getProjectForEdit = async (slug: string): Promise<Project> => {
+    const res = await fetchWithAuth(buildApiUrl(`/api/projects/${slug}/full`))
     if (!res.ok) throw new Error("Project not found")
     return await res.json()
 }
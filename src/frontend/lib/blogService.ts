@@ -88,7 +88,7 @@ export async function getArticles({
  */
 export async function getArticleBySlug(slug: string): Promise<Article | null> {
   try {
-    const response = await fetch(buildApiUrl(`/api/articles/slug/${slug}`));
+    const response = await fetch(buildApiUrl(`/api/articles/slug/${slug}?include=related`));
 
     if (!response.ok) {
       if (response.status === 404) {
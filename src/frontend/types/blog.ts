@@ -5,6 +5,8 @@
  * trabajar con artículos y otras entidades relacionadas con el blog.
  */
 
+import type { ResponsiveImage } from './project';
+
 /**
  * Representa un artículo del blog
  */
@@ -17,8 +19,14 @@ export interface Article {
   excerpt: string;
   image: string;
   image_alt?: string;
+  image_variants?: ResponsiveImage | null; // srcset de Cloudinary
   content: string;
+  content_html?: string; // HTML saneado con anclas en h2/h3
+  word_count?: number;
+  reading_time?: number;
+  toc?: { id: string; text: string; level: number }[];
   related?: string[];
+  related_articles?: Article[]; // con ?include=related
   meta_description?: string;
   meta_keywords?: string;
   created_at: string;
@@ -34,6 +42,8 @@ export interface ArticleInput {
   content: string;
   image: string;
   image_alt?: string;
+  image_width?: number; // Dimensiones de la subida (variantes responsive)
+  image_height?: number;
   related?: string[];
   meta_description?: string;
   meta_keywords?: string;
@@ -72,6 +82,8 @@ export interface ArticleUpdateData {
   content?: string;
   image?: string;
   image_alt?: string;
+  image_width?: number;
+  image_height?: number;
   related?: string[];
   meta_description?: string;
   meta_keywords?: string;
@@ -85,5 +97,7 @@ export interface ArticleFormData {
   excerpt: string;
   content: string;
   image: string;
+  image_width?: number;
+  image_height?: number;
   related: string[];
 }
\ No newline at end of file
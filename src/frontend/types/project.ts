@@ -1,4 +1,19 @@
-export interface GalleryImage {
+export interface ImageVariant {
+    width: number
+    url: string
+}
+
+/**
+ * Variantes responsive de Cloudinary calculadas por el backend al guardar
+ */
+export interface ResponsiveImage {
+    width?: number | null
+    height?: number | null
+    aspect_ratio?: number | null
+    srcset?: ImageVariant[]
+}
+
+export interface GalleryImage extends ResponsiveImage {
     id: number
     type: string
     category: 'before' | 'after'
@@ -19,6 +34,7 @@ export interface Project {
     featured?: boolean
     priority?: number
     free_sections_count?: number
+    locked_sections?: number // secciones premium no incluidas (visitantes anónimos)
     main_image_url?: string
     gallery?: GalleryImage[]
     investment_data?: {